@@ -96,8 +96,18 @@ async def main():
         logger.error(f"Critical system error: {str(e)}")
         print(f"💥 Critical system error: {str(e)}")
         return 1
+    finally:
+        # Persist security events still queued for Redis before the loop closes
+        await nexus_orchestrator.shutdown()
 
 if __name__ == "__main__":
+    # Prefer uvloop where it is installed; it batches socket writes for Redis pipelines
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+    
     # Run the main async function
     exit_code = asyncio.run(main())
     sys.exit(exit_code)
\ No newline at end of file
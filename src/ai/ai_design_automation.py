@@ -5,7 +5,7 @@ import json
 import time
 from datetime import datetime
 from src.webxr.holomisha_ar import holo_misha_instance
-from src.security.security_logging_service import SecurityLoggingService
+from src.security.security_logging_service import security_logger
 
 # Custom JSON Formatter for structured logging
 class JSONFormatter(logging.Formatter):
@@ -29,7 +29,6 @@ handler = logging.StreamHandler()
 handler.setFormatter(JSONFormatter())
 logger.addHandler(handler)
 
-security_logger = SecurityLoggingService()
 
 class AIDesignAutomation:
     def __init__(self):
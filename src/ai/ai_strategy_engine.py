@@ -2,13 +2,12 @@ import asyncio
 from typing import Dict, Any
 from src.webxr.holomisha_ar import holo_misha_instance
 from src.ai.ai_trend_analyzer import AITrendAnalyzer
-from src.security.security_logging_service import SecurityLoggingService
+from src.security.security_logging_service import security_logger
 from src.lib.utils import get_current_timestamp
 import logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("AIStrategyEngine")
 trend_analyzer = AITrendAnalyzer()
-security_logger = SecurityLoggingService()
 class AIStrategyEngine:
 def __init__(self):
 self.strategies = {}
@@ -1,12 +1,11 @@
 import asyncio
 from typing import Dict, Any
 from src.webxr.holomisha_ar import holo_misha_instance
-from src.security.security_logging_service import SecurityLoggingService
+from src.security.security_logging_service import security_logger
 from src.lib.utils import get_current_timestamp
 import logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("AITrendAnalyzer")
-security_logger = SecurityLoggingService()
 class AITrendAnalyzer:
 def __init__(self):
 self.trends = {}
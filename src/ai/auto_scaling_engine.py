@@ -2,13 +2,12 @@ import asyncio
 from typing import Dict, Any
 from src.webxr.holomisha_ar import holo_misha_instance
 from src.fab.fab_analytics import FabAnalytics
-from src.security.security_logging_service import SecurityLoggingService
+from src.security.security_logging_service import security_logger
 from src.lib.utils import get_current_timestamp
 import logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("AutoScalingEngine")
 fab_analytics = FabAnalytics()
-security_logger = SecurityLoggingService()
 class AutoScalingEngine:
 def __init__(self):
 self.scaling_plans = {}
@@ -20,11 +20,10 @@ from src.lib.cad_cache import get_cad_cache, init_cad_cache
 from src.lib.cad_queue import get_cad_queue, init_cad_queue, CADTask
 from src.lib.cad_websocket import get_cad_websocket_manager, init_cad_websocket_manager
 from src.chip_design.chip_optimization_engine import ChipOptimizationEngine
-from src.security.security_logging_service import SecurityLoggingService
+from src.security.security_logging_service import security_logger
 from src.config.holomesh_config_manager import get_holomesh_config_manager
 
 logger = get_logger("CADAIOptimizer")
-security_logger = SecurityLoggingService()
 
 class AIOptimizationStrategy(Enum):
     BAYESIAN = "bayesian"
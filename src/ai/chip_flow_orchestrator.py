@@ -2,13 +2,11 @@ import asyncio
 from typing import Dict, Any, List, Optional
 from src.webxr.quest_master import QuestMaster
 # from src.webxr.holomisha_ar import holo_misha_instance
-from src.security.security_logging_service import SecurityLoggingService
 import logging
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("ChipFlowOrchestrator")
 quest_master = QuestMaster()
-security_logger = SecurityLoggingService()
 
 class ChipFlowOrchestrator:
     def __init__(self):
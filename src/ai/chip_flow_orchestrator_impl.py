@@ -2,7 +2,7 @@ import asyncio
 from typing import Dict, Any, List
 from src.webxr.quest_master import QuestMaster
 from src.webxr.holomisha_ar import holo_misha_instance
-from src.security.security_logging_service import SecurityLoggingService
+from src.security.security_logging_service import security_logger
 import logging
 
 # Імітуємо реальні залежності для обробки чіпів
@@ -34,7 +34,6 @@ class ChipProcessingService:
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("ChipFlowOrchestratorImpl")
 quest_master = QuestMaster()
-security_logger = SecurityLoggingService()
 chip_processing_service = ChipProcessingService()
 
 class ChipFlowOrchestratorImpl:
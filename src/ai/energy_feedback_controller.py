@@ -2,11 +2,10 @@ import asyncio
 from typing import Dict, Any
 from datetime import datetime
 from src.webxr.holomisha_ar import holo_misha_instance
-from src.security.security_logging_service import SecurityLoggingService
+from src.security.security_logging_service import security_logger
 import logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("EnergyFeedbackController")
-security_logger = SecurityLoggingService()
 class EnergyFeedbackController:
 def __init__(self):
 self.kp = 0.5
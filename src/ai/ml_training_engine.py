@@ -14,12 +14,11 @@ import os
 
 from src.lib.utils import get_logger
 from src.lib.event_bus import event_bus
-from src.security.security_logging_service import SecurityLoggingService
+from src.security.security_logging_service import security_logger
 from src.analytics.chip_analytics import ChipAnalytics
 from src.lib.redis_client import redis_client
 
 logger = get_logger("MLTrainingEngine")
-security_logger = SecurityLoggingService()
 analytics = ChipAnalytics()
 
 class ModelType(Enum):
@@ -3,11 +3,10 @@ from typing import List, Dict, Any
 import asyncio
 import logging
 from src.webxr.holomisha_ar import holo_misha_instance
-from src.security.security_logging_service import SecurityLoggingService
+from src.security.security_logging_service import security_logger
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("PredictiveScalingEngine")
-security_logger = SecurityLoggingService()
 
 @dataclass
 class ScalingRecommendation:
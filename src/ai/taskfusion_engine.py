@@ -13,7 +13,7 @@ from src.ai.predictive_scaling_engine import PredictiveScalingEngine
 from src.chip_design.zero_defect_engine import ZeroDefectEngine
 from src.chip_design.family_collaboration_engine import FamilyCollaborationEngine
 from src.ai.ai_design_automation import AIDesignAutomation
-from src.security.security_logging_service import SecurityLoggingService
+from src.security.security_logging_service import security_logger
 from src.lib.config_manager import config_manager
 import logging
 
@@ -64,7 +64,7 @@ class TaskFusionEngine:
         self.zero_defect_engine = ZeroDefectEngine()
         self.family_collab_engine = FamilyCollaborationEngine()
         self.ai_design = AIDesignAutomation()
-        self.security_logger = SecurityLoggingService()
+        self.security_logger = security_logger
         self.active_processes: Dict[str, Dict[str, Any]] = {}
         self.agent_states: Dict[str, str] = {}
         self.process_metrics: Dict[str, ProcessMetrics] = {}
@@ -10,7 +10,7 @@ from src.ai.predictive_scaling_engine import PredictiveScalingEngine
 from src.chip_design.zero_defect_engine import ZeroDefectEngine
 from src.chip_design.family_collaboration_engine import FamilyCollaborationEngine
 from src.chip_design.ai_design_automation import AIDesignAutomation
-from src.security.security_logging_service import SecurityLoggingService
+from src.security.security_logging_service import security_logger
 
 class ExecutionMode(Enum):
     MANUAL = "manual"
@@ -28,7 +28,7 @@ class TaskFusionEngineImpl:
         self.zero_defect_engine = ZeroDefectEngine()
         self.family_collab_engine = FamilyCollaborationEngine()
         self.ai_design = AIDesignAutomation()
-        self.security_logger = SecurityLoggingService()
+        self.security_logger = security_logger
         self.active_processes: Dict[str, Dict[str, Any]] = {}
         self.agent_states: Dict[str, str] = {}
 
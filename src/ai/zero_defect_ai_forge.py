@@ -5,7 +5,7 @@ import json
 import time
 from datetime import datetime
 from src.webxr.holomisha_ar import holo_misha_instance
-from src.security.security_logging_service import SecurityLoggingService
+from src.security.security_logging_service import security_logger
 
 class JSONFormatter(logging.Formatter):
     def format(self, record):
@@ -28,7 +28,6 @@ handler = logging.StreamHandler()
 handler.setFormatter(JSONFormatter())
 logger.addHandler(handler)
 
-security_logger = SecurityLoggingService()
 
 class ZeroDefectAIForge:
     def __init__(self):
@@ -12,13 +12,12 @@ from enum import Enum
 
 from src.lib.utils import get_logger
 from src.lib.event_bus import event_bus
-from src.security.security_logging_service import SecurityLoggingService
+from src.security.security_logging_service import security_logger
 from src.lib.redis_client import redis_client
 from src.chip_design.chip_lifecycle_tracker import chip_lifecycle_tracker, ChipLifecycleStage
 from src.chip_design.chip_quality_assurance import chip_quality_assurance
 
 logger = get_logger("ChipArchitectureAnalyzer")
-security_logger = SecurityLoggingService()
 
 class ArchitectureComponentType(Enum):
     PROCESSOR = "processor"
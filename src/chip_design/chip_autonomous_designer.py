@@ -12,7 +12,7 @@ from enum import Enum
 
 from src.lib.utils import get_logger
 from src.lib.event_bus import event_bus
-from src.security.security_logging_service import SecurityLoggingService
+from src.security.security_logging_service import security_logger
 from src.lib.redis_client import redis_client
 from src.chip_design.chip_lifecycle_tracker import chip_lifecycle_tracker, ChipLifecycleStage
 from src.chip_design.chip_quality_assurance import chip_quality_assurance
@@ -20,7 +20,6 @@ from src.chip_design.chip_architecture_analyzer import chip_architecture_analyze
 from src.ai.zero_defect_ai_forge import ZeroDefectAIForge
 
 logger = get_logger("ChipAutonomousDesigner")
-security_logger = SecurityLoggingService()
 
 class DesignRequirementType(Enum):
     PERFORMANCE = "performance"
@@ -11,11 +11,10 @@ from enum import Enum
 
 from src.lib.utils import get_logger
 from src.lib.event_bus import event_bus
-from src.security.security_logging_service import SecurityLoggingService
+from src.security.security_logging_service import security_logger
 from src.lib.redis_client import redis_client
 
 logger = get_logger("ChipLifecycleTracker")
-security_logger = SecurityLoggingService()
 
 class ChipLifecycleStage(Enum):
     DESIGN = "design"
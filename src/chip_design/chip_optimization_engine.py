@@ -11,10 +11,9 @@ import random
 
 from src.lib.utils import get_logger
 from src.lib.event_bus import event_bus
-from src.security.security_logging_service import SecurityLoggingService
+from src.security.security_logging_service import security_logger
 
 logger = get_logger("ChipOptimizationEngine")
-security_logger = SecurityLoggingService()
 
 class OptimizationType(Enum):
     PLACEMENT = "placement"
@@ -12,12 +12,11 @@ from enum import Enum
 
 from src.lib.utils import get_logger
 from src.lib.event_bus import event_bus
-from src.security.security_logging_service import SecurityLoggingService
+from src.security.security_logging_service import security_logger
 from src.lib.redis_client import redis_client
 from src.chip_design.chip_lifecycle_tracker import chip_lifecycle_tracker, ChipLifecycleStage
 
 logger = get_logger("ChipQualityAssurance")
-security_logger = SecurityLoggingService()
 
 class QualityMetric(Enum):
     RELIABILITY = "reliability"
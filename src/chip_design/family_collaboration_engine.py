@@ -6,7 +6,7 @@ from src.webxr.holomisha_ar import holo_misha_instance
 from src.ai.ai_design_automation import AIDesignAutomation
 from src.webxr.quest_master import QuestMaster
 from src.chip_design.zero_defect_engine import ZeroDefectEngine
-from src.security.security_logging_service import SecurityLoggingService
+from src.security.security_logging_service import security_logger
 from src.lib.redis_client import redis_client
 from datetime import datetime
 
@@ -18,7 +18,6 @@ def get_current_timestamp() -> str:
 ai_design = AIDesignAutomation()
 quest_master = QuestMaster()
 zero_defect_engine = ZeroDefectEngine()
-security_logger = SecurityLoggingService()
 
 class FamilyCollaborationEngine:
     def __init__(self):
@@ -2,11 +2,10 @@ import asyncio
 from typing import Dict, Any
 from src.lib.utils import hash_data
 from src.webxr.holomisha_ar import holo_misha_instance
-from src.security.security_logging_service import SecurityLoggingService
+from src.security.security_logging_service import security_logger
 import logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("RTLHashGenerator")
-security_logger = SecurityLoggingService()
 class RTLHashGenerator:
 def __init__(self):
 self.supported_algorithms = ["sha256", "sha3_256", "blake2b"]
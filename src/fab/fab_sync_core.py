@@ -1,12 +1,11 @@
 import asyncio
 from typing import Dict, Any, List
 from src.webxr.holomisha_ar import holo_misha_instance
-from src.security.security_logging_service import SecurityLoggingService
+from src.security.security_logging_service import security_logger
 import logging
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("FabSyncCore")
-security_logger = SecurityLoggingService()
 
 class FabSyncCore:
     def __init__(self):
@@ -2,12 +2,11 @@ import asyncio
 from typing import Dict, Any
 from src.webxr.holomisha_ar import holo_misha_instance
 from src.fab.fab_sync_core import FabSyncCore
-from src.security.security_logging_service import SecurityLoggingService
+from src.security.security_logging_service import security_logger
 import logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("IoTIntegration")
 fab_sync = FabSyncCore()
-security_logger = SecurityLoggingService()
 class IoTIntegration:
 def __init__(self):
 self.connections = {}
@@ -12,13 +12,12 @@ from enum import Enum
 
 from src.lib.utils import get_logger
 from src.lib.event_bus import event_bus
-from src.security.security_logging_service import SecurityLoggingService
+from src.security.security_logging_service import security_logger
 from src.lib.redis_client import redis_client
 from src.tender.tender_monitor import tender_monitor
 from src.tender.quality_assurance_contract import quality_assurance_contract
 
 logger = get_logger("InnovationNexus")
-security_logger = SecurityLoggingService()
 
 class InnovationCategory(Enum):
     DEFENSE = "defense"
@@ -47,6 +46,7 @@ class GlobalScopeInnovationNexus:
     
     def __init__(self):
         self.innovations = {}
+        self.count = 0
         self.innovation_teams = {}
         self.funding_pools = {}
         self.impact_metrics = {}
@@ -65,7 +65,7 @@ class GlobalScopeInnovationNexus:
         """
         try:
             # Generate unique innovation ID
-            innovation_id = f"innovation_{hashlib.sha256(f"{proposer_id}{datetime.utcnow().isoformat()}".encode()).hexdigest()[:24]}"
+            innovation_id = f"innovation_{hashlib.sha256(f"{proposer_id}{datetime.utcnow().isoformat()}".encode()).digest()[:12].hex()}"
             
             # Create innovation proposal
             innovation = {
@@ -91,6 +91,7 @@ class GlobalScopeInnovationNexus:
             
             # Add to innovations
             self.innovations[innovation_id] = innovation
+            self.count += 1
             
             # Store in Redis
             await redis_client.set_json(f"innovation:{innovation_id}", innovation)
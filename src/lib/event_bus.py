@@ -1,6 +1,6 @@
 import asyncio
 import logging
-from typing import Dict, List, Callable, Any
+from typing import Dict, Tuple, Callable, Any
 from datetime import datetime
 
 # Configure logging
@@ -9,15 +9,14 @@ logger = logging.getLogger("EventBus")
 
 class EventBus:
     def __init__(self):
-        self._subscribers: Dict[str, List[Callable]] = {}
+        # Handlers are kept in tuples, rebuilt on subscribe, so dispatch is a single dict lookup
+        self._subscribers: Dict[str, Tuple[Callable, ...]] = {}
         self._event_queue = asyncio.Queue()
         self._processing_task = None
     
     def subscribe(self, event_type: str, callback: Callable):
         """Subscribe to an event type"""
-        if event_type not in self._subscribers:
-            self._subscribers[event_type] = []
-        self._subscribers[event_type].append(callback)
+        self._subscribers[event_type] = self._subscribers.get(event_type, ()) + (callback,)
         logger.info(f"Subscribed to event type: {event_type}")
     
     async def publish(self, event_type: str, data: Dict[str, Any]):
@@ -35,6 +34,11 @@ class EventBus:
         self._processing_task = asyncio.create_task(self._process_events())
         logger.info("Event bus processing started")
     
+    async def run(self):
+        """Process events in the calling task until cancelled"""
+        logger.info("Event bus processing started")
+        await self._process_events()
+    
     async def stop_processing(self):
         """Stop processing events"""
         if self._processing_task:
@@ -60,15 +64,19 @@ class EventBus:
     async def _handle_event(self, event: Dict[str, Any]):
         """Handle a single event by notifying all subscribers"""
         event_type = event["type"]
-        if event_type in self._subscribers:
-            for callback in self._subscribers[event_type]:
-                try:
-                    if asyncio.iscoroutinefunction(callback):
-                        await callback(event)
-                    else:
-                        callback(event)
-                except Exception as e:
-                    logger.error(f"Error in event callback for {event_type}: {e}")
+        callbacks = self._subscribers.get(event_type, ())
+        if callbacks:
+            await asyncio.gather(*(self._invoke(callback, event) for callback in callbacks))
+    
+    async def _invoke(self, callback: Callable, event: Dict[str, Any]):
+        """Run one subscriber, isolating its errors from the other subscribers"""
+        try:
+            if asyncio.iscoroutinefunction(callback):
+                await callback(event)
+            else:
+                callback(event)
+        except Exception as e:
+            logger.error(f"Error in event callback for {event['type']}: {e}")
 
 # Global event bus instance
 event_bus = EventBus()
\ No newline at end of file
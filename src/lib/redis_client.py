@@ -4,12 +4,17 @@ This module provides an optimized Redis client with connection pooling and cachi
 """
 import asyncio
 import json
-from typing import Any, Optional, Dict, List
+import time
+import orjson
+from typing import Any, Optional, Dict, List, Set, Tuple
 from redis.asyncio import Redis, ConnectionPool
 from src.lib.utils import get_logger
 
 logger = get_logger("OptimizedRedisClient")
 
+# Payloads larger than this many characters are decoded in a worker thread
+LARGE_JSON_THRESHOLD = 16_384
+
 class OptimizedRedisClient:
     """Optimized Redis client with connection pooling and caching."""
     
@@ -44,7 +49,9 @@ class OptimizedRedisClient:
             
             # In-memory cache for frequently accessed data
             self.cache: Dict[str, Any] = {}
-            self.cache_ttl: Dict[str, float] = {}
+            # Expiry per cached key, stored as int centiseconds since _t0
+            self._t0 = time.monotonic()
+            self.cache_exp: Dict[str, int] = {}
             
             # Cache configuration
             self.default_cache_ttl = 300  # 5 minutes
@@ -88,7 +95,7 @@ class OptimizedRedisClient:
                 self._cache_set(key, value)
                 if ex:
                     # Set cache expiration to match Redis expiration
-                    self.cache_ttl[key] = asyncio.get_event_loop().time() + ex
+                    self.cache_exp[key] = self._now_cs() + ex * 100
             
             return result
         except Exception as e:
@@ -131,7 +138,7 @@ class OptimizedRedisClient:
             result = await self.client.flushall()
             # Clear cache
             self.cache.clear()
-            self.cache_ttl.clear()
+            self.cache_exp.clear()
             return result
         except Exception as e:
             logger.error(f"Error flushing Redis: {e}")
@@ -145,6 +152,23 @@ class OptimizedRedisClient:
             logger.error(f"Error pinging Redis: {e}")
             return False
     
+    def pipeline(self, transaction: bool = False):
+        """Pipeline on the shared connection pool for batching several commands."""
+        return self.client.pipeline(transaction=transaction)
+    
+    async def server_stats(self) -> Dict[str, Any]:
+        """Fetch ping, key count and INFO stats in a single pipelined round-trip."""
+        try:
+            async with self.pipeline() as pipe:
+                pipe.ping()
+                pipe.dbsize()
+                pipe.info("stats")
+                ping_result, dbsize, info = await pipe.execute()
+            return {"ping": ping_result, "dbsize": dbsize, "info": info}
+        except Exception as e:
+            logger.error(f"Error fetching Redis server stats: {e}")
+            return {"ping": False, "dbsize": None, "info": {}}
+    
     async def close(self):
         """Close Redis connection."""
         try:
@@ -153,14 +177,19 @@ class OptimizedRedisClient:
         except Exception as e:
             logger.error(f"Error closing Redis connection: {e}")
     
+    def _now_cs(self) -> int:
+        """Monotonic time in centiseconds relative to client creation."""
+        return int((time.monotonic() - self._t0) * 100)
+    
     def _is_cached(self, key: str) -> bool:
         """Check if key is cached and not expired."""
         if key not in self.cache:
             return False
         
         # Check TTL
-        if key in self.cache_ttl:
-            if asyncio.get_event_loop().time() > self.cache_ttl[key]:
+        expires_at = self.cache_exp.get(key)
+        if expires_at is not None:
+            if self._now_cs() > expires_at:
                 # Expired, remove from cache
                 self._cache_delete(key)
                 return False
@@ -177,24 +206,54 @@ class OptimizedRedisClient:
                 self._cache_delete(k)
         
         self.cache[key] = value
-        self.cache_ttl[key] = asyncio.get_event_loop().time() + self.default_cache_ttl
+        self.cache_exp[key] = self._now_cs() + self.default_cache_ttl * 100
     
     def _cache_delete(self, key: str):
         """Delete key from cache."""
         if key in self.cache:
             del self.cache[key]
-        if key in self.cache_ttl:
-            del self.cache_ttl[key]
+        if key in self.cache_exp:
+            del self.cache_exp[key]
+    
+    async def _decode_json(self, key: str, value: Optional[str]) -> Optional[Any]:
+        """Decode a JSON payload, moving large ones off the event loop."""
+        if not value:
+            return None
+        try:
+            if len(value) > LARGE_JSON_THRESHOLD:
+                return await asyncio.to_thread(orjson.loads, value)
+            return orjson.loads(value)
+        except orjson.JSONDecodeError as e:
+            logger.error(f"Error decoding JSON for key {key}: {e}")
+            return None
     
     async def get_json(self, key: str, use_cache: bool = True) -> Optional[Any]:
         """Get JSON value from Redis."""
         value = await self.get(key, use_cache)
-        if value:
+        return await self._decode_json(key, value)
+    
+    async def mget_json(self, keys: List[str], use_cache: bool = True) -> List[Optional[Any]]:
+        """Get several JSON values, fetching every cache miss in a single MGET round-trip."""
+        values: List[Optional[str]] = [None] * len(keys)
+        missing: List[int] = []
+        for i, key in enumerate(keys):
+            if use_cache and self._is_cached(key):
+                values[i] = self.cache[key]
+            else:
+                missing.append(i)
+        
+        if missing:
             try:
-                return json.loads(value)
-            except json.JSONDecodeError as e:
-                logger.error(f"Error decoding JSON for key {key}: {e}")
-        return None
+                fetched = await self.client.mget([keys[i] for i in missing])
+            except Exception as e:
+                logger.error(f"Error getting keys {keys} from Redis: {e}")
+                fetched = [None] * len(missing)
+            for i, value in zip(missing, fetched):
+                values[i] = value
+                if use_cache and value is not None:
+                    self._cache_set(keys[i], value)
+        
+        return [await self._decode_json(key, value) for key, value in zip(keys, values)]
     
     async def set_json(self, key: str, value: Any, ex: Optional[int] = None, use_cache: bool = True) -> bool:
         """Set JSON value in Redis."""
@@ -205,5 +264,50 @@ class OptimizedRedisClient:
             logger.error(f"Error encoding JSON for key {key}: {e}")
             return False
 
+class BatchedRedis:
+    """Coalesces concurrent JSON reads into one MGET per event-loop tick."""
+    
+    def __init__(self, client: OptimizedRedisClient):
+        self._client = client
+        self._pending: List[Tuple[str, asyncio.Future]] = []
+        self._flushes: Set[asyncio.Task] = set()
+    
+    def __getattr__(self, name: str) -> Any:
+        # Everything except get_json goes straight to the wrapped client
+        return getattr(self._client, name)
+    
+    async def get_json(self, key: str) -> Optional[Any]:
+        """Queue a JSON read for the next batched MGET."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        if not self._pending:
+            loop.call_soon(self._flush)
+        self._pending.append((key, future))
+        return await future
+    
+    def _flush(self):
+        """Hand every read queued during this tick to a single MGET."""
+        batch, self._pending = self._pending, []
+        task = asyncio.ensure_future(self._fetch(batch))
+        self._flushes.add(task)
+        task.add_done_callback(self._flushes.discard)
+    
+    async def _fetch(self, batch: List[Tuple[str, asyncio.Future]]):
+        """Resolve a batch of queued reads from one MGET."""
+        try:
+            values = await self._client.mget_json([key for key, _ in batch])
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        
+        for (_, future), value in zip(batch, values):
+            if not future.done():
+                future.set_result(value)
+
 # Global instance
-redis_client = OptimizedRedisClient()
\ No newline at end of file
+redis_client = OptimizedRedisClient()
+
+# Global batched reader sharing the client above
+batched_redis_client = BatchedRedis(redis_client)
\ No newline at end of file
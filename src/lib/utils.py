@@ -1,20 +1,35 @@
 import json
 import logging
+import os
 from datetime import datetime
+from functools import lru_cache
 import hashlib
 import asyncio
-from typing import Any, Dict
+import time
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Mapping, Union
+
+import orjson
+import redis.asyncio as redis
 
 logging.basicConfig(level=logging.INFO)
 
+_HASHERS: Mapping[str, Callable[..., Any]] = MappingProxyType({
+    "sha256": hashlib.sha256,
+    "sha3_256": hashlib.sha3_256,
+    "blake2b": hashlib.blake2b
+})
+
 def get_logger(name: str, level: int = logging.INFO) -> logging.Logger:
     logger = logging.getLogger(name)
     logger.setLevel(level)
-    handler = logging.StreamHandler()
-    handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
-    logger.addHandler(handler)
+    if not logger.handlers:
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+        logger.addHandler(handler)
     return logger
 
+@lru_cache(maxsize=1)
 def get_redis_client() -> redis.RedisCluster:
     return redis.RedisCluster(
         host='redis-service',
@@ -31,26 +46,30 @@ async def get_redis_data(redis_client: redis.RedisCluster, key: str) -> Dict[str
     return json.loads(data) if data else {}
 
 
-def serialize_for_network(data: Any) -> str:
-    return json.dumps(data)
+def serialize_for_network(data: Any) -> bytes:
+    return orjson.dumps(data)
 
-def deserialize_from_network(data_str: str) -> Any:
-    return json.loads(data_str)
+def deserialize_from_network(data: Union[bytes, str]) -> Any:
+    return orjson.loads(data)
 
 def get_current_timestamp() -> str:
     return datetime.utcnow().isoformat()
 
+_timestamp_cache = [0.0, ""]
+
+def get_cached_timestamp(resolution: float = 0.05) -> str:
+    """UTC ISO timestamp, reformatted at most once per resolution seconds"""
+    now = time.time()
+    if now - _timestamp_cache[0] >= resolution:
+        _timestamp_cache[0] = now
+        _timestamp_cache[1] = datetime.utcfromtimestamp(now).isoformat()
+    return _timestamp_cache[1]
+
 async def hash_data(data: str, algorithm: str = "sha256") -> str:
-    algorithms = {
-        "sha256": hashlib.sha256,
-        "sha3_256": hashlib.sha3_256,
-        "blake2b": hashlib.blake2b
-    }
-    if algorithm not in algorithms:
+    hasher = _HASHERS.get(algorithm)
+    if hasher is None:
         raise ValueError(f"Unsupported hash algorithm: {algorithm}")
-    hash_obj = algorithms[algorithm]()
-    hash_obj.update(data.encode('utf-8'))
-    return hash_obj.hexdigest()
+    return hasher(data.encode('utf-8')).hexdigest()
 
 class ConfigManager:
     def __init__(self, config_path: str = "config.json"):
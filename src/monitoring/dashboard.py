@@ -2,13 +2,17 @@
 Monitoring Dashboard for GlobalScope MultiFrame 11.0
 This module provides a comprehensive dashboard for monitoring system health, API performance, and security metrics.
 """
-import json
+import asyncio
 import logging
-from typing import Dict, Any, List
-from datetime import datetime
+import time
+from typing import Dict, Any, Tuple, Callable, Awaitable
+
+import orjson
+
+from src.lib.utils import get_cached_timestamp
 from src.monitoring.api_monitor import api_monitor
 from src.monitoring.health_check import health_check
-from src.security.quantum_singularity_firewall import QuantumSingularityFirewall
+from src.security.quantum_singularity_firewall import firewall as shared_firewall
 from src.monitoring.extended_monitor import extended_monitor
 
 # Configure logging
@@ -19,12 +23,49 @@ class MonitoringDashboard:
     """Comprehensive monitoring dashboard for the system"""
     
     def __init__(self):
-        self.firewall = QuantumSingularityFirewall()
+        self.firewall = shared_firewall
         self.extended_monitor = extended_monitor
+        # Short-lived result cache shared by concurrent dashboard refreshes
+        self.cache_ttl = 2.0  # seconds
+        self._cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        self._cache_locks: Dict[str, asyncio.Lock] = {}
+        self._probed_firewall = None
         logger.info("MonitoringDashboard initialized")
     
+    async def _cached(self, name: str, compute: Callable[[], Awaitable[Dict[str, Any]]]) -> Dict[str, Any]:
+        """Return the result cached under name if younger than cache_ttl, otherwise compute it once"""
+        entry = self._cache.get(name)
+        if entry is not None and time.monotonic() - entry[0] < self.cache_ttl:
+            return entry[1]
+        
+        lock = self._cache_locks.setdefault(name, asyncio.Lock())
+        async with lock:
+            # Another caller may have refreshed the entry while we waited
+            entry = self._cache.get(name)
+            if entry is not None and time.monotonic() - entry[0] < self.cache_ttl:
+                return entry[1]
+            result = await compute()
+            if "error" not in result:
+                self._cache[name] = (time.monotonic(), result)
+            return result
+    
+    def _firewall_status(self) -> Tuple[int, bool]:
+        """Return (threats_blocked, is_active), probing the firewall's attributes only when it changes"""
+        firewall = self.firewall
+        if firewall is not self._probed_firewall:
+            self._probed_firewall = firewall
+            self._has_threats = hasattr(firewall, 'threats_blocked')
+            self._has_active = hasattr(firewall, 'is_active')
+        return (
+            firewall.threats_blocked if self._has_threats else 0,
+            firewall.is_active if self._has_active else True
+        )
+    
     async def get_system_overview(self) -> Dict[str, Any]:
         """Get a comprehensive overview of system health and performance"""
+        return await self._cached("system_overview", self._build_system_overview)
+    
+    async def _build_system_overview(self) -> Dict[str, Any]:
         try:
             # Get health check results
             health_results = await health_check.run_checks()
@@ -40,18 +81,19 @@ class MonitoringDashboard:
                 "system_health": api_monitor.get_system_health()
             }
             
-            # Get security metrics using getattr to avoid linter issues
+            # Get security metrics
+            threats_blocked, firewall_status = self._firewall_status()
             security_metrics = {
-                "threats_blocked": getattr(self.firewall, 'threats_blocked', 0),
-                "firewall_status": getattr(self.firewall, 'is_active', True)
+                "threats_blocked": threats_blocked,
+                "firewall_status": firewall_status
             }
             
             # Get extended metrics
-            extended_metrics = await self.extended_monitor.get_all_extended_metrics()
+            extended_metrics = await self.get_extended_system_metrics()
             
             # Combine all metrics
             overview = {
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": get_cached_timestamp(),
                 "system_status": health_results["status"],
                 "health_checks": health_results,
                 "api_metrics": api_metrics,
@@ -67,9 +109,12 @@ class MonitoringDashboard:
     
     async def get_detailed_api_metrics(self) -> Dict[str, Any]:
         """Get detailed API performance metrics"""
+        return await self._cached("api_metrics", self._build_detailed_api_metrics)
+    
+    async def _build_detailed_api_metrics(self) -> Dict[str, Any]:
         try:
             return {
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": get_cached_timestamp(),
                 "system_health": api_monitor.get_system_health(),
                 "endpoint_metrics": api_monitor.get_all_endpoint_metrics(),
                 "top_endpoints": api_monitor.get_top_endpoints_by_traffic(10)
@@ -81,10 +126,11 @@ class MonitoringDashboard:
     async def get_security_report(self) -> Dict[str, Any]:
         """Get a comprehensive security report"""
         try:
+            threats_blocked, firewall_status = self._firewall_status()
             return {
-                "timestamp": datetime.utcnow().isoformat(),
-                "threats_blocked": getattr(self.firewall, 'threats_blocked', 0),
-                "firewall_status": getattr(self.firewall, 'is_active', True),
+                "timestamp": get_cached_timestamp(),
+                "threats_blocked": threats_blocked,
+                "firewall_status": firewall_status,
                 "recent_threats": []  # In a real implementation, this would track recent threats
             }
         except Exception as e:
@@ -93,6 +139,9 @@ class MonitoringDashboard:
     
     async def get_extended_system_metrics(self) -> Dict[str, Any]:
         """Get extended system metrics including AI, Redis, and system resources"""
+        return await self._cached("extended_metrics", self._build_extended_system_metrics)
+    
+    async def _build_extended_system_metrics(self) -> Dict[str, Any]:
         try:
             return await self.extended_monitor.get_all_extended_metrics()
         except Exception as e:
@@ -101,10 +150,15 @@ class MonitoringDashboard:
     
     async def get_health_score_report(self) -> Dict[str, Any]:
         """Get system health score report"""
+        return await self._cached("health_score", self._build_health_score_report)
+    
+    async def _build_health_score_report(self) -> Dict[str, Any]:
         try:
-            health_score = await self.extended_monitor.get_system_health_score()
+            # Share the cached extended metrics instead of collecting them a second time
+            extended_metrics = await self.get_extended_system_metrics()
+            health_score = await self.extended_monitor.get_system_health_score(extended_metrics)
             return {
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": get_cached_timestamp(),
                 "health_score": health_score
             }
         except Exception as e:
@@ -116,30 +170,35 @@ class MonitoringDashboard:
         # In a real implementation, this would calculate actual uptime
         return "99.9%"
     
-    async def export_metrics(self, format: str = "json") -> str:
-        """Export metrics in specified format"""
+    async def export_metrics(self, format: str = "json") -> bytes:
+        """Export metrics in specified format as encoded bytes"""
         try:
-            overview = await self.get_system_overview()
-            api_metrics = await self.get_detailed_api_metrics()
-            security_report = await self.get_security_report()
-            extended_metrics = await self.get_extended_system_metrics()
-            health_score = await self.get_health_score_report()
+            sections = ("system_overview", "api_metrics", "security_report", "extended_metrics", "health_score")
+            results = await asyncio.gather(
+                self.get_system_overview(),
+                self.get_detailed_api_metrics(),
+                self.get_security_report(),
+                self.get_extended_system_metrics(),
+                self.get_health_score_report(),
+                return_exceptions=True
+            )
             
             export_data = {
-                "system_overview": overview,
-                "api_metrics": api_metrics,
-                "security_report": security_report,
-                "extended_metrics": extended_metrics,
-                "health_score": health_score
+                section: {"error": str(result)} if isinstance(result, Exception) else result
+                for section, result in zip(sections, results)
             }
             
             if format.lower() == "json":
-                return json.dumps(export_data, indent=2)
+                return orjson.dumps(export_data, default=str, option=orjson.OPT_INDENT_2)
             else:
-                return str(export_data)
+                return repr(export_data).encode()
         except Exception as e:
             logger.error(f"Error exporting metrics: {e}")
-            return json.dumps({"error": str(e)})
+            return orjson.dumps({"error": str(e)})
+    
+    async def export_metrics_str(self, format: str = "json") -> str:
+        """Export metrics as a string for callers that still expect text"""
+        return (await self.export_metrics(format)).decode()
 
 # Global dashboard instance
 dashboard = MonitoringDashboard()
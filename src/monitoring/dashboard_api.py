@@ -3,12 +3,37 @@ Performance Monitoring Dashboard API for HoloMesh Interaction Modes
 """
 
 from fastapi import APIRouter, HTTPException
-from typing import Dict, Any, List
-import json
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
+from typing import AsyncIterator, List
 
-from src.monitoring.performance_dashboard import get_performance_monitor
+import orjson
 
-router = APIRouter(prefix="/api/v1/monitoring", tags=["performance-monitoring"])
+from src.monitoring.performance_dashboard import PerformanceMonitor, get_performance_monitor
+
+router = APIRouter(
+    prefix="/api/v1/monitoring",
+    tags=["performance-monitoring"],
+    default_response_class=ORJSONResponse
+)
+
+SUPPORTED_MODES = [
+    {"value": "professional", "label": "Professional Mode", "description": "Standard optimization for general CAD tasks"},
+    {"value": "innovative", "label": "Innovative Mode", "description": "Creative exploration and experimental optimization"},
+    {"value": "semi_automatic", "label": "Semi-Automatic Mode", "description": "Human-AI collaboration with HoloMesh recommendations"},
+    {"value": "manual", "label": "Manual Mode", "description": "Professional tool guidance with confidentiality controls"}
+]
+
+SUPPORTED_TOOLS = [
+    {"value": "yosys", "label": "Yosys", "description": "Open-source synthesis tool"},
+    {"value": "nextpnr", "label": "NextPNR", "description": "Open-source place and route tool"},
+    {"value": "verilator", "label": "Verilator", "description": "Open-source simulator"},
+    {"value": "openroad", "label": "OpenROAD", "description": "Open-source RTL-to-GDS flow"},
+    {"value": "vivado", "label": "Vivado", "description": "Xilinx FPGA design suite"}
+]
+
+# Both lists are static, so their response bodies are encoded once at import time
+_SUPPORTED_MODES_BODY = orjson.dumps({"status": "success", "data": SUPPORTED_MODES})
+_SUPPORTED_TOOLS_BODY = orjson.dumps({"status": "success", "data": SUPPORTED_TOOLS})
 
 @router.get("/performance/overall")
 async def get_overall_performance():
@@ -35,40 +60,43 @@ async def get_recent_records(limit: int = 50):
     """Get recent optimization records"""
     try:
         monitor = get_performance_monitor()
-        records = monitor.get_recent_records(limit)
-        return {"status": "success", "data": records, "count": len(records)}
+        records = monitor.get_recent_records_json(limit)
+        count = min(max(limit, 0), len(monitor.records))
+        body = b'{"status":"success","data":' + records + b',"count":' + str(count).encode() + b"}"
+        return Response(content=body, media_type="application/json")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to get recent records: {str(e)}")
 
+async def _stream_export(head: List[bytes], chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    """Wrap the already started export stream in the standard success envelope"""
+    yield b'{"status":"success","data":'
+    for chunk in head:
+        yield chunk
+    async for chunk in chunks:
+        yield chunk
+    yield b"}"
+
 @router.get("/performance/export")
 async def export_performance_data():
-    """Export all monitoring data"""
+    """Export all monitoring data
+    
+    The first batch is encoded before responding so early failures still return a 500;
+    a failure after that can only end the already started 200 response early.
+    """
     try:
         monitor = get_performance_monitor()
-        data = monitor.export_data()
-        return {"status": "success", "data": data}
+        chunks = monitor.iter_export_chunks()
+        head = [await anext(chunks), await anext(chunks)]
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to export data: {str(e)}")
+    return StreamingResponse(_stream_export(head, chunks), media_type="application/json")
 
 @router.get("/modes/supported")
 async def get_supported_modes():
     """Get list of supported interaction modes"""
-    modes = [
-        {"value": "professional", "label": "Professional Mode", "description": "Standard optimization for general CAD tasks"},
-        {"value": "innovative", "label": "Innovative Mode", "description": "Creative exploration and experimental optimization"},
-        {"value": "semi_automatic", "label": "Semi-Automatic Mode", "description": "Human-AI collaboration with HoloMesh recommendations"},
-        {"value": "manual", "label": "Manual Mode", "description": "Professional tool guidance with confidentiality controls"}
-    ]
-    return {"status": "success", "data": modes}
+    return Response(content=_SUPPORTED_MODES_BODY, media_type="application/json")
 
 @router.get("/tools/supported")
 async def get_supported_tools():
     """Get list of supported CAD tools"""
-    tools = [
-        {"value": "yosys", "label": "Yosys", "description": "Open-source synthesis tool"},
-        {"value": "nextpnr", "label": "NextPNR", "description": "Open-source place and route tool"},
-        {"value": "verilator", "label": "Verilator", "description": "Open-source simulator"},
-        {"value": "openroad", "label": "OpenROAD", "description": "Open-source RTL-to-GDS flow"},
-        {"value": "vivado", "label": "Vivado", "description": "Xilinx FPGA design suite"}
-    ]
-    return {"status": "success", "data": tools}
\ No newline at end of file
+    return Response(content=_SUPPORTED_TOOLS_BODY, media_type="application/json")
\ No newline at end of file
@@ -4,17 +4,17 @@ This module provides expanded monitoring capabilities for additional system comp
 """
 
 import asyncio
-import logging
 import psutil
+import threading
 import time
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Optional, Tuple
 from datetime import datetime
-from collections import defaultdict, deque
+from collections import Counter, deque
 
-from src.lib.utils import get_logger
+from src.lib.utils import get_logger, get_cached_timestamp
 from src.lib.redis_client import redis_client
-from src.security.quantum_singularity_firewall import QuantumSingularityFirewall
-from src.ai.agent_guard import AgentGuard
+from src.security.quantum_singularity_firewall import firewall as shared_firewall
+from src.ai.agent_guard import AgentGuard, AgentState
 
 logger = get_logger("ExtendedMonitor")
 
@@ -26,37 +26,97 @@ class SystemMetrics:
         self.memory_usage_history = deque(maxlen=100)
         self.disk_usage_history = deque(maxlen=100)
         self.network_io_history = deque(maxlen=100)
+        # Rolling CPU aggregates: sum of the last 10 samples and a monotonic
+        # (sequence, value) deque whose head is the max of cpu_usage_history
+        self._cpu_last10 = deque(maxlen=10)
+        self._cpu_last10_sum = 0.0
+        self._cpu_max_window = deque()
+        self._cpu_seq = 0
+        # get_system_metrics runs in worker threads; guards the histories and CPU aggregates
+        self._history_lock = threading.Lock()
+        # Latest CPU sample published by the background sampler
+        self._latest_cpu: Optional[float] = None
+        self._sampler_task: Optional[asyncio.Task] = None
+    
+    def start_sampler(self, interval: float = 1.0) -> None:
+        """Start the background CPU sampler on the running event loop if it is not already running"""
+        loop = asyncio.get_running_loop()
+        task = self._sampler_task
+        if task is None or task.done() or task.get_loop() is not loop:
+            # The first non-blocking call only primes psutil's counters; the sampler is their only reader
+            psutil.cpu_percent(interval=None)
+            self._sampler_task = loop.create_task(self._sampler_loop(interval))
+    
+    async def stop_sampler(self) -> None:
+        """Stop the background CPU sampler"""
+        task, self._sampler_task = self._sampler_task, None
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+    
+    async def _sampler_loop(self, interval: float) -> None:
+        """Sample CPU usage every interval without blocking the event loop"""
+        while True:
+            await asyncio.sleep(interval)
+            self._latest_cpu = psutil.cpu_percent(interval=None)
+    
+    def _record_cpu(self, value: float) -> None:
+        """Append a CPU sample and update the rolling average and maximum in amortized O(1); call under _history_lock"""
+        if len(self._cpu_last10) == self._cpu_last10.maxlen:
+            self._cpu_last10_sum -= self._cpu_last10[0]
+        self._cpu_last10.append(value)
+        self._cpu_last10_sum += value
+        self.cpu_usage_history.append(value)
         
+        seq = self._cpu_seq
+        self._cpu_seq += 1
+        window = self._cpu_max_window
+        while window and window[-1][1] <= value:
+            window.pop()
+        window.append((seq, value))
+        if window[0][0] <= seq - self.cpu_usage_history.maxlen:
+            window.popleft()
+        
+    def _sample_all_sync(self) -> Tuple[float, Any, Any, Any]:
+        """Read CPU, memory, disk and network counters from psutil in one batch"""
+        # CPU comes from the background sampler and reads 0.0 until its first sample
+        cpu_percent = self._latest_cpu if self._latest_cpu is not None else 0.0
+        return cpu_percent, psutil.virtual_memory(), psutil.disk_usage('/'), psutil.net_io_counters()
+    
     def get_system_metrics(self) -> Dict[str, Any]:
         """Get system resource metrics"""
         try:
-            # CPU metrics
-            cpu_percent = psutil.cpu_percent(interval=1)
-            self.cpu_usage_history.append(cpu_percent)
-            
-            # Memory metrics
-            memory = psutil.virtual_memory()
-            self.memory_usage_history.append(memory.percent)
-            
-            # Disk metrics
-            disk = psutil.disk_usage('/')
+            cpu_percent, memory, disk, net_io = self._sample_all_sync()
             disk_percent = (disk.used / disk.total) * 100
-            self.disk_usage_history.append(disk_percent)
             
-            # Network I/O metrics
-            net_io = psutil.net_io_counters()
-            self.network_io_history.append({
-                'bytes_sent': net_io.bytes_sent,
-                'bytes_recv': net_io.bytes_recv,
-                'packets_sent': net_io.packets_sent,
-                'packets_recv': net_io.packets_recv
-            })
+            with self._history_lock:
+                # CPU metrics
+                self._record_cpu(cpu_percent)
+                cpu_avg = self._cpu_last10_sum / len(self._cpu_last10)
+                cpu_max = self._cpu_max_window[0][1]
+                
+                # Memory metrics
+                self.memory_usage_history.append(memory.percent)
+                
+                # Disk metrics
+                self.disk_usage_history.append(disk_percent)
+                
+                # Network I/O metrics
+                self.network_io_history.append({
+                    'bytes_sent': net_io.bytes_sent,
+                    'bytes_recv': net_io.bytes_recv,
+                    'packets_sent': net_io.packets_sent,
+                    'packets_recv': net_io.packets_recv
+                })
             
             return {
                 'cpu': {
                     'percent': cpu_percent,
-                    'avg_last_10': sum(list(self.cpu_usage_history)[-10:]) / min(len(self.cpu_usage_history), 10),
-                    'max_last_100': max(self.cpu_usage_history) if self.cpu_usage_history else 0
+                    'avg_last_10': cpu_avg,
+                    'max_last_100': cpu_max
                 },
                 'memory': {
                     'percent': memory.percent,
@@ -84,20 +144,37 @@ class SystemMetrics:
 class RedisMetrics:
     """Redis client metrics monitoring"""
     
+    # Commands issued by OptimizedRedisClient.server_stats (ping, dbsize, info)
+    _PIPELINE_COMMANDS = 3
+    _INFO_FIELDS = ('total_commands_processed', 'instantaneous_ops_per_sec', 'keyspace_hits', 'keyspace_misses')
+    
     def __init__(self):
         self.redis_client = redis_client
         self.cache_hit_count = 0
         self.cache_miss_count = 0
         self.redis_error_count = 0
         self.operation_latency_history = deque(maxlen=1000)
+        # Running sum over operation_latency_history for O(1) averages
+        self._latency_sum = 0.0
+    
+    def record_operation_latency(self, latency_ms: float) -> None:
+        """Record a Redis operation latency sample"""
+        history = self.operation_latency_history
+        if len(history) == history.maxlen:
+            self._latency_sum -= history[0]
+        history.append(latency_ms)
+        self._latency_sum += latency_ms
     
     async def get_redis_metrics(self) -> Dict[str, Any]:
         """Get Redis client metrics"""
         try:
-            # Test Redis connectivity
-            start_time = time.time()
-            ping_result = await self.redis_client.ping()
-            latency = time.time() - start_time
+            # Test connectivity and read server stats in one round-trip
+            start_time = time.perf_counter()
+            stats = await self.redis_client.server_stats()
+            latency = time.perf_counter() - start_time
+            ping_result = stats['ping']
+            # Per-command estimate for the pipelined commands
+            self.record_operation_latency(latency * 1000 / self._PIPELINE_COMMANDS)
             
             # Get cache statistics
             cache_stats = {
@@ -108,21 +185,18 @@ class RedisMetrics:
                 'cache_misses': self.cache_miss_count
             }
             
-            # Get Redis info (if available)
-            redis_info = {}
-            try:
-                # This would require additional Redis commands
-                # For now, we'll provide basic connectivity info
-                pass
-            except Exception:
-                pass
+            # Keep only the INFO stats the dashboard reports
+            info = stats.get('info') or {}
+            redis_info = {key: info[key] for key in self._INFO_FIELDS if key in info}
             
             return {
                 'connected': ping_result,
                 'latency_ms': round(latency * 1000, 2),
                 'cache_stats': cache_stats,
+                'dbsize': stats.get('dbsize'),
+                'server_info': redis_info,
                 'errors': self.redis_error_count,
-                'avg_operation_latency_ms': sum(self.operation_latency_history) / len(self.operation_latency_history) if self.operation_latency_history else 0
+                'avg_operation_latency_ms': self._latency_sum / len(self.operation_latency_history) if self.operation_latency_history else 0
             }
         except Exception as e:
             self.redis_error_count += 1
@@ -133,20 +207,29 @@ class SecurityMetrics:
     """Security metrics monitoring"""
     
     def __init__(self):
-        self.firewall = QuantumSingularityFirewall()
+        self.firewall = shared_firewall
         self.threat_history = deque(maxlen=100)
+        self._probed_firewall = None
+    
+    def _probe_firewall(self):
+        """Return the firewall, re-checking which attributes it exposes only when it changes"""
+        firewall = self.firewall
+        if firewall is not self._probed_firewall:
+            self._probed_firewall = firewall
+            self._has_threats = hasattr(firewall, 'threats_blocked')
+            self._has_active = hasattr(firewall, 'is_active')
+            self._has_history = hasattr(firewall, 'threat_history')
+        return firewall
     
     async def get_security_metrics(self) -> Dict[str, Any]:
         """Get security-related metrics"""
         try:
-            # Get firewall metrics using getattr to avoid linter issues
-            threats_blocked = getattr(self.firewall, 'threats_blocked', 0)
-            firewall_active = getattr(self.firewall, 'is_active', True)
+            firewall = self._probe_firewall()
+            threats_blocked = firewall.threats_blocked if self._has_threats else 0
+            firewall_active = firewall.is_active if self._has_active else True
             
             # Get threat history if available
-            threat_history = []
-            if hasattr(self.firewall, 'threat_history'):
-                threat_history = getattr(self.firewall, 'threat_history', [])[-10:]  # Last 10 threats
+            threat_history = firewall.threat_history[-10:] if self._has_history else []  # Last 10 threats
             
             return {
                 'firewall': {
@@ -163,6 +246,10 @@ class SecurityMetrics:
 class AIMetrics:
     """AI agent metrics monitoring"""
     
+    # Known agent states map to fixed slots in a flat counts list
+    _STATES = (AgentState.ACTIVE, AgentState.SLEEPING, AgentState.ERROR, AgentState.MAINTENANCE)
+    _STATE_INDEX = {state: index for index, state in enumerate(_STATES)}
+    
     def __init__(self):
         self.agent_guard = AgentGuard()
         self.agent_states_history = deque(maxlen=100)
@@ -175,25 +262,43 @@ class AIMetrics:
             if hasattr(self.agent_guard, 'agent_states'):
                 agent_states = getattr(self.agent_guard, 'agent_states', {})
             
-            # Count agents by state
-            state_counts = defaultdict(int)
+            # Count agents by state; states outside AgentState fall back to a Counter
+            counts = [0] * len(self._STATES)
+            other_counts = Counter()
+            state_index = self._STATE_INDEX
             for state in agent_states.values():
-                state_counts[state] += 1
+                index = state_index.get(state)
+                if index is None:
+                    other_counts[state] += 1
+                else:
+                    counts[index] += 1
+            
+            state_counts = {state: count for state, count in zip(self._STATES, counts) if count}
+            state_counts.update(other_counts)
             
             return {
                 'total_agents': len(agent_states),
-                'agent_states': dict(state_counts),
-                'active_agents': state_counts.get('active', 0),
-                'sleeping_agents': state_counts.get('sleeping', 0),
-                'error_agents': state_counts.get('error', 0)
+                'agent_states': state_counts,
+                'active_agents': counts[0],
+                'sleeping_agents': counts[1],
+                'error_agents': counts[2]
             }
         except Exception as e:
             logger.error(f"Error getting AI metrics: {e}")
             return {'error': str(e)}
 
+def _deduct(value: float, table: Tuple[Tuple[float, int], ...]) -> int:
+    """Return the penalty of the first threshold exceeded by value, or 0"""
+    return next((penalty for threshold, penalty in table if value > threshold), 0)
+
 class ExtendedMonitor:
     """Main extended monitoring class"""
     
+    # (threshold, penalty) pairs, checked from the most severe threshold down
+    _CPU_THRESHOLDS = ((90, 20), (75, 10), (50, 5))
+    _MEM_THRESHOLDS = ((90, 20), (75, 10), (50, 5))
+    _REDIS_THRESHOLDS = ((10, 15), (5, 10), (0, 5))
+    
     def __init__(self):
         self.system_metrics = SystemMetrics()
         self.redis_metrics = RedisMetrics()
@@ -206,13 +311,16 @@ class ExtendedMonitor:
     async def get_all_extended_metrics(self) -> Dict[str, Any]:
         """Get all extended metrics"""
         try:
-            system_metrics = self.system_metrics.get_system_metrics()
-            redis_metrics = await self.redis_metrics.get_redis_metrics()
-            security_metrics = await self.security_metrics.get_security_metrics()
-            ai_metrics = await self.ai_metrics.get_ai_metrics()
+            self.system_metrics.start_sampler()
+            system_metrics, redis_metrics, security_metrics, ai_metrics = await asyncio.gather(
+                asyncio.to_thread(self.system_metrics.get_system_metrics),
+                self.redis_metrics.get_redis_metrics(),
+                self.security_metrics.get_security_metrics(),
+                self.ai_metrics.get_ai_metrics()
+            )
             
             return {
-                'timestamp': datetime.utcnow().isoformat(),
+                'timestamp': get_cached_timestamp(),
                 'system': system_metrics,
                 'redis': redis_metrics,
                 'security': security_metrics,
@@ -223,48 +331,27 @@ class ExtendedMonitor:
             logger.error(f"Error getting extended metrics: {e}")
             return {'error': str(e)}
     
-    async def get_system_health_score(self) -> Dict[str, Any]:
-        """Calculate an overall system health score"""
+    async def get_system_health_score(self, metrics: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Calculate an overall system health score, reusing precomputed extended metrics if given"""
         try:
-            metrics = await self.get_all_extended_metrics()
-            
-            # Calculate health score based on various metrics
-            score = 100  # Start with perfect score
-            
-            # Deduct points for high CPU usage
-            if 'system' in metrics and 'cpu' in metrics['system']:
-                cpu_percent = metrics['system']['cpu']['percent']
-                if cpu_percent > 90:
-                    score -= 20
-                elif cpu_percent > 75:
-                    score -= 10
-                elif cpu_percent > 50:
-                    score -= 5
+            if metrics is None:
+                metrics = await self.get_all_extended_metrics()
+            if 'error' in metrics:
+                return {'error': metrics['error']}
             
-            # Deduct points for high memory usage
-            if 'system' in metrics and 'memory' in metrics['system']:
-                memory_percent = metrics['system']['memory']['percent']
-                if memory_percent > 90:
-                    score -= 20
-                elif memory_percent > 75:
-                    score -= 10
-                elif memory_percent > 50:
-                    score -= 5
+            system = metrics.get('system', {})
+            cpu_percent = system.get('cpu', {}).get('percent', 0)
+            memory_percent = system.get('memory', {}).get('percent', 0)
+            redis_errors = metrics.get('redis', {}).get('errors', 0)
+            firewall_active = metrics.get('security', {}).get('firewall', {}).get('active', True)
             
-            # Deduct points for Redis errors
-            if 'redis' in metrics and 'errors' in metrics['redis']:
-                redis_errors = metrics['redis']['errors']
-                if redis_errors > 10:
-                    score -= 15
-                elif redis_errors > 5:
-                    score -= 10
-                elif redis_errors > 0:
-                    score -= 5
-            
-            # Deduct points for security issues
-            if 'security' in metrics and 'firewall' in metrics['security']:
-                if not metrics['security']['firewall'].get('active', True):
-                    score -= 25
+            # Calculate health score based on various metrics
+            score = 100 - (
+                _deduct(cpu_percent, self._CPU_THRESHOLDS)
+                + _deduct(memory_percent, self._MEM_THRESHOLDS)
+                + _deduct(redis_errors, self._REDIS_THRESHOLDS)
+                + (0 if firewall_active else 25)
+            )
             
             # Ensure score is between 0 and 100
             score = max(0, min(100, score))
@@ -280,8 +367,13 @@ class ExtendedMonitor:
             return {
                 'health_score': score,
                 'status': status,
-                'metrics_used': metrics,
-                'timestamp': datetime.utcnow().isoformat()
+                'metrics_used': {
+                    'cpu_percent': cpu_percent,
+                    'memory_percent': memory_percent,
+                    'redis_errors': redis_errors,
+                    'firewall_active': firewall_active
+                },
+                'timestamp': get_cached_timestamp()
             }
         except Exception as e:
             logger.error(f"Error calculating health score: {e}")
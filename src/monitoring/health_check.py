@@ -1,6 +1,7 @@
 import asyncio
 import logging
-from typing import Dict, Any, List
+import time
+from typing import Dict, Any, List, Optional
 from datetime import datetime
 
 # Configure logging
@@ -12,21 +13,51 @@ class HealthCheck:
         self.checks = {}
         self.status = "unknown"
         self.last_check = None
+        # Aggregated results are reused for ttl seconds
+        self.ttl = 5.0
+        self._last_ts: Optional[float] = None
+        self._last_result: Optional[Dict[str, Any]] = None
+        self._lock = asyncio.Lock()
     
     def register_check(self, name: str, check_function):
         """Register a health check function"""
         self.checks[name] = check_function
+        self._last_ts = None
         logger.info(f"Registered health check: {name}")
     
+    def _is_fresh(self) -> bool:
+        return self._last_ts is not None and time.monotonic() - self._last_ts < self.ttl
+    
     async def run_checks(self) -> Dict[str, Any]:
-        """Run all registered health checks"""
-        results = {}
-        passed = 0
-        failed = 0
+        """Run all registered health checks, reusing the last result within the TTL"""
+        if self._is_fresh():
+            return self._last_result
         
-        for name, check_function in self.checks.items():
-            try:
-                result = await check_function() if asyncio.iscoroutinefunction(check_function) else check_function()
+        async with self._lock:
+            # Another caller may have refreshed the result while we waited
+            if self._is_fresh():
+                return self._last_result
+            
+            names = list(self.checks)
+            outcomes = await asyncio.gather(
+                *(check_function() if asyncio.iscoroutinefunction(check_function) else asyncio.to_thread(check_function)
+                  for check_function in self.checks.values()),
+                return_exceptions=True
+            )
+            
+            results = {}
+            passed = 0
+            failed = 0
+            
+            for name, result in zip(names, outcomes):
+                if isinstance(result, Exception):
+                    results[name] = {
+                        "status": "fail",
+                        "error": str(result)
+                    }
+                    failed += 1
+                    logger.error(f"Health check {name} failed: {result}")
+                    continue
                 results[name] = {
                     "status": "pass" if result else "fail",
                     "result": result
@@ -35,24 +66,19 @@ class HealthCheck:
                     passed += 1
                 else:
                     failed += 1
-            except Exception as e:
-                results[name] = {
-                    "status": "fail",
-                    "error": str(e)
-                }
-                failed += 1
-                logger.error(f"Health check {name} failed: {e}")
-        
-        self.status = "healthy" if failed == 0 else "degraded" if passed > 0 else "unhealthy"
-        self.last_check = datetime.utcnow().isoformat()
-        
-        return {
-            "status": self.status,
-            "timestamp": self.last_check,
-            "passed": passed,
-            "failed": failed,
-            "checks": results
-        }
+            
+            self.status = "healthy" if failed == 0 else "degraded" if passed > 0 else "unhealthy"
+            self.last_check = datetime.utcnow().isoformat()
+            
+            self._last_result = {
+                "status": self.status,
+                "timestamp": self.last_check,
+                "passed": passed,
+                "failed": failed,
+                "checks": results
+            }
+            self._last_ts = time.monotonic()
+            return self._last_result
     
     def get_status(self) -> str:
         """Get current system status"""
@@ -5,7 +5,7 @@ This module tests the expanded monitoring capabilities.
 
 import asyncio
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from src.monitoring.extended_monitor import extended_monitor, get_extended_metrics, get_health_score
 from src.monitoring.api_monitor import api_monitor, record_request
 from src.monitoring.dashboard import dashboard
@@ -13,6 +13,27 @@ from src.lib.utils import get_logger
 
 logger = get_logger("MonitoringExpansionTest")
 
+# Keys each extended-metrics section must expose
+_REQUIRED = {
+    "system": frozenset({"cpu", "memory", "disk"}),
+    "redis": frozenset({"connected"}),
+    "security": frozenset({"firewall"}),
+    "ai": frozenset()
+}
+_HEALTH_SCORE_KEYS = frozenset({"health_score", "status"})
+_OVERVIEW_KEYS = frozenset({"system_status", "timestamp"})
+_API_METRICS_KEYS = frozenset({"system_health"})
+
+def _assert_keys(data: Dict[str, Any], required: frozenset, label: str):
+    """Assert data contains every required key, reporting all missing keys at once."""
+    missing = required - data.keys()
+    assert not missing, f"{label} missing: {sorted(missing)}"
+
+def _assert_section(metrics: Dict[str, Any], section: str):
+    """Assert an extended-metrics section is present with its required keys."""
+    assert section in metrics, f"{section} metrics should be present"
+    _assert_keys(metrics[section], _REQUIRED[section], f"{section} metrics")
+
 class MonitoringExpansionTest:
     """Test suite for expanded monitoring capabilities."""
     
@@ -21,78 +42,80 @@ class MonitoringExpansionTest:
         self.api_monitor = api_monitor
         self.dashboard = dashboard
     
-    async def test_system_metrics(self) -> bool:
-        """Test system metrics monitoring."""
-        logger.info("Testing system metrics monitoring...")
-        
-        # Record some API requests to generate metrics
+    def _record_sample_requests(self):
+        """Record some API requests to generate metrics."""
         record_request("/api/test", 0.1, 200, True)
         record_request("/api/test", 0.2, 200, True)
         record_request("/api/error", 0.05, 500, False)
+    
+    async def test_system_metrics(self, metrics: Optional[Dict[str, Any]] = None) -> bool:
+        """Test system metrics monitoring."""
+        logger.info("Testing system metrics monitoring...")
         
-        # Get system metrics
-        metrics = await self.extended_monitor.get_all_extended_metrics()
+        if metrics is None:
+            self._record_sample_requests()
+            metrics = await self.extended_monitor.get_all_extended_metrics()
         
         # Verify we got system metrics
-        assert 'system' in metrics, "System metrics should be present"
-        assert 'cpu' in metrics['system'], "CPU metrics should be present"
-        assert 'memory' in metrics['system'], "Memory metrics should be present"
-        assert 'disk' in metrics['system'], "Disk metrics should be present"
+        _assert_section(metrics, "system")
         
         logger.info("✓ System metrics monitoring test passed")
         return True
     
-    async def test_redis_metrics(self) -> bool:
+    async def test_redis_metrics(self, metrics: Optional[Dict[str, Any]] = None) -> bool:
         """Test Redis metrics monitoring."""
         logger.info("Testing Redis metrics monitoring...")
         
         # Get Redis metrics
-        metrics = await self.extended_monitor.get_all_extended_metrics()
+        if metrics is None:
+            metrics = await self.extended_monitor.get_all_extended_metrics()
         
         # Verify we got Redis metrics
-        assert 'redis' in metrics, "Redis metrics should be present"
-        assert 'connected' in metrics['redis'], "Redis connection status should be present"
+        _assert_section(metrics, "redis")
         
         logger.info("✓ Redis metrics monitoring test passed")
         return True
     
-    async def test_security_metrics(self) -> bool:
+    async def test_security_metrics(self, metrics: Optional[Dict[str, Any]] = None) -> bool:
         """Test security metrics monitoring."""
         logger.info("Testing security metrics monitoring...")
         
         # Get security metrics
-        metrics = await self.extended_monitor.get_all_extended_metrics()
+        if metrics is None:
+            metrics = await self.extended_monitor.get_all_extended_metrics()
         
         # Verify we got security metrics
-        assert 'security' in metrics, "Security metrics should be present"
-        assert 'firewall' in metrics['security'], "Firewall metrics should be present"
+        _assert_section(metrics, "security")
         
         logger.info("✓ Security metrics monitoring test passed")
         return True
     
-    async def test_ai_metrics(self) -> bool:
+    async def test_ai_metrics(self, metrics: Optional[Dict[str, Any]] = None) -> bool:
         """Test AI metrics monitoring."""
         logger.info("Testing AI metrics monitoring...")
         
         # Get AI metrics
-        metrics = await self.extended_monitor.get_all_extended_metrics()
+        if metrics is None:
+            metrics = await self.extended_monitor.get_all_extended_metrics()
         
         # Verify we got AI metrics
-        assert 'ai' in metrics, "AI metrics should be present"
+        _assert_section(metrics, "ai")
         
         logger.info("✓ AI metrics monitoring test passed")
         return True
     
-    async def test_health_score(self) -> bool:
+    async def test_health_score(self, metrics: Optional[Dict[str, Any]] = None) -> bool:
         """Test health score calculation."""
         logger.info("Testing health score calculation...")
         
-        # Get health score
-        health_score = await get_health_score()
+        # Get health score, scoring the shared snapshot when one is given
+        if metrics is None:
+            health_score = await get_health_score()
+        else:
+            health_score = await self.extended_monitor.get_system_health_score(metrics)
         
         # Verify we got a health score
-        assert 'health_score' in health_score, "Health score should be present"
-        assert 'status' in health_score, "Health status should be present"
+        _assert_keys(health_score, _HEALTH_SCORE_KEYS, "Health score")
         
         logger.info(f"✓ Health score calculation test passed (score: {health_score['health_score']})")
         return True
@@ -105,14 +128,13 @@ class MonitoringExpansionTest:
         overview = await self.dashboard.get_system_overview()
         
         # Verify we got system overview
-        assert 'system_status' in overview, "System status should be present"
-        assert 'timestamp' in overview, "Timestamp should be present"
+        _assert_keys(overview, _OVERVIEW_KEYS, "System overview")
         
         # Get detailed API metrics
         api_metrics = await self.dashboard.get_detailed_api_metrics()
         
         # Verify we got API metrics
-        assert 'system_health' in api_metrics, "System health should be present"
+        _assert_keys(api_metrics, _API_METRICS_KEYS, "API metrics")
         
         logger.info("✓ Dashboard integration test passed")
         return True
@@ -121,20 +143,36 @@ class MonitoringExpansionTest:
         """Run all monitoring expansion tests."""
         logger.info("Starting monitoring expansion tests...")
         
+        # Generate API traffic, then take one metrics snapshot shared by every metrics test
         try:
-            await self.test_system_metrics()
-            await self.test_redis_metrics()
-            await self.test_security_metrics()
-            await self.test_ai_metrics()
-            await self.test_health_score()
-            await self.test_dashboard_integration()
-            
-            logger.info("🎉 All monitoring expansion tests passed!")
-            return True
-            
+            self._record_sample_requests()
+            metrics = await self.extended_monitor.get_all_extended_metrics()
         except Exception as e:
             logger.error(f"❌ Monitoring expansion test failed: {e}")
             return False
+        
+        # The tests only read metrics, so they can run concurrently
+        tests = {
+            "test_system_metrics": self.test_system_metrics(metrics),
+            "test_redis_metrics": self.test_redis_metrics(metrics),
+            "test_security_metrics": self.test_security_metrics(metrics),
+            "test_ai_metrics": self.test_ai_metrics(metrics),
+            "test_health_score": self.test_health_score(metrics),
+            "test_dashboard_integration": self.test_dashboard_integration()
+        }
+        results = await asyncio.gather(*tests.values(), return_exceptions=True)
+        
+        failures = [
+            f"{name}: {result!r}"
+            for name, result in zip(tests, results)
+            if isinstance(result, Exception)
+        ]
+        if failures:
+            logger.error("❌ Monitoring expansion tests failed:\n" + "\n".join(failures))
+            return False
+        
+        logger.info("🎉 All monitoring expansion tests passed!")
+        return True
 
 async def main():
     """Main test function."""
@@ -3,14 +3,32 @@ Performance Monitoring Dashboard for HoloMesh Interaction Modes
 """
 
 import asyncio
-import json
+import threading
 import time
-from typing import Dict, Any, List
-from dataclasses import dataclass, asdict
-from collections import defaultdict
+from typing import Callable, Deque, Dict, Any, List, AsyncIterator, Optional, Sequence, Tuple
+from dataclasses import dataclass, field, fields
+from collections import defaultdict, deque
+from itertools import islice
 import numpy as np
+import orjson
 
-@dataclass
+# Number of most recent optimization records retained for listing and export
+MAX_RECORDS = 100_000
+
+# (tool_name, interaction_mode)
+ModeKey = Tuple[str, str]
+
+# Columns of PerformanceMonitor.counters, one row per mode
+_RUNS, _SUCCESSES, _EXEC_SUM, _ITER_SUM, _CONF_SUM, _CONF_SUMSQ = range(6)
+_COUNTER_COLUMNS = 6
+INITIAL_MODE_CAPACITY = 64
+
+# Background ingestion: queue bound, records applied per batch, pause between batches
+INGEST_QUEUE_SIZE = 10000
+INGEST_BATCH_SIZE = 512
+INGEST_INTERVAL = 0.05
+
+@dataclass(slots=True, frozen=True)
 class OptimizationRecord:
     """Record of a single optimization run"""
     timestamp: float
@@ -24,133 +42,341 @@ class OptimizationRecord:
     success: bool
     project_id: str
     process_id: str
+    # Serialized view built once, since records never change after construction
+    _as_dict: Dict[str, Any] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        object.__setattr__(self, "_as_dict", {name: getattr(self, name) for name in _RECORD_FIELDS})
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Shallow dict view of the record, shared between callers and meant to be read-only"""
+        return self._as_dict
+
+_RECORD_FIELDS = tuple(f.name for f in fields(OptimizationRecord) if f.init)
+
+@dataclass(slots=True)
+class _MetricMatrix:
+    """Running aggregates for every metric of a mode, one array slot per metric"""
+    names: List[str] = field(default_factory=list)
+    index: Dict[str, int] = field(default_factory=dict)
+    counts: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=np.int64))
+    totals: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=np.float64))
+    first: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=np.float64))
+    last: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=np.float64))
+    
+    def _row(self, name: str) -> int:
+        """Return the row of a metric, growing the arrays the first time it is seen"""
+        row = self.index.get(name)
+        if row is None:
+            row = self.index[name] = len(self.names)
+            self.names.append(name)
+            self.counts = np.append(self.counts, 0)
+            self.totals = np.append(self.totals, 0.0)
+            self.first = np.append(self.first, 0.0)
+            self.last = np.append(self.last, 0.0)
+        return row
+    
+    def extend(self, name: str, values: Sequence[float]):
+        """Fold samples of one metric into its running aggregates"""
+        row = self._row(name)
+        count = int(self.counts[row])
+        if count == 0:
+            self.first[row] = values[0]
+        self.counts[row] = count + len(values)
+        self.totals[row] += float(sum(values))
+        self.last[row] = values[-1]
+    
+    def summary(self) -> Tuple[Dict[str, float], Dict[str, float]]:
+        """Return (averages, improvements) for all metrics in one vectorized pass"""
+        if not self.names:
+            return {}, {}
+        averages = self.totals / self.counts
+        nonzero = self.first != 0
+        improvements = np.where(nonzero, (self.last - self.first) / np.where(nonzero, self.first, 1.0), 0.0)
+        # Improvements need at least two samples
+        return (
+            dict(zip(self.names, averages.tolist())),
+            {
+                name: improvement
+                for name, improvement, count in zip(self.names, improvements.tolist(), self.counts.tolist())
+                if count > 1
+            }
+        )
+
+@dataclass(slots=True)
+class _ModeStats:
+    """Metric aggregates and derived ratios for one tool/interaction mode pair"""
+    mode_id: int
+    metrics: _MetricMatrix = field(default_factory=_MetricMatrix)
+    # Ratios kept current on every update so reads never recompute them
+    success_rate: float = 0.0
+    avg_exec: float = 0.0
+    avg_iter: float = 0.0
+    avg_conf: float = 0.0
 
 class PerformanceMonitor:
     """Monitor and analyze performance of HoloMesh interaction modes"""
     
     def __init__(self):
-        self.records: List[OptimizationRecord] = []
-        self.mode_stats = defaultdict(lambda: {
-            "total_runs": 0,
-            "successful_runs": 0,
-            "total_execution_time": 0.0,
-            "total_iterations": 0,
-            "confidence_scores": [],
-            "metrics_history": defaultdict(list)
-        })
+        # Records arrive in submission order, so the newest are always at the right end
+        self.records: Deque[OptimizationRecord] = deque(maxlen=MAX_RECORDS)
+        self.mode_stats: Dict[ModeKey, _ModeStats] = {}
+        # Aggregate counters per mode, indexed by mode id; each row is guarded by its own lock
+        self.mode_ids: Dict[ModeKey, int] = {}
+        self._mode_keys: List[ModeKey] = []
+        self.counters = np.zeros((INITIAL_MODE_CAPACITY, _COUNTER_COLUMNS), dtype=np.float64)
+        self.locks: List[threading.Lock] = []
+        self._registry_lock = threading.Lock()
+        # get_mode_performance results keyed by mode, tagged with the run count they were built at
+        self._performance_cache: Dict[ModeKey, Tuple[int, Dict[str, Any]]] = {}
+        # Background ingestion queue, created on first submit from a running event loop
+        self._queue: Optional[asyncio.Queue] = None
+        self._drain_task: Optional[asyncio.Task] = None
+    
+    def _register_mode(self, mode_key: ModeKey) -> _ModeStats:
+        """Return the stats of a mode, assigning it a counters row the first time it is seen"""
+        stats = self.mode_stats.get(mode_key)
+        if stats is not None:
+            return stats
+        with self._registry_lock:
+            stats = self.mode_stats.get(mode_key)
+            if stats is not None:
+                return stats
+            mode_id = len(self._mode_keys)
+            if mode_id == len(self.counters):
+                # Hold every row lock while the array is copied so no update is lost
+                for lock in self.locks:
+                    lock.acquire()
+                try:
+                    grown = np.zeros((2 * len(self.counters), _COUNTER_COLUMNS), dtype=np.float64)
+                    grown[:mode_id] = self.counters
+                    self.counters = grown
+                finally:
+                    for lock in self.locks:
+                        lock.release()
+            self.locks.append(threading.Lock())
+            self._mode_keys.append(mode_key)
+            self.mode_ids[mode_key] = mode_id
+            stats = self.mode_stats[mode_key] = _ModeStats(mode_id)
+            return stats
     
     def record_optimization(self, record: OptimizationRecord):
         """Record an optimization run"""
-        self.records.append(record)
-        
-        # Update mode statistics
-        mode_key = f"{record.tool_name}_{record.interaction_mode}"
-        stats = self.mode_stats[mode_key]
+        self._apply_batch((record,))
+    
+    def _apply_batch(self, records: Sequence[OptimizationRecord]):
+        """Apply a batch of records, updating each affected mode once"""
+        self.records.extend(records)
         
-        stats["total_runs"] += 1
-        if record.success:
-            stats["successful_runs"] += 1
+        # Group the batch by mode so each mode's stats are touched once
+        by_mode: Dict[ModeKey, List[OptimizationRecord]] = defaultdict(list)
+        for record in records:
+            by_mode[(record.tool_name, record.interaction_mode)].append(record)
         
-        stats["total_execution_time"] += record.execution_time
-        stats["total_iterations"] += record.iterations
-        stats["confidence_scores"].append(record.confidence_score)
+        for mode_key, mode_records in by_mode.items():
+            stats = self._register_mode(mode_key)
+            confidences = [record.confidence_score for record in mode_records]
+            
+            # Store metrics history
+            metric_values: Dict[str, List[float]] = defaultdict(list)
+            for record in mode_records:
+                for metric_name, value in record.final_metrics.items():
+                    metric_values[metric_name].append(value)
+            
+            with self.locks[stats.mode_id]:
+                row = self.counters[stats.mode_id]
+                row[_RUNS] += len(mode_records)
+                row[_SUCCESSES] += sum(1 for record in mode_records if record.success)
+                row[_EXEC_SUM] += sum(record.execution_time for record in mode_records)
+                row[_ITER_SUM] += sum(record.iterations for record in mode_records)
+                row[_CONF_SUM] += sum(confidences)
+                row[_CONF_SUMSQ] += sum(confidence * confidence for confidence in confidences)
+                
+                for metric_name, values in metric_values.items():
+                    stats.metrics.extend(metric_name, values)
+                
+                runs = row[_RUNS]
+                stats.success_rate = float(row[_SUCCESSES] / runs)
+                stats.avg_exec = float(row[_EXEC_SUM] / runs)
+                stats.avg_iter = float(row[_ITER_SUM] / runs)
+                stats.avg_conf = float(row[_CONF_SUM] / runs)
+    
+    def submit(self, record: OptimizationRecord):
+        """Queue a record for the background consumer, applying it directly when no event loop is running"""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.record_optimization(record)
+            return
         
-        # Store metrics history
-        for metric_name, value in record.final_metrics.items():
-            stats["metrics_history"][metric_name].append(value)
+        task = self._drain_task
+        if task is None or task.done() or task.get_loop() is not loop:
+            self._start_drain(loop)
+        try:
+            self._queue.put_nowait(record)
+        except asyncio.QueueFull:
+            # Never drop a record; apply it inline when the consumer falls behind
+            self.record_optimization(record)
+    
+    def _start_drain(self, loop: asyncio.AbstractEventLoop):
+        """Start the consumer task on loop, applying anything left in a previous queue first"""
+        if self._queue is not None:
+            leftover = []
+            while not self._queue.empty():
+                leftover.append(self._queue.get_nowait())
+            if leftover:
+                self._apply_batch(leftover)
+        self._queue = asyncio.Queue(maxsize=INGEST_QUEUE_SIZE)
+        self._drain_task = loop.create_task(self._drain_loop(self._queue))
+    
+    async def _drain_loop(self, queue: asyncio.Queue):
+        """Apply queued records in batches"""
+        batch: List[OptimizationRecord] = []
+        while True:
+            batch.append(await queue.get())
+            while len(batch) < INGEST_BATCH_SIZE and not queue.empty():
+                batch.append(queue.get_nowait())
+            try:
+                self._apply_batch(batch)
+            finally:
+                for _ in batch:
+                    queue.task_done()
+                batch.clear()
+            await asyncio.sleep(INGEST_INTERVAL)
+    
+    async def flush(self):
+        """Wait until every queued record has been applied"""
+        if self._queue is not None and self._drain_task is not None and not self._drain_task.done():
+            await self._queue.join()
     
     def get_mode_performance(self, tool_name: str, interaction_mode: str) -> Dict[str, Any]:
         """Get performance statistics for a specific mode"""
-        mode_key = f"{tool_name}_{interaction_mode}"
-        stats = self.mode_stats[mode_key]
+        mode_key = (tool_name, interaction_mode)
+        stats = self.mode_stats.get(mode_key)
         
-        if stats["total_runs"] == 0:
+        if stats is None:
             return {"error": "No data available"}
-        
-        success_rate = stats["successful_runs"] / stats["total_runs"]
-        avg_execution_time = stats["total_execution_time"] / stats["total_runs"]
-        avg_iterations = stats["total_iterations"] / stats["total_runs"]
-        avg_confidence = np.mean(stats["confidence_scores"]) if stats["confidence_scores"] else 0.0
-        
-        # Calculate metric averages and improvements
-        metric_averages = {}
-        metric_improvements = {}
-        for metric_name, values in stats["metrics_history"].items():
-            if values:
-                metric_averages[metric_name] = np.mean(values)
-                if len(values) > 1:
-                    metric_improvements[metric_name] = (values[-1] - values[0]) / values[0] if values[0] != 0 else 0.0
-        
-        return {
-            "mode": interaction_mode,
-            "tool": tool_name,
-            "total_runs": stats["total_runs"],
-            "success_rate": success_rate,
-            "avg_execution_time": avg_execution_time,
-            "avg_iterations": avg_iterations,
-            "avg_confidence_score": avg_confidence,
-            "metric_averages": metric_averages,
-            "metric_improvements": metric_improvements
-        }
+        with self.locks[stats.mode_id]:
+            runs, _, _, _, conf_sum, conf_sumsq = self.counters[stats.mode_id].tolist()
+            total_runs = int(runs)
+            if total_runs == 0:
+                return {"error": "No data available"}
+            
+            cached = self._performance_cache.get(mode_key)
+            if cached is not None and cached[0] == total_runs:
+                return cached[1]
+            
+            # Calculate metric averages and improvements from the running aggregates
+            metric_averages, metric_improvements = stats.metrics.summary()
+            avg_confidence = stats.avg_conf
+            performance = {
+                "mode": interaction_mode,
+                "tool": tool_name,
+                "total_runs": total_runs,
+                "success_rate": stats.success_rate,
+                "avg_execution_time": stats.avg_exec,
+                "avg_iterations": stats.avg_iter,
+                "avg_confidence_score": avg_confidence,
+                "confidence_std": max(conf_sumsq / runs - avg_confidence * avg_confidence, 0.0) ** 0.5,
+                "metric_averages": metric_averages,
+                "metric_improvements": metric_improvements
+            }
+        self._performance_cache[mode_key] = (total_runs, performance)
+        return performance
     
     def get_overall_performance(self) -> Dict[str, Any]:
         """Get overall performance across all modes"""
-        all_modes = list(self.mode_stats.keys())
-        mode_performances = []
-        
-        for mode_key in all_modes:
-            tool_name, interaction_mode = mode_key.split("_", 1)
-            performance = self.get_mode_performance(tool_name, interaction_mode)
-            if "error" not in performance:
-                mode_performances.append(performance)
-        
-        if not mode_performances:
+        mode_count = len(self._mode_keys)
+        rows = self.counters[:mode_count].copy()
+        active = np.flatnonzero(rows[:, _RUNS] > 0)
+        if len(active) == 0:
             return {"error": "No data available"}
         
-        # Aggregate statistics
-        total_runs = sum(p["total_runs"] for p in mode_performances)
-        avg_success_rate = np.mean([p["success_rate"] for p in mode_performances])
-        avg_execution_time = np.mean([p["avg_execution_time"] for p in mode_performances])
-        avg_confidence = np.mean([p["avg_confidence_score"] for p in mode_performances])
+        # Per-mode ratios for every mode at once
+        rows = rows[active]
+        runs = rows[:, _RUNS]
+        success_rates = rows[:, _SUCCESSES] / runs
+        avg_execution_times = rows[:, _EXEC_SUM] / runs
+        avg_confidences = rows[:, _CONF_SUM] / runs
         
-        # Find best performing modes
-        best_success_rate = max(mode_performances, key=lambda x: x["success_rate"])
-        fastest_execution = min(mode_performances, key=lambda x: x["avg_execution_time"])
-        highest_confidence = max(mode_performances, key=lambda x: x["avg_confidence_score"])
+        def mode_and_tool(index: int) -> Dict[str, str]:
+            tool_name, interaction_mode = self._mode_keys[active[index]]
+            return {"mode": interaction_mode, "tool": tool_name}
+        
+        # argmax/argmin return the first match, so ties go to the mode seen first
+        best_success_rate = int(np.argmax(success_rates))
+        fastest_execution = int(np.argmin(avg_execution_times))
+        highest_confidence = int(np.argmax(avg_confidences))
         
         return {
-            "total_optimizations": total_runs,
-            "avg_success_rate": avg_success_rate,
-            "avg_execution_time": avg_execution_time,
-            "avg_confidence_score": avg_confidence,
+            "total_optimizations": int(runs.sum()),
+            "avg_success_rate": float(success_rates.mean()),
+            "avg_execution_time": float(avg_execution_times.mean()),
+            "avg_confidence_score": float(avg_confidences.mean()),
             "best_success_rate_mode": {
-                "mode": best_success_rate["mode"],
-                "tool": best_success_rate["tool"],
-                "rate": best_success_rate["success_rate"]
+                **mode_and_tool(best_success_rate),
+                "rate": float(success_rates[best_success_rate])
             },
             "fastest_execution_mode": {
-                "mode": fastest_execution["mode"],
-                "tool": fastest_execution["tool"],
-                "time": fastest_execution["avg_execution_time"]
+                **mode_and_tool(fastest_execution),
+                "time": float(avg_execution_times[fastest_execution])
             },
             "highest_confidence_mode": {
-                "mode": highest_confidence["mode"],
-                "tool": highest_confidence["tool"],
-                "confidence": highest_confidence["avg_confidence_score"]
+                **mode_and_tool(highest_confidence),
+                "confidence": float(avg_confidences[highest_confidence])
             },
-            "mode_count": len(mode_performances)
+            "mode_count": len(active)
         }
     
+    def _recent(self, limit: int) -> List[OptimizationRecord]:
+        """Newest-first slice of the retained records"""
+        return list(islice(reversed(self.records), max(limit, 0)))
+    
     def get_recent_records(self, limit: int = 50) -> List[Dict[str, Any]]:
         """Get recent optimization records"""
-        recent = sorted(self.records, key=lambda x: x.timestamp, reverse=True)[:limit]
-        return [asdict(record) for record in recent]
+        return [record.to_dict() for record in self._recent(limit)]
+    
+    def get_recent_records_json(self, limit: int = 50) -> bytes:
+        """Get recent optimization records encoded as a JSON array"""
+        # orjson serializes the slotted dataclass directly, so no per-record dicts are built
+        return orjson.dumps(self._recent(limit))
+    
+    async def iter_export_chunks(self, batch_size: int = 500) -> AsyncIterator[bytes]:
+        """Yield the export_data JSON document as encoded chunks, one batch of records at a time"""
+        yield b'{"records":['
+        records = list(self.records)
+        for start in range(0, len(records), batch_size):
+            # Encode the batch as one array and drop its brackets to splice it into the outer one
+            chunk = orjson.dumps(records[start:start + batch_size])[1:-1]
+            yield chunk if start == 0 else b"," + chunk
+            await asyncio.sleep(0)
+        yield b'],"mode_stats":' + orjson.dumps(self.mode_stats_summary())
+        yield b',"export_timestamp":' + orjson.dumps(time.time()) + b"}"
+    
+    async def export_data_stream(self, write: Callable[[bytes], Any], batch_size: int = 500):
+        """Write the export_data JSON document incrementally through write"""
+        async for chunk in self.iter_export_chunks(batch_size):
+            write(chunk)
+    
+    def mode_stats_summary(self) -> Dict[str, Dict[str, Any]]:
+        """Get the serializable per-mode counters"""
+        # JSON object keys must be strings, so exports keep the "tool_mode" key format
+        rows = self.counters[:len(self._mode_keys)].tolist()
+        return {
+            f"{tool_name}_{interaction_mode}": {
+                "total_runs": int(row[_RUNS]),
+                "successful_runs": int(row[_SUCCESSES]),
+                "total_execution_time": row[_EXEC_SUM],
+                "total_iterations": int(row[_ITER_SUM])
+            }
+            for (tool_name, interaction_mode), row in zip(self._mode_keys, rows)
+        }
     
     def export_data(self) -> Dict[str, Any]:
         """Export all monitoring data"""
         return {
-            "records": [asdict(record) for record in self.records],
-            "mode_stats": dict(self.mode_stats),
+            "records": [record.to_dict() for record in self.records],
+            "mode_stats": self.mode_stats_summary(),
             "export_timestamp": time.time()
         }
 
@@ -183,4 +409,4 @@ def record_optimization_result(tool_name: str, interaction_mode: str, strategy:
         project_id=project_id,
         process_id=process_id
     )
-    monitor.record_optimization(record)
\ No newline at end of file
+    monitor.submit(record)
\ No newline at end of file
@@ -3,16 +3,112 @@ Quality Assurance 100% System for GlobalScope Innovation Nexus
 Ensures absolute quality for all outputs regardless of interface used
 """
 import asyncio
+import itertools
 import json
 import logging
-from datetime import datetime
-from typing import Dict, Any, List
+import sys
+from typing import Dict, Any, List, Optional, Tuple, Callable, Awaitable
+from collections import OrderedDict
 import hashlib
+from dataclasses import dataclass
+from types import MappingProxyType
 
-from src.lib.utils import get_logger
+import orjson
+
+from src.lib.utils import get_logger, get_cached_timestamp
 
 logger = get_logger("QualityAssurance100Percent")
 
+@dataclass(frozen=True, slots=True)
+class Standards:
+    """Quality standards for one innovation category"""
+    reliability_target: float
+    security_level: str
+    defect_tolerance: int
+    testing_coverage: float
+    verification_required: bool
+    human_review_required: bool = False
+    regulatory_compliance: bool = False
+    sustainability_compliance: bool = False
+
+# Quality standards per innovation category; shared read-only by every instance
+_QUALITY_STANDARDS = MappingProxyType({
+    "defense": Standards(
+        reliability_target=0.9999,
+        security_level="quantum",
+        defect_tolerance=0,
+        testing_coverage=1.0,
+        verification_required=True,
+        human_review_required=True
+    ),
+    "healthcare": Standards(
+        reliability_target=0.99999,
+        security_level="medical_grade",
+        defect_tolerance=0,
+        testing_coverage=1.0,
+        verification_required=True,
+        regulatory_compliance=True
+    ),
+    "environment": Standards(
+        reliability_target=0.999,
+        security_level="standard",
+        defect_tolerance=0,
+        testing_coverage=0.95,
+        verification_required=True,
+        sustainability_compliance=True
+    ),
+    "general": Standards(
+        reliability_target=0.999,
+        security_level="standard",
+        defect_tolerance=0,
+        testing_coverage=0.9,
+        verification_required=True
+    )
+})
+
+# Quality checks performed for every guarantee
+_QUALITY_CHECKS = MappingProxyType({
+    "design_verification": True,
+    "performance_testing": True,
+    "security_assessment": True,
+    "reliability_analysis": True,
+    "compliance_check": True,
+    "user_acceptance": True
+})
+
+# Key for the keyed BLAKE2b certificate signature
+_SIG_KEY = b"GlobalScope"
+
+# Maximum number of memoized quality check outcomes
+QUALITY_CACHE_SIZE = 4096
+
+# Weight of each quality check in the overall score; the weights sum to 1.0
+_WEIGHTS_ITEMS = (
+    ("design_verification", 0.2),
+    ("performance_testing", 0.25),
+    ("security_assessment", 0.15),
+    ("reliability_analysis", 0.2),
+    ("compliance_check", 0.1),
+    ("user_acceptance", 0.1)
+)
+
+# Shared shape of every failed-operation response
+_ERROR_TEMPLATE = {
+    "status": sys.intern("error"),
+    "message": "",
+    "quality_guarantee": sys.intern("100% - Error resolution in progress")
+}
+
+def _error_response(message: str) -> Dict[str, Any]:
+    """Copy the error response template with the given message."""
+    response = _ERROR_TEMPLATE.copy()
+    response["message"] = message
+    return response
+
+def to_bytes(obj: Any) -> bytes:
+    """Serialize a guarantee result to JSON bytes for the HTTP layer."""
+    return orjson.dumps(obj, option=orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS)
+
 class QualityAssurance100Percent:
     """
     System that guarantees 100% quality for all innovation outputs
@@ -23,6 +119,11 @@ class QualityAssurance100Percent:
         self.quality_standards = {}
         self.quality_checks = {}
         self.quality_guarantees = {}
+        # Check-and-score pipeline per innovation type, with that type's standards bound in
+        self._pipelines: Dict[str, Callable[[Dict[str, Any]], Awaitable[Tuple[float, Dict[str, Any]]]]] = {}
+        self._certificate_seq = itertools.count()
+        # LRU of (quality_score, quality_results) keyed by type, interface and output digest
+        self._quality_cache: "OrderedDict[Tuple[str, str, bytes], Tuple[float, Dict[str, Any]]]" = OrderedDict()
         self.interface_quality_mapping = {
             "web": 1.0,
             "ar_vr": 1.0,
@@ -39,49 +140,12 @@ class QualityAssurance100Percent:
             Initialization status
         """
         try:
-            # Define quality standards for different innovation categories
-            self.quality_standards = {
-                "defense": {
-                    "reliability_target": 0.9999,
-                    "security_level": "quantum",
-                    "defect_tolerance": 0,
-                    "testing_coverage": 1.0,
-                    "verification_required": True,
-                    "human_review_required": True
-                },
-                "healthcare": {
-                    "reliability_target": 0.99999,
-                    "security_level": "medical_grade",
-                    "defect_tolerance": 0,
-                    "testing_coverage": 1.0,
-                    "verification_required": True,
-                    "regulatory_compliance": True
-                },
-                "environment": {
-                    "reliability_target": 0.999,
-                    "security_level": "standard",
-                    "defect_tolerance": 0,
-                    "testing_coverage": 0.95,
-                    "verification_required": True,
-                    "sustainability_compliance": True
-                },
-                "general": {
-                    "reliability_target": 0.999,
-                    "security_level": "standard",
-                    "defect_tolerance": 0,
-                    "testing_coverage": 0.9,
-                    "verification_required": True
-                }
-            }
-            
-            # Initialize quality checks
-            self.quality_checks = {
-                "design_verification": True,
-                "performance_testing": True,
-                "security_assessment": True,
-                "reliability_analysis": True,
-                "compliance_check": True,
-                "user_acceptance": True
+            # Quality standards and checks are module-level constants
+            self.quality_standards = _QUALITY_STANDARDS
+            self.quality_checks = _QUALITY_CHECKS
+            self._pipelines = {
+                innovation_type: self._make_pipeline(standards)
+                for innovation_type, standards in self.quality_standards.items()
             }
             
             logger.info("Quality standards initialized")
@@ -93,11 +157,7 @@ class QualityAssurance100Percent:
             
         except Exception as e:
             logger.error(f"Failed to initialize quality standards: {str(e)}")
-            return {
-                "status": "error",
-                "message": f"Failed to initialize quality standards: {str(e)}",
-                "quality_guarantee": "100% - Error resolution in progress"
-            }
+            return _error_response(f"Failed to initialize quality standards: {str(e)}")
     
     async def guarantee_quality(self, innovation_id: str, 
                               innovation_type: str,
@@ -116,14 +176,22 @@ class QualityAssurance100Percent:
             Quality guarantee certificate
         """
         try:
-            # Get quality standards for innovation type
-            standards = self.quality_standards.get(innovation_type, self.quality_standards["general"])
-            
-            # Perform quality checks
-            quality_results = await self._perform_quality_checks(output_data, standards)
-            
-            # Calculate overall quality score
-            quality_score = await self._calculate_quality_score(quality_results, standards)
+            # Get the pipeline specialized for the innovation type's standards
+            pipeline = self._pipelines.get(innovation_type) or self._pipelines["general"]
+            
+            # Reuse the outcome for identical output, otherwise perform quality checks and score them
+            cache_key = self._quality_cache_key(innovation_type, interface_used, output_data)
+            cached = self._quality_cache.get(cache_key) if cache_key is not None else None
+            if cached is not None:
+                self._quality_cache.move_to_end(cache_key)
+                # Each certificate gets its own results, so editing one cannot leak into the others
+                quality_score, quality_results = cached[0], self._copy_results(cached[1])
+            else:
+                quality_score, quality_results = await pipeline(output_data)
+                if cache_key is not None:
+                    self._quality_cache[cache_key] = (quality_score, self._copy_results(quality_results))
+                    if len(self._quality_cache) > QUALITY_CACHE_SIZE:
+                        self._quality_cache.popitem(last=False)
             
             # Generate quality guarantee certificate
             guarantee_certificate = await self._generate_guarantee_certificate(
@@ -150,14 +218,61 @@ class QualityAssurance100Percent:
             
         except Exception as e:
             logger.error(f"Failed to guarantee quality for innovation {innovation_id}: {str(e)}")
-            return {
-                "status": "error",
-                "message": f"Failed to guarantee quality: {str(e)}",
-                "quality_guarantee": "100% - Error resolution in progress"
-            }
+            return _error_response(f"Failed to guarantee quality: {str(e)}")
+    
+    async def guarantee_quality_bytes(self, innovation_id: str,
+                                    innovation_type: str,
+                                    interface_used: str,
+                                    output_data: Dict[str, Any]) -> bytes:
+        """
+        Guarantee quality and return the response pre-encoded as JSON bytes
+        
+        Args:
+            innovation_id: Unique innovation identifier
+            innovation_type: Type of innovation (defense, healthcare, etc.)
+            interface_used: Interface through which request was made
+            output_data: Innovation output data to verify
+            
+        Returns:
+            JSON-encoded guarantee response, ready for an HTTP response body
+        """
+        result = await self.guarantee_quality(innovation_id, innovation_type, interface_used, output_data)
+        return to_bytes(result)
+    
+    def _make_pipeline(self, standards: Standards) -> Callable[[Dict[str, Any]], Awaitable[Tuple[float, Dict[str, Any]]]]:
+        """
+        Build the check-and-score pipeline for one set of standards
+        
+        Args:
+            standards: Quality standards bound into the pipeline
+            
+        Returns:
+            Coroutine function mapping output data to (quality_score, quality_results)
+        """
+        async def run(output_data: Dict[str, Any]) -> Tuple[float, Dict[str, Any]]:
+            quality_results = await self._perform_quality_checks(output_data, standards)
+            quality_score = await self._calculate_quality_score(quality_results, standards)
+            return quality_score, quality_results
+        
+        return run
+    
+    @staticmethod
+    def _quality_cache_key(innovation_type: str, interface_used: str,
+                           output_data: Dict[str, Any]) -> Optional[Tuple[str, str, bytes]]:
+        """Build the memo key for a guarantee, or None if the output cannot be encoded."""
+        try:
+            encoded = orjson.dumps(output_data, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:
+            return None
+        return (innovation_type, interface_used, hashlib.blake2b(encoded, digest_size=16).digest())
+    
+    @staticmethod
+    def _copy_results(quality_results: Dict[str, Any]) -> Dict[str, Any]:
+        """Copy quality results down to the per-check dicts."""
+        return {name: dict(result) for name, result in quality_results.items()}
     
     async def _perform_quality_checks(self, output_data: Dict[str, Any], 
-                                    standards: Dict[str, Any]) -> Dict[str, Any]:
+                                    standards: Standards) -> Dict[str, Any]:
         """
         Perform comprehensive quality checks on innovation output
         
@@ -169,27 +284,15 @@ class QualityAssurance100Percent:
             Quality check results
         """
         try:
-            results = {}
-            
-            # Design verification
-            results["design_verification"] = await self._verify_design(output_data, standards)
-            
-            # Performance testing
-            results["performance_testing"] = await self._test_performance(output_data, standards)
-            
-            # Security assessment
-            results["security_assessment"] = await self._assess_security(output_data, standards)
-            
-            # Reliability analysis
-            results["reliability_analysis"] = await self._analyze_reliability(output_data, standards)
-            
-            # Compliance check
-            results["compliance_check"] = await self._check_compliance(output_data, standards)
-            
-            # User acceptance
-            results["user_acceptance"] = await self._verify_user_acceptance(output_data, standards)
-            
-            return results
+            # The checks are synchronous, so they are called directly without coroutine overhead
+            return {
+                "design_verification": self._verify_design(output_data, standards),
+                "performance_testing": self._test_performance(output_data, standards),
+                "security_assessment": self._assess_security(output_data, standards),
+                "reliability_analysis": self._analyze_reliability(output_data, standards),
+                "compliance_check": self._check_compliance(output_data, standards),
+                "user_acceptance": self._verify_user_acceptance(output_data, standards)
+            }
             
         except Exception as e:
             logger.error(f"Quality checks failed: {str(e)}")
@@ -203,107 +306,89 @@ class QualityAssurance100Percent:
                 "user_acceptance": {"passed": True, "score": 1.0}
             }
     
-    async def _verify_design(self, output_data: Dict[str, Any], 
-                           standards: Dict[str, Any]) -> Dict[str, Any]:
+    def _verify_design(self, output_data: Dict[str, Any], 
+                     standards: Standards) -> Dict[str, Any]:
         """Verify design quality"""
-        try:
-            # Mock design verification - in real implementation this would be comprehensive
-            design_score = 1.0  # Perfect score for demonstration
-            passed = design_score >= 0.95
-            
-            return {
-                "passed": passed,
-                "score": design_score,
-                "details": "Design meets all specifications and standards"
-            }
-        except Exception:
-            return {"passed": True, "score": 1.0, "details": "Design verification passed"}
+        # Mock design verification - in real implementation this would be comprehensive
+        design_score = 1.0  # Perfect score for demonstration
+        passed = design_score >= 0.95
+        
+        return {
+            "passed": passed,
+            "score": design_score,
+            "details": "Design meets all specifications and standards"
+        }
     
-    async def _test_performance(self, output_data: Dict[str, Any], 
-                              standards: Dict[str, Any]) -> Dict[str, Any]:
+    def _test_performance(self, output_data: Dict[str, Any], 
+                        standards: Standards) -> Dict[str, Any]:
         """Test performance characteristics"""
-        try:
-            # Mock performance testing
-            performance_score = 1.0  # Perfect score for demonstration
-            passed = performance_score >= standards.get("reliability_target", 0.999)
-            
-            return {
-                "passed": passed,
-                "score": performance_score,
-                "details": "Performance exceeds target specifications"
-            }
-        except Exception:
-            return {"passed": True, "score": 1.0, "details": "Performance testing passed"}
+        # Mock performance testing
+        performance_score = 1.0  # Perfect score for demonstration
+        passed = performance_score >= standards.reliability_target
+        
+        return {
+            "passed": passed,
+            "score": performance_score,
+            "details": "Performance exceeds target specifications"
+        }
     
-    async def _assess_security(self, output_data: Dict[str, Any], 
-                             standards: Dict[str, Any]) -> Dict[str, Any]:
+    def _assess_security(self, output_data: Dict[str, Any], 
+                       standards: Standards) -> Dict[str, Any]:
         """Assess security level"""
-        try:
-            # Mock security assessment
-            security_level = standards.get("security_level", "standard")
-            security_score = 1.0 if security_level in ["quantum", "medical_grade", "standard"] else 0.8
-            passed = True  # All security levels pass in this mock
-            
-            return {
-                "passed": passed,
-                "score": security_score,
-                "details": f"Security level '{security_level}' verified"
-            }
-        except Exception:
-            return {"passed": True, "score": 1.0, "details": "Security assessment passed"}
+        # Mock security assessment
+        security_level = standards.security_level
+        security_score = 1.0 if security_level in ["quantum", "medical_grade", "standard"] else 0.8
+        passed = True  # All security levels pass in this mock
+        
+        return {
+            "passed": passed,
+            "score": security_score,
+            "details": f"Security level '{security_level}' verified"
+        }
     
-    async def _analyze_reliability(self, output_data: Dict[str, Any], 
-                                 standards: Dict[str, Any]) -> Dict[str, Any]:
+    def _analyze_reliability(self, output_data: Dict[str, Any], 
+                           standards: Standards) -> Dict[str, Any]:
         """Analyze reliability metrics"""
-        try:
-            # Mock reliability analysis
-            reliability_target = standards.get("reliability_target", 0.999)
-            reliability_score = 1.0  # Perfect score for demonstration
-            passed = reliability_score >= reliability_target
-            
-            return {
-                "passed": passed,
-                "score": reliability_score,
-                "details": f"Reliability {reliability_score:.4f} meets target {reliability_target:.4f}"
-            }
-        except Exception:
-            return {"passed": True, "score": 1.0, "details": "Reliability analysis passed"}
+        # Mock reliability analysis
+        reliability_target = standards.reliability_target
+        reliability_score = 1.0  # Perfect score for demonstration
+        passed = reliability_score >= reliability_target
+        
+        return {
+            "passed": passed,
+            "score": reliability_score,
+            "details": f"Reliability {reliability_score:.4f} meets target {reliability_target:.4f}"
+        }
     
-    async def _check_compliance(self, output_data: Dict[str, Any], 
-                              standards: Dict[str, Any]) -> Dict[str, Any]:
+    def _check_compliance(self, output_data: Dict[str, Any], 
+                        standards: Standards) -> Dict[str, Any]:
         """Check regulatory and standard compliance"""
-        try:
-            # Mock compliance check
-            compliance_required = standards.get("regulatory_compliance", False)
-            compliance_score = 1.0 if not compliance_required or compliance_required else 0.9
-            passed = True  # All compliance checks pass in this mock
-            
-            return {
-                "passed": passed,
-                "score": compliance_score,
-                "details": "All compliance requirements met"
-            }
-        except Exception:
-            return {"passed": True, "score": 1.0, "details": "Compliance check passed"}
+        # Mock compliance check
+        compliance_required = standards.regulatory_compliance
+        compliance_score = 1.0 if not compliance_required or compliance_required else 0.9
+        passed = True  # All compliance checks pass in this mock
+        
+        return {
+            "passed": passed,
+            "score": compliance_score,
+            "details": "All compliance requirements met"
+        }
     
-    async def _verify_user_acceptance(self, output_data: Dict[str, Any], 
-                                    standards: Dict[str, Any]) -> Dict[str, Any]:
+    def _verify_user_acceptance(self, output_data: Dict[str, Any], 
+                              standards: Standards) -> Dict[str, Any]:
         """Verify user acceptance criteria"""
-        try:
-            # Mock user acceptance verification
-            user_acceptance_score = 1.0  # Perfect score for demonstration
-            passed = user_acceptance_score >= 0.95
-            
-            return {
-                "passed": passed,
-                "score": user_acceptance_score,
-                "details": "User acceptance criteria satisfied"
-            }
-        except Exception:
-            return {"passed": True, "score": 1.0, "details": "User acceptance verification passed"}
+        # Mock user acceptance verification
+        user_acceptance_score = 1.0  # Perfect score for demonstration
+        passed = user_acceptance_score >= 0.95
+        
+        return {
+            "passed": passed,
+            "score": user_acceptance_score,
+            "details": "User acceptance criteria satisfied"
+        }
     
     async def _calculate_quality_score(self, quality_results: Dict[str, Any], 
-                                     standards: Dict[str, Any]) -> float:
+                                     standards: Standards) -> float:
         """
         Calculate overall quality score
         
@@ -315,28 +400,8 @@ class QualityAssurance100Percent:
             Overall quality score (0.0 - 1.0)
         """
         try:
-            # Weighted scoring system
-            weights = {
-                "design_verification": 0.2,
-                "performance_testing": 0.25,
-                "security_assessment": 0.15,
-                "reliability_analysis": 0.2,
-                "compliance_check": 0.1,
-                "user_acceptance": 0.1
-            }
-            
-            total_score = 0.0
-            total_weight = 0.0
-            
-            for check_name, check_result in quality_results.items():
-                if check_name in weights:
-                    weight = weights[check_name]
-                    score = check_result.get("score", 0.0)
-                    total_score += weight * score
-                    total_weight += weight
-            
-            # Normalize score
-            quality_score = total_score / total_weight if total_weight > 0 else 1.0
+            # Weighted scoring system; the weights sum to 1.0, so no normalization is needed
+            quality_score = sum(weight * quality_results[check_name]["score"] for check_name, weight in _WEIGHTS_ITEMS)
             
             # Ensure minimum 99.99% quality for guarantee
             return max(0.9999, quality_score)
@@ -365,8 +430,10 @@ class QualityAssurance100Percent:
         """
         try:
             # Generate unique certificate ID
-            certificate_data = f"{innovation_id}{innovation_type}{interface_used}{quality_score}{datetime.utcnow().isoformat()}"
-            certificate_id = hashlib.sha256(certificate_data.encode()).hexdigest()[:32]
+            # The timestamp is cached per second, so a per-instance sequence number keeps IDs unique
+            issue_date = get_cached_timestamp(resolution=1.0)
+            certificate_data = f"{innovation_id}{innovation_type}{interface_used}{quality_score}{issue_date}{next(self._certificate_seq)}"
+            certificate_id = hashlib.blake2b(certificate_data.encode(), digest_size=16).hexdigest()
             
             certificate = {
                 "certificate_id": certificate_id,
@@ -376,10 +443,10 @@ class QualityAssurance100Percent:
                 "quality_score": quality_score,
                 "quality_results": quality_results,
                 "guarantee_level": "100%",
-                "issue_date": datetime.utcnow().isoformat(),
+                "issue_date": issue_date,
                 "valid_until": "Forever",  # Lifetime guarantee
                 "issuer": "GlobalScope Innovation Nexus Quality Assurance System",
-                "signature": hashlib.sha256(f"GlobalScope{certificate_id}".encode()).hexdigest()[:16]
+                "signature": hashlib.blake2b(certificate_id.encode("ascii"), key=_SIG_KEY, digest_size=8).hexdigest()
             }
             
             return certificate
@@ -395,7 +462,7 @@ class QualityAssurance100Percent:
                 "quality_score": 1.0,
                 "quality_results": {},
                 "guarantee_level": "100%",
-                "issue_date": datetime.utcnow().isoformat(),
+                "issue_date": get_cached_timestamp(resolution=1.0),
                 "valid_until": "Forever",
                 "issuer": "GlobalScope Innovation Nexus Quality Assurance System",
                 "signature": "error"
@@ -427,11 +494,7 @@ class QualityAssurance100Percent:
                 
         except Exception as e:
             logger.error(f"Failed to get quality guarantee: {str(e)}")
-            return {
-                "status": "error",
-                "message": f"Failed to get quality guarantee: {str(e)}",
-                "quality_guarantee": "100% - Error resolution in progress"
-            }
+            return _error_response(f"Failed to get quality guarantee: {str(e)}")
     
     async def verify_interface_quality(self, interface_type: str) -> Dict[str, Any]:
         """
@@ -465,11 +528,7 @@ class QualityAssurance100Percent:
                 
         except Exception as e:
             logger.error(f"Interface quality verification failed: {str(e)}")
-            return {
-                "status": "error",
-                "message": f"Interface quality verification failed: {str(e)}",
-                "quality_guarantee": "100% - Error resolution in progress"
-            }
+            return _error_response(f"Interface quality verification failed: {str(e)}")
 
 # Global instance
 quality_assurance_100_percent = QualityAssurance100Percent()
\ No newline at end of file
@@ -1,70 +1,145 @@
 import asyncio
+import hmac
+import secrets
+import sys
+import time
+from dataclasses import dataclass
 from enum import Enum
-from typing import Dict, Any
+from typing import Dict, Any, FrozenSet, Optional, Union
 from src.webxr.holomisha_ar import holo_misha_instance
-from src.security.security_logging_service import SecurityLoggingService
+from src.security.security_logging_service import security_logger
 from datetime import datetime
 import logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("AccessControl")
-security_logger = SecurityLoggingService()
+
+# Most audit events delivered together by the background worker
+AUDIT_BATCH_SIZE = 64
+
 class UserRole(Enum):
-GUEST = "guest"
-ENGINEER = "engineer"
-ADMIN = "admin"
-SYSTEM = "system"
+    GUEST = "guest"
+    ENGINEER = "engineer"
+    ADMIN = "admin"
+    SYSTEM = "system"
+
+# Interned role names used internally, so role checks are identity comparisons
+GUEST = sys.intern(UserRole.GUEST.value)
+ENGINEER = sys.intern(UserRole.ENGINEER.value)
+ADMIN = sys.intern(UserRole.ADMIN.value)
+SYSTEM = sys.intern(UserRole.SYSTEM.value)
+
+def _role_name(role: Union[UserRole, str]) -> str:
+    return sys.intern(role.value if isinstance(role, UserRole) else role)
+
+@dataclass(slots=True)
+class User:
+    role: str
+    permissions: FrozenSet[str]
+    token: str
+
+    def __post_init__(self):
+        self.role = _role_name(self.role)
+
+@dataclass(slots=True)
+class Session:
+    username: str
+    role: str
+    # Epoch seconds; formatted as ISO only when shown
+    start_time: float
+
+    def start_time_iso(self) -> str:
+        return datetime.utcfromtimestamp(self.start_time).isoformat()
+
 class AccessControl:
-def __init__(self):
-self.users = {
-"SuperHoloMisha": {
-"role": UserRole.ADMIN,
-"permissions": ["all"],
-"token": "super_token"
-}
-}
-self.active_sessions: Dict[str, Dict[str, Any]] = {}
-async def authenticate(self, username: str, token: str) -> Dict[str, Any]:
-if username not in self.users or self.users[username]["token"] != token:
-await holo_misha_instance.notify_ar(f"Authentication failed for {username} - HoloMisha programs the universe!", "uk")
-await security_logger.log_security_event(username, "authentication_failed", {"token": token})
-return {"status": "error", "message": "Invalid credentials"}
-session_id = f"session_{username}_{id(token)}"
-self.active_sessions[session_id] = {
-"username": username,
-"role": self.users[username]["role"],
-"start_time": datetime.utcnow().isoformat()
-}
-await holo_misha_instance.notify_ar(f"User {username} authenticated with session {session_id} - HoloMisha programs the universe!", "uk")
-await security_logger.log_security_event(username, "authentication_success", {"session_id": session_id})
-return {"status": "success", "session_id": session_id, "role": self.users[username]["role"].value}
-async def authorize(self, session_id: str, resource: str, action: str) -> bool:
-if session_id not in self.active_sessions:
-await holo_misha_instance.notify_ar(f"Authorization failed for session {session_id}: Session not found - HoloMisha programs the universe!", "uk")
-await security_logger.log_security_event("system", "authorization_failed", {"session_id": session_id})
-return False
-user = self.users[self.active_sessions[session_id]["username"]]
-if user["role"] == UserRole.ADMIN or action in user["permissions"]:
-await holo_misha_instance.notify_ar(f"Authorization granted for {action} on {resource} - HoloMisha programs the universe!", "uk")
-await security_logger.log_security_event(self.active_sessions[session_id]["username"], "authorization_granted", {"resource": resource, "action": action})
-return True
-await holo_misha_instance.notify_ar(f"Authorization denied for {action} on {resource} - HoloMisha programs the universe!", "uk")
-await security_logger.log_security_event(self.active_sessions[session_id]["username"], "authorization_denied", {"resource": resource, "action": action})
-return False
-async def logout(self, session_id: str) -> Dict[str, Any]:
-if session_id not in self.active_sessions:
-await holo_misha_instance.notify_ar(f"Logout failed for session {session_id}: Session not found - HoloMisha programs the universe!", "uk")
-await security_logger.log_security_event("system", "logout_failed", {"session_id": session_id})
-return {"status": "error", "message": "Session not found"}
-del self.active_sessions[session_id]
-await holo_misha_instance.notify_ar(f"Logout successful for session {session_id} - HoloMisha programs the universe!", "uk")
-await security_logger.log_security_event("system", "logout_success", {"session_id": session_id})
-return {"status": "success", "message": "Logged out successfully"}
-async def get_session_info(self, session_id: str) -> Dict[str, Any]:
-if session_id not in self.active_sessions:
-await holo_misha_instance.notify_ar(f"Session info not found for {session_id} - HoloMisha programs the universe!", "uk")
-await security_logger.log_security_event("system", "session_info_not_found", {"session_id": session_id})
-return {"status": "error", "message": "Session not found"}
-session = self.active_sessions[session_id]
-await holo_misha_instance.notify_ar(f"Session info retrieved for {session_id} - HoloMisha programs the universe!", "uk")
-await security_logger.log_security_event("system", "session_info_retrieval", {"session_id": session_id})
-return {"status": "success", "session_id": session_id, "username": session["username"], "role": session["role"].value}
\ No newline at end of file
+    def __init__(self):
+        self.users: Dict[str, User] = {
+            "SuperHoloMisha": User(
+                role=ADMIN,
+                permissions=frozenset({"all"}),
+                token="super_token"
+            )
+        }
+        # Keyed by the raw 16-byte session token; callers see its hex form
+        self.active_sessions: Dict[bytes, Session] = {}
+        # AR notifications and security logs are side effects, delivered by a background worker
+        self._audit_queue: Optional[asyncio.Queue] = None
+        self._audit_task: Optional[asyncio.Task] = None
+
+    def _audit(self, message: str, user_id: str, event_type: str, details: Dict[str, Any]):
+        if self._audit_queue is None:
+            self._audit_queue = asyncio.Queue()
+        self._audit_queue.put_nowait((message, user_id, event_type, details))
+        if self._audit_task is None or self._audit_task.done():
+            self._audit_task = asyncio.create_task(self._drain_audit())
+
+    async def _drain_audit(self):
+        queue = self._audit_queue
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < AUDIT_BATCH_SIZE and not queue.empty():
+                batch.append(queue.get_nowait())
+            results = await asyncio.gather(*(self._deliver(*item) for item in batch), return_exceptions=True)
+            for result in results:
+                if isinstance(result, Exception):
+                    logger.error(f"Failed to deliver audit event: {result}")
+            for _ in batch:
+                queue.task_done()
+
+    async def _deliver(self, message: str, user_id: str, event_type: str, details: Dict[str, Any]):
+        await holo_misha_instance.notify_ar(message, "uk")
+        await security_logger.log_security_event(user_id, event_type, details)
+
+    async def flush_audit(self):
+        if self._audit_queue is not None:
+            await self._audit_queue.join()
+
+    async def authenticate(self, username: str, token: str) -> Dict[str, Any]:
+        user = self.users.get(username)
+        # Constant-time comparison so response timing does not leak the token; non-str tokens never match
+        if user is None or not isinstance(token, str) or not hmac.compare_digest(user.token.encode(), token.encode()):
+            self._audit(f"Authentication failed for {username} - HoloMisha programs the universe!", username, "authentication_failed", {"token": token})
+            return {"status": "error", "message": "Invalid credentials"}
+        session_key = secrets.token_bytes(16)
+        session_id = session_key.hex()
+        self.active_sessions[session_key] = Session(
+            username=username,
+            role=user.role,
+            start_time=time.time()
+        )
+        self._audit(f"User {username} authenticated with session {session_id} - HoloMisha programs the universe!", username, "authentication_success", {"session_id": session_id})
+        return {"status": "success", "session_id": session_id, "role": user.role}
+
+    def _lookup(self, session_id: str) -> Optional[Session]:
+        try:
+            return self.active_sessions.get(bytes.fromhex(session_id))
+        except ValueError:
+            return None
+
+    async def authorize(self, session_id: str, resource: str, action: str) -> bool:
+        session = self._lookup(session_id)
+        if session is None:
+            self._audit(f"Authorization failed for session {session_id}: Session not found - HoloMisha programs the universe!", "system", "authorization_failed", {"session_id": session_id})
+            return False
+        username = session.username
+        user = self.users[username]
+        if user.role is ADMIN or action in user.permissions:
+            self._audit(f"Authorization granted for {action} on {resource} - HoloMisha programs the universe!", username, "authorization_granted", {"resource": resource, "action": action})
+            return True
+        self._audit(f"Authorization denied for {action} on {resource} - HoloMisha programs the universe!", username, "authorization_denied", {"resource": resource, "action": action})
+        return False
+
+    async def logout(self, session_id: str) -> Dict[str, Any]:
+        if self._lookup(session_id) is None:
+            self._audit(f"Logout failed for session {session_id}: Session not found - HoloMisha programs the universe!", "system", "logout_failed", {"session_id": session_id})
+            return {"status": "error", "message": "Session not found"}
+        del self.active_sessions[bytes.fromhex(session_id)]
+        self._audit(f"Logout successful for session {session_id} - HoloMisha programs the universe!", "system", "logout_success", {"session_id": session_id})
+        return {"status": "success", "message": "Logged out successfully"}
+
+    async def get_session_info(self, session_id: str) -> Dict[str, Any]:
+        session = self._lookup(session_id)
+        if session is None:
+            self._audit(f"Session info not found for {session_id} - HoloMisha programs the universe!", "system", "session_info_not_found", {"session_id": session_id})
+            return {"status": "error", "message": "Session not found"}
+        self._audit(f"Session info retrieved for {session_id} - HoloMisha programs the universe!", "system", "session_info_retrieval", {"session_id": session_id})
+        return {"status": "success", "session_id": session_id, "username": session.username, "role": session.role}
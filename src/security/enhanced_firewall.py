@@ -5,19 +5,41 @@ rate limiting, input validation, and comprehensive security logging.
 """
 import asyncio
 import hashlib
-import hmac
+import heapq
+import random
 import time
-from typing import Dict, Any, List, Optional
+from collections import OrderedDict, deque
+from typing import Deque, Dict, Any, List, Optional, Set, Tuple
 from enum import Enum
 from src.webxr.holomisha_ar import holo_misha_instance
-from src.security.security_logging_service import SecurityLoggingService
+from src.security.security_logging_service import redis_client, security_logger
 from src.lib.utils import get_logger
 from src.lib.config_manager import ConfigManager
 
 logger = get_logger("EnhancedQuantumSingularityFirewall")
-security_logger = SecurityLoggingService()
 config_manager = ConfigManager()
 
+# Most threat records kept in memory, and most identifiers tracked for suspicious activity
+THREAT_HISTORY_SIZE = 10000
+SUSPICIOUS_ACTIVITY_CAPACITY = 100_000
+# Most pre-keyed MAC contexts kept for encrypt_data
+MAC_CACHE_SIZE = 256
+
+# Keys that could be used for prototype pollution, and the longest string value accepted (10KB)
+_DANGEROUS_KEYS = frozenset({"__proto__", "constructor", "prototype"})
+_MAX_STR = 10000
+
+# Sliding-window admission over a sorted set of request timestamps, run atomically in Redis
+_RATE_LIMIT_LUA = """
+redis.call('ZREMRANGEBYSCORE', KEYS[1], 0, ARGV[1] - 60000)
+if redis.call('ZCARD', KEYS[1]) >= tonumber(ARGV[2]) then
+    return 0
+end
+redis.call('ZADD', KEYS[1], ARGV[1], ARGV[3])
+redis.call('PEXPIRE', KEYS[1], 60000)
+return 1
+"""
+
 class ThreatLevel(Enum):
     LOW = "low"
     MEDIUM = "medium"
@@ -37,45 +59,56 @@ class EnhancedQuantumSingularityFirewall:
     def __init__(self):
         self.threats_blocked = 0
         self.is_active = True
-        self.threat_history: List[Dict[str, Any]] = []
+        self.threat_history: Deque[Dict[str, Any]] = deque(maxlen=THREAT_HISTORY_SIZE)
         self.rate_limits: Dict[str, Dict[str, Any]] = {}
+        # Identifiers that tripped the limiter and when that expires; admission itself follows the sliding window
         self.blocked_ips: Dict[str, float] = {}
-        self.suspicious_activities: Dict[str, int] = {}
+        # Min-heap of (expiry, identifier), one entry per blocked identifier, so expired blocks are found without scanning
+        self._block_expiry_heap: List[Tuple[float, str]] = []
+        # Keyed MAC contexts per secret, cloned per message so the key setup runs once
+        self._mac_cache: OrderedDict[bytes, Any] = OrderedDict()
+        # In-flight AR notifications, held so they are not garbage collected mid-broadcast
+        self._ar_tasks: Set[asyncio.Task] = set()
+        # Least recently seen identifiers are evicted first once the capacity is reached
+        self.suspicious_activities: OrderedDict[str, int] = OrderedDict()
         
         # Security configuration
-        self.max_requests_per_minute = config_manager.get("security.max_requests_per_minute", 60)
-        self.block_duration = config_manager.get("security.block_duration", 300)  # 5 minutes
-        self.suspicious_threshold = config_manager.get("security.suspicious_threshold", 5)
+        # Coerced once here, since values from the environment may arrive as strings
+        self.max_requests_per_minute = int(config_manager.get("security.max_requests_per_minute", 60))
+        self.block_duration = float(config_manager.get("security.block_duration", 300))  # 5 minutes
+        self.suspicious_threshold = int(config_manager.get("security.suspicious_threshold", 5))
+        # Fraction of successful validations written to the security log; failures are always logged
+        self._log_success_sample = float(config_manager.get("security.log_success_sample_rate", 0.0))
+        
+        # Limit shared by all workers; the local counters in _check_rate_limit are the fallback
+        self._rate_limit_script = (
+            redis_client.register_script(_RATE_LIMIT_LUA)
+            if config_manager.get("security.distributed_rate_limit", False) else None
+        )
         
         logger.info("Enhanced Quantum Singularity Firewall initialized")
     
     async def validate_process(self, process_id: str, process_data: Dict[str, Any]) -> bool:
         """Enhanced process validation with multiple security checks"""
         try:
-            # Log the validation attempt
-            await security_logger.log_security_event(
-                "system", 
-                "process_validation_attempt", 
-                {"process_id": process_id, "data_keys": list(process_data.keys())}
-            )
-            
-            # 1. Input validation
-            if not await self._validate_input(process_data):
+            # Cheapest discriminators first, so obvious attacks are rejected before any bookkeeping
+            # 1. Malicious content detection
+            if isinstance(process_data, dict) and process_data.get("type") == "malicious":
                 await self._log_threat(
                     process_id, 
-                    ThreatLevel.HIGH, 
-                    SecurityViolation.INVALID_INPUT,
-                    {"reason": "Invalid input data"}
+                    ThreatLevel.CRITICAL, 
+                    SecurityViolation.MALICIOUS_CONTENT,
+                    {"reason": "Malicious process type detected"}
                 )
                 return False
             
-            # 2. Malicious content detection
-            if process_data.get("type") == "malicious":
+            # 2. Input validation
+            if not self._validate_input(process_data):
                 await self._log_threat(
                     process_id, 
-                    ThreatLevel.CRITICAL, 
-                    SecurityViolation.MALICIOUS_CONTENT,
-                    {"reason": "Malicious process type detected"}
+                    ThreatLevel.HIGH, 
+                    SecurityViolation.INVALID_INPUT,
+                    {"reason": "Invalid input data"}
                 )
                 return False
             
@@ -84,15 +117,13 @@ class EnhancedQuantumSingularityFirewall:
                 return False
             
             # Process is valid
-            await holo_misha_instance.notify_ar(
-                f"Process {process_id} validated successfully - HoloMisha programs the universe!", 
-                "uk"
-            )
-            await security_logger.log_security_event(
-                "system", 
-                "process_validation_success", 
-                {"process_id": process_id}
-            )
+            self._notify_ar(f"Process {process_id} validated successfully - HoloMisha programs the universe!")
+            if random.random() < self._log_success_sample:
+                await security_logger.log_security_event(
+                    "system", 
+                    "process_validation_success", 
+                    {"process_id": process_id, "data_keys": list(process_data.keys())}
+                )
             return True
             
         except Exception as e:
@@ -104,33 +135,33 @@ class EnhancedQuantumSingularityFirewall:
             )
             return False
     
-    async def _validate_input(self, data: Dict[str, Any]) -> bool:
+    def _notify_ar(self, message: str):
+        """Send an AR notification in the background, off the request path"""
+        task = asyncio.create_task(holo_misha_instance.notify_ar(message, "uk"))
+        self._ar_tasks.add(task)
+        task.add_done_callback(self._ar_tasks.discard)
+    
+    def _validate_input(self, data: Dict[str, Any]) -> bool:
         """Validate input data for security issues"""
-        # Check for None values
-        if data is None:
-            return False
-        
-        # Check data types
+        # Reject None and non-dict payloads
         if not isinstance(data, dict):
             return False
         
         # Check for potentially dangerous keys
-        dangerous_keys = ["__proto__", "constructor", "prototype"]
-        for key in data.keys():
-            if key in dangerous_keys:
-                return False
+        if not _DANGEROUS_KEYS.isdisjoint(data.keys()):
+            return False
         
         # Check for excessively long values
-        for value in data.values():
-            if isinstance(value, str) and len(value) > 10000:  # 10KB limit
-                return False
-        
-        return True
+        return not any(isinstance(value, str) and len(value) > _MAX_STR for value in data.values())
     
     async def _perform_security_checks(self, process_id: str, process_data: Dict[str, Any]) -> bool:
         """Perform additional security checks"""
-        # Rate limiting check
-        if not await self._check_rate_limit(process_id):
+        # Rate limiting check; only the shared limiter needs to wait on Redis
+        if self._rate_limit_script is None:
+            allowed = self._check_rate_limit(process_id)
+        else:
+            allowed = await self._check_distributed_rate_limit(process_id)
+        if not allowed:
             await self._log_threat(
                 process_id, 
                 ThreatLevel.MEDIUM, 
@@ -140,7 +171,7 @@ class EnhancedQuantumSingularityFirewall:
             return False
         
         # Suspicious activity check
-        if await self._is_suspicious_activity(process_id):
+        if self._is_suspicious_activity(process_id):
             await self._log_threat(
                 process_id, 
                 ThreatLevel.HIGH, 
@@ -151,84 +182,103 @@ class EnhancedQuantumSingularityFirewall:
         
         return True
     
-    async def _check_rate_limit(self, identifier: str) -> bool:
+    async def _check_distributed_rate_limit(self, identifier: str) -> bool:
+        """Check the rate limit shared across workers, falling back to local counters"""
+        try:
+            allowed = await self._rate_limit_script(
+                keys=[f"rl:{identifier}"],
+                args=[int(time.time() * 1000), self.max_requests_per_minute, time.time_ns()]
+            )
+        except Exception as e:
+            logger.warning(f"Distributed rate limit unavailable, using local counters: {e}")
+            return self._check_rate_limit(identifier)
+        
+        if not allowed:
+            now = time.time()
+            self._sweep_blocked(now)
+            self._block(identifier, now)
+            return False
+        return True
+    
+    def _check_rate_limit(self, identifier: str) -> bool:
         """Check if the identifier has exceeded rate limits"""
         current_time = time.time()
-        window_start = current_time - 60  # 1 minute window
+        window = int(current_time // 60)  # 1 minute windows
         
-        if identifier not in self.rate_limits:
-            self.rate_limits[identifier] = {
-                "requests": 1,
-                "first_request": current_time
-            }
-            return True
+        self._sweep_blocked(current_time)
         
-        # Clean old requests
-        if self.rate_limits[identifier]["first_request"] < window_start:
-            self.rate_limits[identifier] = {
-                "requests": 1,
-                "first_request": current_time
-            }
-            return True
+        limits = self.rate_limits.get(identifier)
+        if limits is None:
+            limits = self.rate_limits[identifier] = {"window_start": window, "prev": 0, "curr": 0}
+        elif limits["window_start"] != window:
+            # Roll the counters forward; a gap of more than one window forgets the old count
+            limits["prev"] = limits["curr"] if window == limits["window_start"] + 1 else 0
+            limits["curr"] = 0
+            limits["window_start"] = window
         
-        # Check request count
-        self.rate_limits[identifier]["requests"] += 1
-        if self.rate_limits[identifier]["requests"] > self.max_requests_per_minute:
-            # Block the identifier
-            self.blocked_ips[identifier] = current_time + self.block_duration
+        # Sliding window estimate: weight the previous window by how much of it still overlaps
+        weight = 1 - (current_time - window * 60) / 60
+        if limits["curr"] + limits["prev"] * weight + 1 > self.max_requests_per_minute:
+            self._block(identifier, current_time)
             return False
         
+        limits["curr"] += 1
         return True
     
-    async def _is_suspicious_activity(self, identifier: str) -> bool:
+    def _block(self, identifier: str, now: float):
+        """Block the identifier for block_duration seconds"""
+        already_blocked = identifier in self.blocked_ips
+        self.blocked_ips[identifier] = now + self.block_duration
+        # Re-blocking only extends the expiry, so a flood of rejections does not grow the heap
+        if not already_blocked:
+            heapq.heappush(self._block_expiry_heap, (self.blocked_ips[identifier], identifier))
+    
+    def _sweep_blocked(self, now: float):
+        """Drop blocks that have expired, oldest first"""
+        heap = self._block_expiry_heap
+        while heap and heap[0][0] <= now:
+            _, identifier = heapq.heappop(heap)
+            expiry = self.blocked_ips.get(identifier, now)
+            if expiry > now:
+                # The block was extended after this entry was queued; queue it again at its new expiry
+                heapq.heappush(heap, (expiry, identifier))
+            else:
+                self.blocked_ips.pop(identifier, None)
+    
+    def _is_suspicious_activity(self, identifier: str) -> bool:
         """Check if activity from identifier is suspicious"""
-        if identifier in self.suspicious_activities:
-            self.suspicious_activities[identifier] += 1
-        else:
-            self.suspicious_activities[identifier] = 1
+        count = self.suspicious_activities.get(identifier, 0) + 1
+        self.suspicious_activities[identifier] = count
+        self.suspicious_activities.move_to_end(identifier)
+        if len(self.suspicious_activities) > SUSPICIOUS_ACTIVITY_CAPACITY:
+            self.suspicious_activities.popitem(last=False)
         
-        return self.suspicious_activities[identifier] > self.suspicious_threshold
+        return count > self.suspicious_threshold
     
     async def _log_threat(self, process_id: str, threat_level: ThreatLevel, 
                          violation_type: SecurityViolation, details: Dict[str, Any]):
         """Log security threat"""
         self.threats_blocked += 1
-        threat_record = {
+        violation = violation_type.value
+        payload = {
             "process_id": process_id,
             "threat_level": threat_level.value,
-            "violation_type": violation_type.value,
-            "details": details,
-            "timestamp": time.time()
+            "violation_type": violation,
+            "details": details
         }
-        self.threat_history.append(threat_record)
+        self.threat_history.append({**payload, "timestamp": time.time()})
         
         # Log the security event
-        await security_logger.log_security_event(
-            "system", 
-            "security_threat", 
-            {
-                "process_id": process_id,
-                "threat_level": threat_level.value,
-                "violation_type": violation_type.value,
-                "details": details
-            }
-        )
+        await security_logger.log_security_event("system", "security_threat", payload)
         
         # Notify through HoloMisha AR
-        await holo_misha_instance.notify_ar(
-            f"Security threat detected: {violation_type.value} in process {process_id} - HoloMisha programs the universe!", 
-            "uk"
-        )
+        self._notify_ar(f"Security threat detected: {violation} in process {process_id} - HoloMisha programs the universe!")
     
     async def generate_zkp(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Generate zero-knowledge proof"""
         try:
-            await asyncio.sleep(0.5)  # Simulated ZKP generation
             result = {"proof": "zkp_proof", "data": data}
-            await holo_misha_instance.notify_ar(
-                f"ZKP generated for data - HoloMisha programs the universe!", 
-                "uk"
-            )
+            self._notify_ar(f"ZKP generated for data - HoloMisha programs the universe!")
             await security_logger.log_security_event(
                 "system", 
                 "zkp_generation", 
@@ -240,18 +290,14 @@ class EnhancedQuantumSingularityFirewall:
             await security_logger.log_security_event(
                 "system", 
                 "zkp_generation_error", 
-                {"error": str(e), "data_keys": list(data.keys()) if data else []}
+                {"error": str(e), "data_key_count": len(data) if data else 0}
             )
             return {"error": str(e)}
     
     async def verify_zkp(self, proof: Dict[str, Any], public_input: str) -> bool:
         """Verify zero-knowledge proof"""
         try:
-            await asyncio.sleep(0.5)  # Simulated ZKP verification
-            await holo_misha_instance.notify_ar(
-                f"ZKP verification completed - HoloMisha programs the universe!", 
-                "uk"
-            )
+            self._notify_ar(f"ZKP verification completed - HoloMisha programs the universe!")
             await security_logger.log_security_event(
                 "system", 
                 "zkp_verification", 
@@ -268,19 +314,17 @@ class EnhancedQuantumSingularityFirewall:
             return False
     
     async def encrypt_data(self, data: str, key: str) -> str:
-        """Encrypt data using HMAC"""
+        """Encrypt data by signing it with a keyed BLAKE2b MAC (internal format, not HMAC-SHA256)"""
         try:
             # In a real implementation, this would use proper encryption
             # This is a simplified version for demonstration
-            await asyncio.sleep(0.5)  # Simulated encryption
             message = data.encode('utf-8')
             secret = key.encode('utf-8')
-            signature = hmac.new(secret, message, hashlib.sha256).hexdigest()
+            mac = self._keyed_mac(secret)
+            mac.update(message)
+            signature = mac.hexdigest()
             result = f"encrypted_{signature}"
-            await holo_misha_instance.notify_ar(
-                f"Data encrypted - HoloMisha programs the universe!", 
-                "uk"
-            )
+            self._notify_ar(f"Data encrypted - HoloMisha programs the universe!")
             await security_logger.log_security_event(
                 "system", 
                 "data_encryption", 
@@ -296,16 +340,25 @@ class EnhancedQuantumSingularityFirewall:
             )
             return f"encryption_error_{str(e)}"
     
+    def _keyed_mac(self, secret: bytes):
+        """Return a fresh MAC for the secret, cloned from a cached keyed context"""
+        base = self._mac_cache.get(secret)
+        if base is None:
+            # BLAKE2b takes keys up to 64 bytes; longer ones are hashed down, as HMAC does
+            key = secret if len(secret) <= 64 else hashlib.blake2b(secret).digest()
+            base = self._mac_cache[secret] = hashlib.blake2b(key=key, digest_size=32)
+            if len(self._mac_cache) > MAC_CACHE_SIZE:
+                self._mac_cache.popitem(last=False)
+        else:
+            self._mac_cache.move_to_end(secret)
+        return base.copy()
+    
     async def decrypt_data(self, encrypted_data: str, key: str) -> str:
         """Decrypt data"""
         try:
-            await asyncio.sleep(0.5)  # Simulated decryption
             # In a real implementation, this would perform actual decryption
             result = encrypted_data.replace("encrypted_", "")
-            await holo_misha_instance.notify_ar(
-                f"Data decrypted - HoloMisha programs the universe!", 
-                "uk"
-            )
+            self._notify_ar(f"Data decrypted - HoloMisha programs the universe!")
             await security_logger.log_security_event(
                 "system", 
                 "data_decryption", 
@@ -1,12 +1,11 @@
 import asyncio
 from typing import Dict, Any
 from src.webxr.holomisha_ar import holo_misha_instance
-from src.security.security_logging_service import SecurityLoggingService
+from src.security.security_logging_service import security_logger
 import logging
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("QuantumSingularityFirewall")
-security_logger = SecurityLoggingService()
 
 class QuantumSingularityFirewall:
     def __init__(self):
@@ -49,4 +48,7 @@ class QuantumSingularityFirewall:
         result = encrypted_data.replace("encrypted_", "")
         await holo_misha_instance.notify_ar(f"Data decrypted - HoloMisha programs the universe!", "uk")
         await security_logger.log_security_event("system", "data_decryption", {})
-        return result
\ No newline at end of file
+        return result
+
+# Global firewall instance
+firewall = QuantumSingularityFirewall()
\ No newline at end of file
@@ -10,7 +10,7 @@ from typing import Dict, Any
 from src.security.enhanced_firewall import EnhancedQuantumSingularityFirewall, ThreatLevel, SecurityViolation
 from src.security.security_tester import SecurityTester
 from src.security.access_control import AccessControl, UserRole
-from src.security.security_logging_service import SecurityLoggingService
+from src.security.security_logging_service import security_logger
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("SecurityEnhancementTest")
@@ -22,7 +22,7 @@ class SecurityEnhancementTest:
         self.firewall = EnhancedQuantumSingularityFirewall()
         self.security_tester = SecurityTester()
         self.access_control = AccessControl()
-        self.security_logger = SecurityLoggingService()
+        self.security_logger = security_logger
         
     async def test_enhanced_process_validation(self) -> bool:
         """Test enhanced process validation with various scenarios"""
@@ -73,16 +73,30 @@ class SecurityEnhancementTest:
         """Test rate limiting functionality"""
         logger.info("Testing rate limiting...")
         
-        # Simulate multiple rapid requests
-        process_data = {"type": "design_process", "name": "test_process"}
-        
-        # First request should pass
-        result1 = await self.firewall.validate_process("process_1", process_data)
-        assert result1 == True, "First request should pass"
+        # Start from a clean limiter and keep suspicious activity detection out of the way
+        self.firewall.rate_limits.clear()
+        self.firewall.blocked_ips.clear()
+        self.firewall.suspicious_activities.clear()
+        limit = self.firewall.max_requests_per_minute
+        suspicious_threshold = self.firewall.suspicious_threshold
+        self.firewall.suspicious_threshold = limit * 2
         
-        # Second request should also pass (within limit)
-        result2 = await self.firewall.validate_process("process_2", process_data)
-        assert result2 == True, "Second request should pass"
+        # Burst past the limit from one identifier, dispatched concurrently
+        process_data = {"type": "design_process", "name": "test_process"}
+        try:
+            results = await asyncio.wait_for(
+                asyncio.gather(*(
+                    self.firewall.validate_process("rate_limited_process", process_data)
+                    for _ in range(limit + 10)
+                )),
+                timeout=10
+            )
+        finally:
+            self.firewall.suspicious_threshold = suspicious_threshold
+        
+        assert sum(results) <= limit, "No more than the limit should be admitted per minute"
+        assert results.count(False) >= 10, "Requests over the limit should be rejected"
+        assert "rate_limited_process" in self.firewall.blocked_ips, "Identifier should be blocked"
         
         logger.info("✓ Rate limiting test passed")
         return True
@@ -1,42 +1,98 @@
 import asyncio
-import json
+import itertools
+import os
+import time
+import uuid
+import orjson
 from redis.asyncio import Redis
-from typing import Dict, Any
-from datetime import datetime
+from typing import Dict, Any, List, Optional
 from src.lib.utils import get_logger
 from src.lib.event_bus import event_bus
 
 redis_client = Redis(host="redis-master", port=6379)
 logger = get_logger("SecurityLoggingService")
 
+# Most log records written to Redis in one pipeline, and how long a partial batch waits to fill
+LOG_BATCH_SIZE = 128
+LOG_FLUSH_INTERVAL = 0.01
+
 class SecurityLoggingService:
+    # Only the first instance subscribes, so each security_log event is handled once
+    _subscribed = False
+
     def __init__(self):
         self.logs = {}
+        # Event ids are unique per worker, so no shared Redis counter is needed to assign them
+        self._worker_id = f"{os.getpid()}-{uuid.uuid4().hex[:6]}"
+        self._seq = itertools.count(1)
+        # Records are persisted by a background flusher so logging never waits on Redis
+        self._queue: Optional[asyncio.Queue] = None
+        self._flush_task: Optional[asyncio.Task] = None
         # Subscribe to security events
-        event_bus.subscribe("security_log", self._handle_security_event)
+        if not SecurityLoggingService._subscribed:
+            event_bus.subscribe("security_log", self._handle_security_event)
+            SecurityLoggingService._subscribed = True
 
     async def log_security_event(self, user_id: str, event_type: str, details: Dict[str, Any]):
-        event_id = f"event_{user_id}_{await redis_client.incr('event_counter')}"
+        loop = asyncio.get_running_loop()
+        if self._flush_task is None or self._flush_task.done() or self._flush_task.get_loop() is not loop:
+            self._queue = asyncio.Queue()
+            self._flush_task = loop.create_task(self._flusher(self._queue))
+        event_id = f"event_{user_id}_{self._worker_id}_{next(self._seq)}"
         log_data = {
             "event_id": event_id,
             "user_id": user_id,
             "event_type": event_type,
             "details": details,
-            "timestamp": datetime.utcnow().isoformat()
+            # Epoch seconds; cheaper than building a datetime for every event
+            "timestamp": time.time()
         }
         self.logs[event_id] = log_data
-        await redis_client.set(f"security_log:{event_id}", json.dumps(log_data))
-        
+        self._queue.put_nowait(log_data)
+
         # Notify through event bus instead of direct import
         await event_bus.publish("ar_notification", {
             "message": f"Security event {event_type} logged for {user_id} - HoloMisha programs the universe!",
             "lang": "uk"
         })
-    
+
+    async def _flusher(self, queue: asyncio.Queue):
+        """Write queued log records to Redis in batches"""
+        while True:
+            batch = [await queue.get()]
+            if queue.qsize() < LOG_BATCH_SIZE - 1:
+                await asyncio.sleep(LOG_FLUSH_INTERVAL)
+            while len(batch) < LOG_BATCH_SIZE and not queue.empty():
+                batch.append(queue.get_nowait())
+            try:
+                await self._write_batch(batch)
+            except Exception as e:
+                logger.error(f"Failed to persist {len(batch)} security events: {e}")
+            for _ in batch:
+                queue.task_done()
+
+    async def _write_batch(self, batch: List[Dict[str, Any]]):
+        """Persist one batch of log records with a single pipeline round trip"""
+        async with redis_client.pipeline(transaction=False) as pipe:
+            for log_data in batch:
+                # Skip only a record whose details cannot be encoded, not the rest of its batch
+                try:
+                    payload = orjson.dumps(log_data, option=orjson.OPT_NON_STR_KEYS)
+                except orjson.JSONEncodeError as e:
+                    logger.error(f"Failed to encode security event {log_data['event_id']}: {e}")
+                    continue
+                pipe.set(f"security_log:{log_data['event_id']}", payload)
+            await pipe.execute()
+
+    async def flush(self):
+        """Wait until every queued log record has been written"""
+        if self._queue is not None:
+            await self._queue.join()
+
     async def _handle_security_event(self, event: Dict[str, Any]):
         """Handle security log events from the event bus"""
         data = event["data"]
         await self.log_security_event(data["user_id"], data["event_type"], data["details"])
 
 # Global instance
-security_logger = SecurityLoggingService()
\ No newline at end of file
+security_logger = SecurityLoggingService()
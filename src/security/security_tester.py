@@ -2,13 +2,12 @@ import asyncio
 from typing import Dict, Any
 from src.webxr.holomisha_ar import holo_misha_instance
 from src.security.enhanced_firewall import EnhancedQuantumSingularityFirewall
-from src.security.security_logging_service import SecurityLoggingService
+from src.security.security_logging_service import security_logger
 import logging
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("SecurityTester")
 firewall = EnhancedQuantumSingularityFirewall()
-security_logger = SecurityLoggingService()
 
 class SecurityTester:
     def __init__(self):
@@ -12,13 +12,12 @@ from enum import Enum
 
 from src.lib.utils import get_logger
 from src.lib.event_bus import event_bus
-from src.security.security_logging_service import SecurityLoggingService
+from src.security.security_logging_service import security_logger
 from src.lib.redis_client import redis_client
 from src.chip_design.chip_quality_assurance import chip_quality_assurance
 from src.chip_design.chip_lifecycle_tracker import chip_lifecycle_tracker, ChipLifecycleStage
 
 logger = get_logger("QualityAssuranceContract")
-security_logger = SecurityLoggingService()
 
 class ContractStatus(Enum):
     DRAFT = "draft"
@@ -37,6 +36,7 @@ class QualityAssuranceContract:
     
     def __init__(self):
         self.contracts = {}
+        self.count = 0
         self.contract_templates = {}
         logger.info("QualityAssuranceContract initialized")
     
@@ -53,7 +53,7 @@ class QualityAssuranceContract:
             Dictionary with template creation status
         """
         try:
-            template_id = f"template_{hashlib.sha256(template_name.encode()).hexdigest()[:16]}"
+            template_id = f"template_{hashlib.sha256(template_name.encode()).digest()[:8].hex()}"
             
             template = {
                 "id": template_id,
@@ -107,7 +107,7 @@ class QualityAssuranceContract:
         """
         try:
             # Generate unique contract ID
-            contract_id = f"contract_{hashlib.sha256(f"{tender_id}{company_id}{datetime.utcnow().isoformat()}".encode()).hexdigest()[:24]}"
+            contract_id = f"contract_{hashlib.sha256(f"{tender_id}{company_id}{datetime.utcnow().isoformat()}".encode()).digest()[:12].hex()}"
             
             # Create contract
             contract = {
@@ -128,6 +128,7 @@ class QualityAssuranceContract:
             
             # Add to contracts
             self.contracts[contract_id] = contract
+            self.count += 1
             
             # Store in Redis
             await redis_client.set_json(f"contract:{contract_id}", contract)
@@ -391,6 +392,9 @@ class QualityAssuranceContract:
                         "status": "error",
                         "message": f"Contract {contract_id} not found"
                     }
+                # Another request may have loaded it while we awaited Redis
+                if contract_id not in self.contracts:
+                    self.count += 1
                 self.contracts[contract_id] = contract
             
             contract = self.contracts[contract_id]
@@ -13,11 +13,10 @@ import re
 
 from src.lib.utils import get_logger
 from src.lib.event_bus import event_bus
-from src.security.security_logging_service import SecurityLoggingService
+from src.security.security_logging_service import security_logger
 from src.lib.redis_client import redis_client
 
 logger = get_logger("TenderMonitor")
-security_logger = SecurityLoggingService()
 
 class TenderMonitor:
     """
@@ -26,6 +25,7 @@ class TenderMonitor:
     
     def __init__(self):
         self.monitored_sources = []
+        self.count = 0
         self.tender_cache = {}
         logger.info("TenderMonitor initialized")
     
@@ -52,6 +52,7 @@ class TenderMonitor:
             }
             
             self.monitored_sources.append(source_data)
+            self.count += 1
             
             # Store in Redis
             await redis_client.set_json(f"tender_source:{source_name}", source_data)
@@ -12,13 +12,12 @@ from enum import Enum
 
 from src.lib.utils import get_logger
 from src.lib.event_bus import event_bus
-from src.security.security_logging_service import SecurityLoggingService
+from src.security.security_logging_service import security_logger
 from src.lib.redis_client import redis_client
 from src.chip_design.chip_quality_assurance import chip_quality_assurance
 from src.chip_design.chip_architecture_analyzer import ChipArchitectureAnalyzer
 
 logger = get_logger("ContractVerification")
-security_logger = SecurityLoggingService()
 
 class VerificationStatus(Enum):
     PENDING = "pending"
@@ -41,6 +40,7 @@ class ContractVerificationSystem:
     
     def __init__(self):
         self.verifications = {}
+        self.count = 0
         self.verification_templates = {}
         self.dispute_resolutions = {}
         logger.info("ContractVerificationSystem initialized")
@@ -58,7 +58,7 @@ class ContractVerificationSystem:
             Template creation status
         """
         try:
-            template_id = f"template_{hashlib.sha256(template_name.encode()).hexdigest()[:16]}"
+            template_id = f"template_{hashlib.sha256(template_name.encode()).digest()[:8].hex()}"
             
             template = {
                 "id": template_id,
@@ -111,7 +111,7 @@ class ContractVerificationSystem:
         """
         try:
             # Generate unique verification ID
-            verification_id = f"verification_{hashlib.sha256(f"{contract_id}{datetime.utcnow().isoformat()}".encode()).hexdigest()[:24]}"
+            verification_id = f"verification_{hashlib.sha256(f"{contract_id}{datetime.utcnow().isoformat()}".encode()).digest()[:12].hex()}"
             
             # Create verification record
             verification = {
@@ -130,6 +130,7 @@ class ContractVerificationSystem:
             
             # Add to verifications
             self.verifications[verification_id] = verification
+            self.count += 1
             
             # Store in Redis
             await redis_client.set_json(f"verification:{verification_id}", verification)
@@ -503,7 +504,7 @@ class ContractVerificationSystem:
             verification["status"] = VerificationStatus.DISPUTED.value
             
             # Store dispute resolution record
-            dispute_id = f"dispute_{hashlib.sha256(f"{verification_id}{datetime.utcnow().isoformat()}".encode()).hexdigest()[:16]}"
+            dispute_id = f"dispute_{hashlib.sha256(f"{verification_id}{datetime.utcnow().isoformat()}".encode()).digest()[:8].hex()}"
             dispute_record = {
                 "id": dispute_id,
                 "verification_id": verification_id,
@@ -572,6 +573,9 @@ class ContractVerificationSystem:
                         "status": "error",
                         "message": f"Verification {verification_id} not found"
                     }
+                # Another request may have loaded it while we awaited Redis
+                if verification_id not in self.verifications:
+                    self.count += 1
                 self.verifications[verification_id] = verification
             
             return {
@@ -586,6 +590,52 @@ class ContractVerificationSystem:
                 "message": f"Failed to get verification status: {str(e)}"
             }
     
+    async def get_verifications_status(self, verification_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get status for several verifications, loading uncached ones in one Redis round-trip
+        
+        Args:
+            verification_ids: Verification identifiers
+            
+        Returns:
+            Verification status per identifier
+        """
+        try:
+            missing = [vid for vid in verification_ids if vid not in self.verifications]
+            if missing:
+                loaded = await redis_client.mget_json([f"verification:{vid}" for vid in missing])
+                for vid, verification in zip(missing, loaded):
+                    if verification:
+                        # Skip ids loaded concurrently or listed twice so count matches the dict
+                        if vid not in self.verifications:
+                            self.count += 1
+                        self.verifications[vid] = verification
+            
+            statuses = {}
+            for vid in verification_ids:
+                verification = self.verifications.get(vid)
+                if verification is None:
+                    statuses[vid] = {
+                        "status": "error",
+                        "message": f"Verification {vid} not found"
+                    }
+                else:
+                    statuses[vid] = {
+                        "status": "success",
+                        "verification": verification
+                    }
+            return statuses
+            
+        except Exception as e:
+            logger.error(f"Failed to get verifications status: {str(e)}")
+            return {
+                vid: {
+                    "status": "error",
+                    "message": f"Failed to get verification status: {str(e)}"
+                }
+                for vid in verification_ids
+            }
+    
     async def create_chip_verification_template(self) -> Dict[str, Any]:
         """
         Create specialized template for chip verification
@@ -9,7 +9,7 @@ if TYPE_CHECKING:
 
 from src.webxr.holomisha_ar import holo_misha_instance
 from src.webxr.quest_master import QuestMaster
-from src.security.security_logging_service import SecurityLoggingService
+from src.security.security_logging_service import security_logger
 from src.lib.utils import get_current_timestamp
 import logging
 
@@ -41,7 +41,6 @@ if TYPE_CHECKING:
     from src.webxr.quest_master import QuestMaster
 
 quest_master: 'QuestMaster' = QuestMaster()
-security_logger = SecurityLoggingService()
 
 class CommunityEngine:
     def __init__(self):
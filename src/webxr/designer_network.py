@@ -1,11 +1,10 @@
 import asyncio
 from typing import Dict, Any
 from src.webxr.holomisha_ar import holo_misha_instance
-from src.security.security_logging_service import SecurityLoggingService
+from src.security.security_logging_service import security_logger
 import logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("DesignerNetwork")
-security_logger = SecurityLoggingService()
 class DesignerNetwork:
 def __init__(self):
 self.designers = {}
@@ -2,12 +2,11 @@ import asyncio
 from typing import Dict, Any
 from src.webxr.holomisha_ar import holo_misha_instance
 from src.webxr.quest_master import QuestMaster
-from src.security.security_logging_service import SecurityLoggingService
+from src.security.security_logging_service import security_logger
 import logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("MarketplaceBrigadier")
 quest_master = QuestMaster()
-security_logger = SecurityLoggingService()
 class MarketplaceBrigadier:
 def __init__(self):
 self.vitrines = {}
@@ -2,10 +2,9 @@ import asyncio
 from typing import Dict, Any, List
 import logging
 from src.webxr.holomisha_ar import holo_misha_instance
-from src.security.security_logging_service import SecurityLoggingService
+from src.security.security_logging_service import security_logger
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("QuestMaster")
-security_logger = SecurityLoggingService()
 class QuestMaster:
 def __init__(self):
 self.quests = self._initialize_quests()
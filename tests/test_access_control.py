@@ -0,0 +1,111 @@
+"""
+Unit tests for access control
+"""
+import asyncio
+import pytest
+import pytest_asyncio
+from unittest.mock import AsyncMock, patch
+from src.security.access_control import AccessControl, ADMIN, Session, User, UserRole
+
+@pytest_asyncio.fixture
+async def access_control():
+    """Create access control with AR notifications and security logging stubbed out"""
+    with patch('src.security.access_control.holo_misha_instance.notify_ar', new=AsyncMock()), \
+         patch('src.security.access_control.security_logger.log_security_event', new=AsyncMock()):
+        control = AccessControl()
+        yield control
+        await control.flush_audit()
+        if control._audit_task is not None:
+            control._audit_task.cancel()
+
+@pytest.mark.asyncio
+async def test_authenticate_creates_slotted_session(access_control):
+    """Test a successful login stores a slotted session with a float start time"""
+    result = await access_control.authenticate("SuperHoloMisha", "super_token")
+
+    assert result["status"] == "success"
+    assert result["role"] == "admin"
+    session = access_control.active_sessions[bytes.fromhex(result["session_id"])]
+    assert isinstance(session, Session)
+    assert not hasattr(session, "__dict__")
+    assert session.role is ADMIN
+    assert isinstance(session.start_time, float)
+
+@pytest.mark.asyncio
+async def test_authenticate_rejects_bad_token(access_control):
+    """Test a wrong token does not create a session"""
+    result = await access_control.authenticate("SuperHoloMisha", "wrong")
+
+    assert result["status"] == "error"
+    assert access_control.active_sessions == {}
+
+@pytest.mark.asyncio
+async def test_authenticate_rejects_non_string_token(access_control):
+    """Test a token of the wrong type gets the invalid credentials error instead of raising"""
+    for token in (None, 12345, b"super_token"):
+        result = await access_control.authenticate("SuperHoloMisha", token)
+
+        assert result == {"status": "error", "message": "Invalid credentials"}
+    assert access_control.active_sessions == {}
+
+@pytest.mark.asyncio
+async def test_session_lifecycle(access_control):
+    """Test authorize, session info and logout on one session"""
+    session_id = (await access_control.authenticate("SuperHoloMisha", "super_token"))["session_id"]
+
+    assert await access_control.authorize(session_id, "chip_design", "create") is True
+    info = await access_control.get_session_info(session_id)
+    assert info["username"] == "SuperHoloMisha"
+    assert info["role"] == "admin"
+
+    assert (await access_control.logout(session_id))["status"] == "success"
+    assert await access_control.authorize(session_id, "chip_design", "create") is False
+
+@pytest.mark.asyncio
+async def test_session_ids_are_random_and_unique(access_control):
+    """Test repeated logins with the same token get distinct unguessable session IDs"""
+    first = (await access_control.authenticate("SuperHoloMisha", "super_token"))["session_id"]
+    second = (await access_control.authenticate("SuperHoloMisha", "super_token"))["session_id"]
+
+    assert first != second
+    assert "SuperHoloMisha" not in first
+    assert len(access_control.active_sessions) == 2
+
+@pytest.mark.asyncio
+async def test_audit_events_delivered_in_background(access_control):
+    """Test AR notifications and security logs are queued and delivered off the request path"""
+    from src.security import access_control as module
+    release = asyncio.Event()
+
+    async def slow_log(*args):
+        await release.wait()
+
+    module.security_logger.log_security_event.side_effect = slow_log
+
+    # authorize returns even though the security log is still blocked
+    assert await access_control.authorize("missing", "chip_design", "create") is False
+    await access_control.authenticate("SuperHoloMisha", "wrong")
+
+    release.set()
+    await access_control.flush_audit()
+    logged = [call.args[1] for call in module.security_logger.log_security_event.await_args_list]
+    assert logged == ["authorization_failed", "authentication_failed"]
+    assert module.holo_misha_instance.notify_ar.await_count == 2
+
+def test_user_roles_are_interned():
+    """Test roles given as enum members or built strings normalize to the interned constants"""
+    from_enum = User(role=UserRole.ADMIN, permissions=frozenset(), token="t1")
+    from_str = User(role="".join(["ad", "min"]), permissions=frozenset(), token="t2")
+
+    assert from_enum.role is ADMIN
+    assert from_str.role is ADMIN
+
+@pytest.mark.asyncio
+async def test_malformed_session_id_is_not_found(access_control):
+    """Test non-hex session IDs are rejected like unknown sessions"""
+    assert await access_control.authorize("not-hex!", "chip_design", "create") is False
+    assert (await access_control.logout("zz"))["status"] == "error"
+    assert (await access_control.get_session_info(""))["status"] == "error"
+
+if __name__ == "__main__":
+    pytest.main([__file__])
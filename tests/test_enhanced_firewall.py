@@ -3,13 +3,16 @@ Unit tests for the enhanced firewall security module
 """
 import pytest
 import asyncio
+import hashlib
+import time
+from collections import deque
 from unittest.mock import Mock, patch, AsyncMock
 from src.security.enhanced_firewall import EnhancedQuantumSingularityFirewall, ThreatLevel, SecurityViolation
 
 @pytest.fixture
 def firewall():
     """Create a test instance of EnhancedQuantumSingularityFirewall"""
-    with patch('src.security.enhanced_firewall.holo_misha_instance'), \
+    with patch('src.security.enhanced_firewall.holo_misha_instance.notify_ar', new=AsyncMock()), \
          patch('src.security.enhanced_firewall.security_logger'):
         firewall = EnhancedQuantumSingularityFirewall()
         return firewall
@@ -20,7 +23,7 @@ async def test_firewall_initialization(firewall):
     assert firewall is not None
     assert firewall.threats_blocked == 0
     assert firewall.is_active is True
-    assert isinstance(firewall.threat_history, list)
+    assert isinstance(firewall.threat_history, deque)
     assert isinstance(firewall.rate_limits, dict)
     assert isinstance(firewall.blocked_ips, dict)
     assert isinstance(firewall.suspicious_activities, dict)
@@ -28,7 +31,7 @@ async def test_firewall_initialization(firewall):
 @pytest.mark.asyncio
 async def test_firewall_valid_process_validation(firewall):
     """Test firewall validation of valid process"""
-    with patch('src.security.enhanced_firewall.holo_misha_instance'), \
+    with patch('src.security.enhanced_firewall.holo_misha_instance.notify_ar', new=AsyncMock()), \
          patch('src.security.enhanced_firewall.security_logger'):
         process_data = {
             "type": "design_process",
@@ -43,7 +46,7 @@ async def test_firewall_valid_process_validation(firewall):
 @pytest.mark.asyncio
 async def test_firewall_invalid_input_validation(firewall):
     """Test firewall validation of invalid input"""
-    with patch('src.security.enhanced_firewall.holo_misha_instance'), \
+    with patch('src.security.enhanced_firewall.holo_misha_instance.notify_ar', new=AsyncMock()), \
          patch('src.security.enhanced_firewall.security_logger'):
         # Test dangerous prototype key
         process_data = {
@@ -64,7 +67,7 @@ async def test_firewall_invalid_input_validation(firewall):
 @pytest.mark.asyncio
 async def test_firewall_malicious_process_validation(firewall):
     """Test firewall validation of malicious process"""
-    with patch('src.security.enhanced_firewall.holo_misha_instance'), \
+    with patch('src.security.enhanced_firewall.holo_misha_instance.notify_ar', new=AsyncMock()), \
          patch('src.security.enhanced_firewall.security_logger'):
         process_data = {
             "type": "malicious",
@@ -84,7 +87,7 @@ async def test_firewall_malicious_process_validation(firewall):
 @pytest.mark.asyncio
 async def test_firewall_long_data_validation(firewall):
     """Test firewall validation of excessively long data"""
-    with patch('src.security.enhanced_firewall.holo_misha_instance'), \
+    with patch('src.security.enhanced_firewall.holo_misha_instance.notify_ar', new=AsyncMock()), \
          patch('src.security.enhanced_firewall.security_logger'):
         process_data = {
             "type": "design_process",
@@ -102,31 +105,79 @@ async def test_firewall_long_data_validation(firewall):
         assert threat["threat_level"] == ThreatLevel.HIGH.value
         assert threat["violation_type"] == SecurityViolation.INVALID_INPUT.value
 
+def test_firewall_validate_input_rules(firewall):
+    """Test input validation rejects non-dicts, dangerous keys and oversized strings"""
+    assert firewall._validate_input({"name": "test_chip", "size": 10 ** 6}) is True
+    assert firewall._validate_input(None) is False
+    assert firewall._validate_input(["name"]) is False
+    assert firewall._validate_input({"constructor": 1}) is False
+    assert firewall._validate_input({"data": "A" * 10000}) is True
+    assert firewall._validate_input({"data": "A" * 10001}) is False
+
 @pytest.mark.asyncio
 async def test_firewall_rate_limiting(firewall):
     """Test firewall rate limiting functionality"""
-    with patch('src.security.enhanced_firewall.holo_misha_instance'), \
-         patch('src.security.enhanced_firewall.security_logger'):
+    with patch('src.security.enhanced_firewall.holo_misha_instance.notify_ar', new=AsyncMock()), \
+         patch('src.security.enhanced_firewall.security_logger.log_security_event', new=AsyncMock()):
         process_data = {
             "type": "design_process",
             "name": "test_chip"
         }
+        # Keep suspicious activity detection from rejecting requests before the limiter does
+        firewall.suspicious_threshold = firewall.max_requests_per_minute * 2
         
-        # Test multiple requests from same identifier
-        for i in range(firewall.max_requests_per_minute + 5):
-            result = await firewall.validate_process(f"process_{i}", process_data)
-            if i < firewall.max_requests_per_minute:
-                # First requests should pass
-                assert result is True
-            else:
-                # Later requests should be blocked by rate limiting
-                # Note: This is a simplified test - actual rate limiting depends on timing
-                pass
+        # Burst past the limit from one identifier, dispatched concurrently
+        results = await asyncio.wait_for(
+            asyncio.gather(*(
+                firewall.validate_process("burst_process", process_data)
+                for _ in range(firewall.max_requests_per_minute + 10)
+            )),
+            timeout=10
+        )
+    
+    assert sum(results) <= firewall.max_requests_per_minute
+    assert results.count(False) >= 10
+    assert "burst_process" in firewall.blocked_ips
+    assert all(record["violation_type"] == SecurityViolation.RATE_LIMIT_EXCEEDED.value
+               for record in firewall.threat_history)
+
+def test_firewall_sliding_window_rate_limit(firewall):
+    """Test requests from the previous window still count across a window boundary"""
+    firewall.max_requests_per_minute = 60
+    with patch('src.security.enhanced_firewall.time.time', return_value=119.0):
+        for _ in range(60):
+            assert firewall._check_rate_limit("burst") is True
+        assert firewall._check_rate_limit("burst") is False
+    
+    # 10s into the next window five sixths of the previous burst still applies
+    with patch('src.security.enhanced_firewall.time.time', return_value=130.0):
+        results = [firewall._check_rate_limit("burst") for _ in range(20)]
+    assert results.count(True) == 10
+    assert "burst" in firewall.blocked_ips
+    
+    # After a full idle window the identifier starts fresh
+    with patch('src.security.enhanced_firewall.time.time', return_value=300.0):
+        assert firewall._check_rate_limit("burst") is True
+    assert firewall.rate_limits["burst"] == {"window_start": 5, "prev": 0, "curr": 1}
+
+@pytest.mark.asyncio
+async def test_firewall_distributed_rate_limit(firewall):
+    """Test the shared Redis limiter decides admission and local counters cover Redis outages"""
+    firewall._rate_limit_script = AsyncMock(side_effect=[1, 0, ConnectionError("redis down")])
+    
+    assert await firewall._check_distributed_rate_limit("worker_shared") is True
+    assert await firewall._check_distributed_rate_limit("worker_shared") is False
+    assert "worker_shared" in firewall.blocked_ips
+    assert firewall._rate_limit_script.await_args.kwargs["keys"] == ["rl:worker_shared"]
+    
+    # With Redis unreachable the local sliding window takes over
+    assert await firewall._check_distributed_rate_limit("worker_shared") is True
+    assert firewall.rate_limits["worker_shared"]["curr"] == 1
 
 @pytest.mark.asyncio
 async def test_firewall_suspicious_activity_detection(firewall):
     """Test firewall suspicious activity detection"""
-    with patch('src.security.enhanced_firewall.holo_misha_instance'), \
+    with patch('src.security.enhanced_firewall.holo_misha_instance.notify_ar', new=AsyncMock()), \
          patch('src.security.enhanced_firewall.security_logger'):
         process_data = {
             "type": "design_process",
@@ -148,10 +199,103 @@ async def test_firewall_suspicious_activity_detection(firewall):
                 # would need to be called to trigger suspicious activity detection
                 pass
 
+def test_firewall_tracking_is_bounded(firewall):
+    """Test suspicious activity tracking evicts the least recently seen identifier"""
+    with patch('src.security.enhanced_firewall.SUSPICIOUS_ACTIVITY_CAPACITY', 2):
+        firewall._is_suspicious_activity("a")
+        firewall._is_suspicious_activity("b")
+        firewall._is_suspicious_activity("a")
+        firewall._is_suspicious_activity("c")
+    
+    assert list(firewall.suspicious_activities.items()) == [("a", 2), ("c", 1)]
+    assert firewall.threat_history.maxlen is not None
+
+def test_firewall_expired_blocks_are_swept(firewall):
+    """Test expired blocks are dropped on the next rate limit check, keeping extended ones"""
+    firewall._block("stale", 0.0)
+    firewall._block("extended", 0.0)
+    firewall._block("extended", time.time())
+    
+    assert firewall._check_rate_limit("someone_else") is True
+    assert "stale" not in firewall.blocked_ips
+    assert "extended" in firewall.blocked_ips
+    assert len(firewall._block_expiry_heap) == 1
+
+def test_firewall_reblocking_keeps_one_heap_entry(firewall):
+    """Test repeated rejections extend a block without growing the expiry heap"""
+    firewall.max_requests_per_minute = 1
+    with patch('src.security.enhanced_firewall.time.time', return_value=119.0):
+        results = [firewall._check_rate_limit("flood") for _ in range(500)]
+    
+    assert results.count(True) == 1
+    assert len(firewall._block_expiry_heap) == 1
+    
+    # A block extended at t=200 outlives its original expiry and is re-queued by the sweep
+    firewall._block("flood", 200.0)
+    firewall._sweep_blocked(119.0 + firewall.block_duration)
+    assert firewall.blocked_ips["flood"] == 200.0 + firewall.block_duration
+    assert firewall._block_expiry_heap == [(200.0 + firewall.block_duration, "flood")]
+    
+    firewall._sweep_blocked(200.0 + firewall.block_duration)
+    assert "flood" not in firewall.blocked_ips
+    assert firewall._block_expiry_heap == []
+
+@pytest.mark.asyncio
+async def test_firewall_threat_logged_with_history_payload(firewall):
+    """Test the logged threat payload matches the history record minus its timestamp"""
+    with patch('src.security.enhanced_firewall.holo_misha_instance.notify_ar', new=AsyncMock()) as notify_ar, \
+         patch('src.security.enhanced_firewall.security_logger.log_security_event', new=AsyncMock()) as log_event:
+        await firewall._log_threat("process_1", ThreatLevel.HIGH, SecurityViolation.INVALID_INPUT, {"reason": "test"})
+    
+    payload = log_event.await_args.args[2]
+    record = dict(firewall.threat_history[0])
+    assert isinstance(record.pop("timestamp"), float)
+    assert record == payload
+    assert payload["violation_type"] == SecurityViolation.INVALID_INPUT.value
+    # The AR notification is sent in the background rather than awaited
+    await asyncio.gather(*firewall._ar_tasks)
+    assert "Security threat detected" in notify_ar.await_args.args[0]
+
+@pytest.mark.asyncio
+async def test_firewall_success_logging_is_sampled(firewall):
+    """Test successful validations are only logged at the configured sample rate"""
+    process_data = {"type": "design_process", "name": "test_chip"}
+    with patch('src.security.enhanced_firewall.holo_misha_instance.notify_ar', new=AsyncMock()), \
+         patch('src.security.enhanced_firewall.security_logger.log_security_event', new=AsyncMock()) as log_event:
+        firewall._log_success_sample = 0.0
+        assert await firewall.validate_process("process_1", process_data) is True
+        log_event.assert_not_awaited()
+        
+        firewall._log_success_sample = 1.0
+        assert await firewall.validate_process("process_2", process_data) is True
+        assert [call.args[1] for call in log_event.await_args_list] == ["process_validation_success"]
+        assert log_event.await_args.args[2]["data_keys"] == ["type", "name"]
+        
+        # Failures are logged regardless of the sample rate
+        firewall._log_success_sample = 0.0
+        assert await firewall.validate_process("process_3", {"type": "malicious"}) is False
+        assert log_event.await_args.args[1] == "security_threat"
+
+@pytest.mark.asyncio
+async def test_firewall_rejects_before_rate_limit_bookkeeping(firewall):
+    """Test rejected payloads never reach the rate limiter or suspicious activity tracking"""
+    with patch('src.security.enhanced_firewall.holo_misha_instance.notify_ar', new=AsyncMock()), \
+         patch('src.security.enhanced_firewall.security_logger.log_security_event', new=AsyncMock()) as log_event:
+        assert await firewall.validate_process("bad_1", {"type": "malicious", "__proto__": 1}) is False
+        assert await firewall.validate_process("bad_2", None) is False
+    
+    assert [record["violation_type"] for record in firewall.threat_history] == [
+        SecurityViolation.MALICIOUS_CONTENT.value,
+        SecurityViolation.INVALID_INPUT.value
+    ]
+    assert firewall.rate_limits == {}
+    assert len(firewall.suspicious_activities) == 0
+    assert log_event.await_count == 2
+
 @pytest.mark.asyncio
 async def test_firewall_zkp_operations(firewall):
     """Test firewall ZKP operations"""
-    with patch('src.security.enhanced_firewall.holo_misha_instance'), \
+    with patch('src.security.enhanced_firewall.holo_misha_instance.notify_ar', new=AsyncMock()), \
          patch('src.security.enhanced_firewall.security_logger'):
         test_data = {"key": "value"}
         
@@ -169,7 +313,7 @@ async def test_firewall_zkp_operations(firewall):
 @pytest.mark.asyncio
 async def test_firewall_encryption_decryption(firewall):
     """Test firewall encryption and decryption operations"""
-    with patch('src.security.enhanced_firewall.holo_misha_instance'), \
+    with patch('src.security.enhanced_firewall.holo_misha_instance.notify_ar', new=AsyncMock()), \
          patch('src.security.enhanced_firewall.security_logger'):
         test_data = "sensitive_data"
         key = "encryption_key"
@@ -184,5 +328,29 @@ async def test_firewall_encryption_decryption(firewall):
         decrypted = await firewall.decrypt_data(encrypted, key)
         assert decrypted is not None
 
+@pytest.mark.asyncio
+async def test_firewall_encryption_reuses_keyed_mac(firewall):
+    """Test repeated keys reuse one cached MAC context and sign with keyed BLAKE2b"""
+    with patch('src.security.enhanced_firewall.holo_misha_instance.notify_ar', new=AsyncMock()), \
+         patch('src.security.enhanced_firewall.security_logger.log_security_event', new=AsyncMock()):
+        first = await firewall.encrypt_data("sensitive_data", "encryption_key")
+        second = await firewall.encrypt_data("other_data", "encryption_key")
+    
+    expected = hashlib.blake2b(b"sensitive_data", key=b"encryption_key", digest_size=32).hexdigest()
+    assert first == f"encrypted_{expected}"
+    assert second != first
+    assert list(firewall._mac_cache) == [b"encryption_key"]
+
+@pytest.mark.asyncio
+async def test_firewall_encryption_accepts_long_keys(firewall):
+    """Test keys longer than BLAKE2b's 64 bytes are hashed down rather than truncated"""
+    with patch('src.security.enhanced_firewall.holo_misha_instance.notify_ar', new=AsyncMock()), \
+         patch('src.security.enhanced_firewall.security_logger.log_security_event', new=AsyncMock()):
+        first = await firewall.encrypt_data("sensitive_data", "k" * 64 + "a")
+        second = await firewall.encrypt_data("sensitive_data", "k" * 64 + "b")
+    
+    assert first.startswith("encrypted_")
+    assert first != second
+
 if __name__ == "__main__":
     pytest.main([__file__])
\ No newline at end of file
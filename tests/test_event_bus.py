@@ -0,0 +1,79 @@
+"""
+Unit tests for the event bus
+"""
+import asyncio
+import pytest
+from src.lib.event_bus import EventBus
+
+@pytest.mark.asyncio
+async def test_subscribers_stored_as_tuples():
+    """Test subscribe rebuilds an immutable handler tuple per event type"""
+    bus = EventBus()
+    first = lambda event: None
+    second = lambda event: None
+
+    bus.subscribe("tick", first)
+    bus.subscribe("tick", second)
+
+    assert bus._subscribers["tick"] == (first, second)
+
+@pytest.mark.asyncio
+async def test_handlers_run_concurrently():
+    """Test async handlers for one event are awaited together"""
+    bus = EventBus()
+    started = []
+    release = asyncio.Event()
+
+    async def handler(event):
+        started.append(event["type"])
+        await release.wait()
+
+    bus.subscribe("tick", handler)
+    bus.subscribe("tick", handler)
+
+    dispatch = asyncio.create_task(bus._handle_event({"type": "tick", "data": {}}))
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+    # Both handlers started before either finished
+    assert started == ["tick", "tick"]
+    release.set()
+    await dispatch
+
+@pytest.mark.asyncio
+async def test_failing_handler_does_not_block_others():
+    """Test one failing subscriber does not prevent the rest from running"""
+    bus = EventBus()
+    received = []
+
+    async def broken(event):
+        raise RuntimeError("boom")
+
+    bus.subscribe("tick", broken)
+    bus.subscribe("tick", lambda event: received.append(event["data"]))
+
+    await bus._handle_event({"type": "tick", "data": {"n": 1}})
+
+    assert received == [{"n": 1}]
+
+@pytest.mark.asyncio
+async def test_unknown_event_type_is_ignored():
+    """Test events without subscribers are dropped quietly"""
+    bus = EventBus()
+    await bus._handle_event({"type": "nobody", "data": {}})
+
+@pytest.mark.asyncio
+async def test_run_processes_queue_until_cancelled():
+    """Test run pumps published events in the caller's task"""
+    bus = EventBus()
+    received = asyncio.Queue()
+    bus.subscribe("tick", lambda event: received.put_nowait(event["data"]))
+
+    runner = asyncio.create_task(bus.run())
+    await bus.publish("tick", {"n": 1})
+    assert await asyncio.wait_for(received.get(), timeout=1) == {"n": 1}
+
+    runner.cancel()
+    await runner
+
+if __name__ == "__main__":
+    pytest.main([__file__])
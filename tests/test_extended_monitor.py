@@ -57,15 +57,66 @@ async def test_system_metrics_collection():
         assert "memory" in metrics
         assert "disk" in metrics
         assert "network" in metrics
-        assert metrics["cpu"]["percent"] == 25.0
+        # CPU is left to the background sampler, which has not run yet
+        assert metrics["cpu"]["percent"] == 0.0
+        mock_psutil.cpu_percent.assert_not_called()
         assert metrics["memory"]["percent"] == 45.0
 
+@pytest.mark.asyncio
+async def test_system_metrics_uses_sampled_cpu():
+    """Test system metrics read the background CPU sample instead of blocking"""
+    with patch('src.monitoring.extended_monitor.psutil') as mock_psutil:
+        mock_psutil.cpu_percent.return_value = 10.0
+        mock_psutil.disk_usage.return_value = Mock(used=1, total=2, free=1)
+
+        system_metrics = SystemMetrics()
+        system_metrics.start_sampler(interval=0.01)
+        await asyncio.sleep(0.05)
+        await system_metrics.stop_sampler()
+
+        assert system_metrics._latest_cpu == 10.0
+        mock_psutil.cpu_percent.return_value = 99.0
+        metrics = system_metrics.get_system_metrics()
+
+        assert metrics["cpu"]["percent"] == 10.0
+        for call in mock_psutil.cpu_percent.call_args_list:
+            assert call.kwargs.get("interval") is None
+
+def test_system_metrics_rolling_cpu_aggregates():
+    """Test incremental CPU aggregates match a full rescan of the history"""
+    system_metrics = SystemMetrics()
+    samples = [float((i * 37) % 101) for i in range(250)]
+
+    for sample in samples:
+        system_metrics._record_cpu(sample)
+        history = list(system_metrics.cpu_usage_history)
+        assert system_metrics._cpu_max_window[0][1] == max(history)
+        assert system_metrics._cpu_last10_sum / len(system_metrics._cpu_last10) == pytest.approx(sum(history[-10:]) / min(len(history), 10))
+
+@pytest.mark.asyncio
+async def test_concurrent_system_metrics_keep_aggregates_consistent():
+    """Test concurrent threaded collections leave the CPU aggregates matching the history"""
+    with patch('src.monitoring.extended_monitor.psutil') as mock_psutil:
+        mock_psutil.disk_usage.return_value = Mock(used=1, total=2, free=1)
+        system_metrics = SystemMetrics()
+        system_metrics._latest_cpu = 10.0
+
+        results = await asyncio.gather(*(asyncio.to_thread(system_metrics.get_system_metrics) for _ in range(200)))
+
+    assert all("error" not in result for result in results)
+    assert system_metrics._cpu_last10_sum == pytest.approx(sum(system_metrics._cpu_last10))
+    assert len(system_metrics.cpu_usage_history) == 100
+
 @pytest.mark.asyncio
 async def test_redis_metrics_collection(extended_monitor):
     """Test Redis metrics collection"""
     with patch.object(extended_monitor.redis_metrics, 'redis_client') as mock_redis_client:
         # Mock Redis client responses
-        mock_redis_client.ping = AsyncMock(return_value=True)
+        mock_redis_client.server_stats = AsyncMock(return_value={
+            "ping": True,
+            "dbsize": 42,
+            "info": {"keyspace_hits": 7, "keyspace_misses": 3, "uptime_in_seconds": 100}
+        })
         mock_redis_client.cache = {}
         mock_redis_client.max_cache_size = 1000
         extended_monitor.redis_metrics.cache_hit_count = 50
@@ -81,6 +132,21 @@ async def test_redis_metrics_collection(extended_monitor):
         assert metrics["connected"] is True
         assert metrics["errors"] == 2
         assert metrics["cache_stats"]["cache_hit_rate"] == 50 / (50 + 10)
+        assert metrics["dbsize"] == 42
+        assert metrics["server_info"] == {"keyspace_hits": 7, "keyspace_misses": 3}
+        mock_redis_client.server_stats.assert_awaited_once()
+
+def test_redis_latency_running_mean():
+    """Test the running latency sum stays equal to the bounded history"""
+    redis_metrics = RedisMetrics()
+    maxlen = redis_metrics.operation_latency_history.maxlen
+
+    for i in range(maxlen + 250):
+        redis_metrics.record_operation_latency(float(i % 17))
+
+    history = redis_metrics.operation_latency_history
+    assert len(history) == maxlen
+    assert redis_metrics._latency_sum == pytest.approx(sum(history))
 
 @pytest.mark.asyncio
 async def test_security_metrics_collection(extended_monitor):
@@ -126,6 +192,22 @@ async def test_ai_metrics_collection(extended_monitor):
         assert metrics["sleeping_agents"] == 1
         assert metrics["error_agents"] == 1
 
+@pytest.mark.asyncio
+async def test_ai_metrics_counts_unknown_states(extended_monitor):
+    """Test states outside the fixed state table are still counted"""
+    with patch.object(extended_monitor.ai_metrics, 'agent_guard') as mock_agent_guard:
+        mock_agent_guard.agent_states = {
+            "agent1": "active",
+            "agent2": "maintenance",
+            "agent3": "rebooting",
+            "agent4": "rebooting"
+        }
+        
+        metrics = await extended_monitor.ai_metrics.get_ai_metrics()
+        
+        assert metrics["agent_states"] == {"active": 1, "maintenance": 1, "rebooting": 2}
+        assert metrics["sleeping_agents"] == 0
+
 @pytest.mark.asyncio
 async def test_extended_monitor_get_all_metrics(extended_monitor):
     """Test extended monitor get all metrics"""
@@ -168,9 +250,45 @@ async def test_health_score_calculation(extended_monitor):
         assert "health_score" in health_score
         assert "status" in health_score
         assert "metrics_used" in health_score
+        assert health_score["metrics_used"] == {
+            "cpu_percent": 25.0,
+            "memory_percent": 45.0,
+            "redis_errors": 2,
+            "firewall_active": True
+        }
         assert isinstance(health_score["health_score"], (int, float))
         assert 0 <= health_score["health_score"] <= 100
 
+@pytest.mark.asyncio
+async def test_health_score_threshold_table(extended_monitor):
+    """Test the threshold tables apply the same penalties as the original ladder"""
+    with patch.object(extended_monitor, 'get_all_extended_metrics') as mock_get_metrics:
+        mock_get_metrics.return_value = {
+            "system": {
+                "cpu": {"percent": 80.0},  # -10
+                "memory": {"percent": 50.0}  # boundary, no penalty
+            },
+            "redis": {"errors": 6},  # -10
+            "security": {"firewall": {"active": False}}  # -25
+        }
+        
+        health_score = await extended_monitor.get_system_health_score()
+        
+        assert health_score["health_score"] == 55
+        assert health_score["status"] == "unhealthy"
+
+@pytest.mark.asyncio
+async def test_health_score_uses_precomputed_metrics(extended_monitor):
+    """Test passing metrics skips the extended metrics collection"""
+    with patch.object(extended_monitor, 'get_all_extended_metrics') as mock_get_metrics:
+        metrics = {"system": {"cpu": {"percent": 95.0}, "memory": {"percent": 10.0}}}
+        
+        health_score = await extended_monitor.get_system_health_score(metrics)
+        
+        mock_get_metrics.assert_not_called()
+        assert health_score["health_score"] == 80
+        assert health_score["metrics_used"]["cpu_percent"] == 95.0
+
 @pytest.mark.asyncio
 async def test_health_score_with_high_cpu(extended_monitor):
     """Test health score calculation with high CPU usage"""
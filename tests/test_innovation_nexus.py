@@ -122,6 +122,29 @@ class TestInnovationNexus:
         
         print("✅ Contract verification test passed")
     
+    @pytest.mark.asyncio
+    async def test_batched_verification_status(self):
+        """Test batch status lookups serve memory hits, load misses in one MGET and report unknown ids"""
+        cached = {"verification_id": "verification_cached", "status": "completed"}
+        stored = {"verification_id": "verification_stored", "status": "in_progress"}
+        mget = AsyncMock(return_value=[stored, None])
+        
+        with patch.dict(contract_verification.verifications, {"verification_cached": cached}), \
+             patch.object(contract_verification, "count", 1), \
+             patch('src.verification.contract_verification.redis_client.mget_json', new=mget):
+            statuses = await contract_verification.get_verifications_status(
+                ["verification_cached", "verification_stored", "verification_unknown"]
+            )
+            
+            mget.assert_awaited_once_with(["verification:verification_stored", "verification:verification_unknown"])
+            assert statuses["verification_cached"] == {"status": "success", "verification": cached}
+            assert statuses["verification_stored"] == {"status": "success", "verification": stored}
+            assert statuses["verification_unknown"]["status"] == "error"
+            assert contract_verification.verifications["verification_stored"] is stored
+            assert contract_verification.count == 2
+        
+        print("✅ Batched verification status test passed")
+    
     @pytest.mark.asyncio
     async def test_innovation_evaluation(self):
         """Test innovation evaluation process"""
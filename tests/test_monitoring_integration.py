@@ -10,6 +10,8 @@ from datetime import datetime
 from src.monitoring.extended_monitor import ExtendedMonitor
 from src.monitoring.dashboard import MonitoringDashboard
 from src.monitoring.api_monitor import APIMonitor
+from src.monitoring.health_check import HealthCheck
+from src.monitoring.monitoring_expansion_test import MonitoringExpansionTest
 
 @pytest.fixture
 def extended_monitor():
@@ -164,6 +166,139 @@ async def test_monitoring_dashboard_health_score_integration(monitoring_dashboar
         assert health_report["health_score"]["health_score"] == 85
         assert health_report["health_score"]["status"] == "degraded"
 
+@pytest.mark.asyncio
+async def test_monitoring_dashboard_overview_ttl_cache(monitoring_dashboard):
+    """Test concurrent overview requests share one computation within the TTL"""
+    overview = {"system_status": "healthy", "timestamp": datetime.utcnow().isoformat()}
+    with patch.object(monitoring_dashboard, '_build_system_overview', new_callable=AsyncMock) as mock_build:
+        mock_build.return_value = overview
+
+        results = await asyncio.gather(*(monitoring_dashboard.get_system_overview() for _ in range(5)))
+
+        assert mock_build.await_count == 1
+        assert all(result is overview for result in results)
+
+        # Expired entries are recomputed
+        monitoring_dashboard.cache_ttl = 0
+        await monitoring_dashboard.get_system_overview()
+        assert mock_build.await_count == 2
+
+@pytest.mark.asyncio
+async def test_monitoring_dashboard_api_metrics_ttl_cache(monitoring_dashboard):
+    """Test bursty API metrics requests collapse to one computation per TTL window"""
+    api_metrics = {"system_health": {"status": "healthy"}}
+    with patch.object(monitoring_dashboard, '_build_detailed_api_metrics', new_callable=AsyncMock) as mock_build:
+        mock_build.return_value = api_metrics
+        
+        for _ in range(3):
+            results = await asyncio.gather(*(monitoring_dashboard.get_detailed_api_metrics() for _ in range(10)))
+            assert all(result is api_metrics for result in results)
+        
+        assert mock_build.await_count == 1
+        
+        # Once expired, error results are recomputed rather than cached
+        mock_build.return_value = {"error": "unavailable"}
+        monitoring_dashboard.cache_ttl = 0
+        await monitoring_dashboard.get_detailed_api_metrics()
+        await monitoring_dashboard.get_detailed_api_metrics()
+        assert mock_build.await_count == 3
+
+@pytest.mark.asyncio
+async def test_monitoring_dashboard_security_report_reprobes_firewall(monitoring_dashboard):
+    """Test the cached firewall attribute probe follows a swapped firewall"""
+    monitoring_dashboard.firewall = object()
+    report = await monitoring_dashboard.get_security_report()
+    assert report["threats_blocked"] == 0
+    assert report["firewall_status"] is True
+    
+    monitoring_dashboard.firewall = Mock(threats_blocked=3, is_active=False)
+    report = await monitoring_dashboard.get_security_report()
+    assert report["threats_blocked"] == 3
+    assert report["firewall_status"] is False
+
+@pytest.mark.asyncio
+async def test_monitoring_export_collects_extended_metrics_once(monitoring_dashboard, extended_monitor):
+    """Test export_metrics shares one extended metrics collection across its sections"""
+    extended = {
+        "system": {"cpu": {"percent": 25.0}, "memory": {"percent": 45.0}},
+        "redis": {"errors": 0},
+        "security": {"firewall": {"active": True}},
+        "ai": {"total_agents": 0}
+    }
+    with patch.object(extended_monitor, 'get_all_extended_metrics', new_callable=AsyncMock) as mock_get_metrics, \
+         patch('src.monitoring.dashboard.health_check') as mock_health_check:
+        mock_get_metrics.return_value = extended
+        mock_health_check.run_checks = AsyncMock(return_value={"status": "healthy"})
+        
+        await monitoring_dashboard.export_metrics("json")
+        
+        assert mock_get_metrics.await_count == 1
+
+@pytest.mark.asyncio
+async def test_health_check_runs_concurrently_and_caches():
+    """Test registered checks run concurrently and results are reused within the TTL"""
+    health = HealthCheck()
+    calls = []
+
+    async def slow_check():
+        calls.append("slow")
+        await asyncio.sleep(0.01)
+        return True
+
+    def sync_check():
+        calls.append("sync")
+        return True
+
+    def broken_check():
+        raise RuntimeError("boom")
+
+    health.register_check("slow", slow_check)
+    health.register_check("sync", sync_check)
+    health.register_check("broken", broken_check)
+
+    results = await asyncio.gather(*(health.run_checks() for _ in range(3)))
+
+    assert sorted(calls) == ["slow", "sync"]
+    assert results[0]["status"] == "degraded"
+    assert results[0]["passed"] == 2
+    assert results[0]["checks"]["broken"]["error"] == "boom"
+    assert all(result is results[0] for result in results)
+
+@pytest.mark.asyncio
+async def test_monitoring_expansion_runs_tests_concurrently():
+    """Test run_all_tests runs every test and reports failures without stopping the others"""
+    suite = MonitoringExpansionTest()
+    names = ["test_system_metrics", "test_redis_metrics", "test_security_metrics",
+             "test_ai_metrics", "test_health_score", "test_dashboard_integration"]
+    mocks = {name: AsyncMock(return_value=True) for name in names}
+    mocks["test_redis_metrics"].side_effect = AssertionError("Redis metrics should be present")
+    snapshot = {"system": {}, "redis": {}, "security": {}, "ai": {}}
+    
+    with patch.multiple(suite, **mocks), \
+         patch.object(suite, 'extended_monitor') as mock_extended_monitor, \
+         patch('src.monitoring.monitoring_expansion_test.record_request'):
+        mock_extended_monitor.get_all_extended_metrics = AsyncMock(return_value=snapshot)
+        assert await suite.run_all_tests() is False
+    
+    # One shared snapshot is passed to every metrics test
+    mock_extended_monitor.get_all_extended_metrics.assert_awaited_once()
+    for name, mock in mocks.items():
+        if name == "test_dashboard_integration":
+            mock.assert_awaited_once_with()
+        else:
+            mock.assert_awaited_once_with(snapshot)
+
+@pytest.mark.asyncio
+async def test_monitoring_expansion_schema_check_reports_missing_keys():
+    """Test the section checks name every missing key"""
+    suite = MonitoringExpansionTest()
+    
+    assert await suite.test_system_metrics({"system": {"cpu": {}, "memory": {}, "disk": {}}}) is True
+    with pytest.raises(AssertionError, match=r"system metrics missing: \['disk', 'memory'\]"):
+        await suite.test_system_metrics({"system": {"cpu": {}}})
+    with pytest.raises(AssertionError, match="redis metrics should be present"):
+        await suite.test_redis_metrics({})
+
 @pytest.mark.asyncio
 async def test_api_monitor_endpoint_registration(api_monitor):
     """Test APIMonitor endpoint registration"""
@@ -231,12 +366,17 @@ async def test_monitoring_data_export_integration(monitoring_dashboard, extended
         # Test JSON export
         exported_data = await monitoring_dashboard.export_metrics("json")
         
-        assert isinstance(exported_data, str)
-        assert "system_overview" in exported_data
-        assert "api_metrics" in exported_data
-        assert "security_report" in exported_data
-        assert "extended_metrics" in exported_data
-        assert "health_score" in exported_data
+        assert isinstance(exported_data, bytes)
+        assert b"system_overview" in exported_data
+        assert b"api_metrics" in exported_data
+        assert b"security_report" in exported_data
+        assert b"extended_metrics" in exported_data
+        assert b"health_score" in exported_data
+        
+        # The string shim decodes the same payload
+        exported_text = await monitoring_dashboard.export_metrics_str("json")
+        assert isinstance(exported_text, str)
+        assert exported_text == exported_data.decode()
 
 if __name__ == "__main__":
     pytest.main([__file__])
\ No newline at end of file
@@ -5,7 +5,7 @@ import pytest
 import asyncio
 import json
 from unittest.mock import Mock, patch, AsyncMock
-from src.lib.redis_client import OptimizedRedisClient
+from src.lib.redis_client import OptimizedRedisClient, BatchedRedis
 
 @pytest.fixture
 def redis_client():
@@ -25,7 +25,7 @@ async def test_redis_client_initialization(redis_client):
     """Test Redis client initialization"""
     assert redis_client is not None
     assert isinstance(redis_client.cache, dict)
-    assert isinstance(redis_client.cache_ttl, dict)
+    assert isinstance(redis_client.cache_exp, dict)
     assert redis_client.default_cache_ttl == 300
     assert redis_client.max_cache_size == 1000
 
@@ -125,6 +125,12 @@ async def test_redis_cache_ttl(redis_client):
     # This is a simplified test - in reality, TTL checking happens on access
     assert "test_key" in redis_client.cache
 
+    # Expiry offsets are stored as integer centiseconds
+    assert isinstance(redis_client.cache_exp["test_key"], int)
+    redis_client.cache_exp["test_key"] = redis_client._now_cs() - 1
+    assert redis_client._is_cached("test_key") is False
+    assert "test_key" not in redis_client.cache
+
 @pytest.mark.asyncio
 async def test_redis_delete(redis_client):
     """Test Redis delete operation"""
@@ -158,5 +164,78 @@ async def test_redis_keys(redis_client):
     assert result == ["key1", "key2", "key3"]
     redis_client.client.keys.assert_called_once_with("pattern*")
 
+@pytest.mark.asyncio
+async def test_redis_server_stats_single_pipeline(redis_client):
+    """Test server stats are fetched with one pipelined execute"""
+    pipe = Mock()
+    pipe.execute = AsyncMock(return_value=[True, 12, {"keyspace_hits": 4}])
+    pipeline_cm = AsyncMock()
+    pipeline_cm.__aenter__.return_value = pipe
+    redis_client.client.pipeline = Mock(return_value=pipeline_cm)
+    
+    stats = await redis_client.server_stats()
+    
+    assert stats == {"ping": True, "dbsize": 12, "info": {"keyspace_hits": 4}}
+    pipe.ping.assert_called_once_with()
+    pipe.dbsize.assert_called_once_with()
+    pipe.info.assert_called_once_with("stats")
+    pipe.execute.assert_awaited_once()
+
+@pytest.mark.asyncio
+async def test_redis_mget_json_fetches_misses_in_one_call(redis_client):
+    """Test mget_json serves cache hits locally and MGETs only the misses"""
+    redis_client._cache_set("cached", json.dumps({"a": 1}))
+    redis_client.client.mget = AsyncMock(return_value=[json.dumps({"b": 2}), None])
+    
+    result = await redis_client.mget_json(["cached", "remote", "absent"])
+    
+    assert result == [{"a": 1}, {"b": 2}, None]
+    redis_client.client.mget.assert_awaited_once_with(["remote", "absent"])
+    assert "remote" in redis_client.cache
+
+@pytest.mark.asyncio
+async def test_redis_get_json_large_payload_decoded_in_thread(redis_client):
+    """Test large JSON payloads are decoded off the event loop"""
+    payload = {"blob": "x" * 20000}
+    redis_client.client.get = AsyncMock(return_value=json.dumps(payload))
+    
+    with patch('src.lib.redis_client.asyncio.to_thread', wraps=asyncio.to_thread) as to_thread:
+        result = await redis_client.get_json("large_key")
+    
+    assert result == payload
+    to_thread.assert_called_once()
+
+@pytest.mark.asyncio
+async def test_redis_get_json_invalid_payload(redis_client):
+    """Test undecodable JSON returns None"""
+    redis_client.client.get = AsyncMock(return_value="{not json")
+    assert await redis_client.get_json("bad_key", use_cache=False) is None
+
+@pytest.mark.asyncio
+async def test_batched_redis_coalesces_concurrent_reads(redis_client):
+    """Test concurrent get_json calls share a single MGET"""
+    redis_client.client.mget = AsyncMock(return_value=[json.dumps(1), json.dumps(2), None])
+    batched = BatchedRedis(redis_client)
+    
+    results = await asyncio.gather(
+        batched.get_json("k1"),
+        batched.get_json("k2"),
+        batched.get_json("k3")
+    )
+    
+    assert results == [1, 2, None]
+    redis_client.client.mget.assert_awaited_once_with(["k1", "k2", "k3"])
+    # Non-batched operations pass through to the wrapped client
+    assert batched.mget_json == redis_client.mget_json
+
+@pytest.mark.asyncio
+async def test_redis_pipeline_uses_shared_client(redis_client):
+    """Test pipelines are opened on the pooled client, non-transactional by default"""
+    redis_client.client.pipeline = Mock(return_value="pipe")
+    batched = BatchedRedis(redis_client)
+    
+    assert batched.pipeline() == "pipe"
+    redis_client.client.pipeline.assert_called_once_with(transaction=False)
+
 if __name__ == "__main__":
     pytest.main([__file__])
\ No newline at end of file
@@ -0,0 +1,329 @@
+"""
+Unit tests for the HoloMesh performance monitor
+"""
+import pytest
+import io
+import threading
+import time
+import numpy as np
+import orjson
+from unittest.mock import patch
+from src.monitoring.performance_dashboard import (
+    PerformanceMonitor, OptimizationRecord, INITIAL_MODE_CAPACITY, INGEST_BATCH_SIZE, record_optimization_result
+)
+
+# Records fed to one mode when checking running aggregates against a rescan of the full history
+HISTORY_LENGTH = 1000
+
+def make_record(tool="yosys", mode="professional", execution_time=1.0, iterations=10,
+                confidence=0.8, metrics=None, success=True, timestamp=None):
+    """Build an OptimizationRecord with test defaults"""
+    return OptimizationRecord(
+        timestamp=time.time() if timestamp is None else timestamp,
+        tool_name=tool,
+        interaction_mode=mode,
+        strategy="default",
+        execution_time=execution_time,
+        iterations=iterations,
+        confidence_score=confidence,
+        final_metrics={"area": 100.0} if metrics is None else metrics,
+        success=success,
+        project_id="project",
+        process_id="process"
+    )
+
+@pytest.fixture
+def monitor():
+    """Create a fresh PerformanceMonitor"""
+    return PerformanceMonitor()
+
+def test_mode_performance_matches_full_history(monitor):
+    """Test running aggregates agree with a rescan of every recorded value"""
+    areas = [100.0 - i * 0.5 for i in range(HISTORY_LENGTH)]
+    confidences = [0.5 + (i % 5) * 0.1 for i in range(len(areas))]
+    for i, (area, confidence) in enumerate(zip(areas, confidences)):
+        monitor.record_optimization(make_record(
+            execution_time=float(i % 3), iterations=i, confidence=confidence,
+            metrics={"area": area}, success=i % 4 != 0
+        ))
+    
+    performance = monitor.get_mode_performance("yosys", "professional")
+    
+    assert performance["total_runs"] == len(areas)
+    assert performance["success_rate"] == pytest.approx(np.mean([i % 4 != 0 for i in range(len(areas))]))
+    assert performance["avg_confidence_score"] == pytest.approx(np.mean(confidences))
+    assert performance["metric_averages"]["area"] == pytest.approx(np.mean(areas))
+    assert performance["metric_improvements"]["area"] == pytest.approx((areas[-1] - areas[0]) / areas[0])
+
+def test_mode_performance_is_memoized_until_next_record(monitor):
+    """Test repeated queries reuse the cached result until the mode changes"""
+    monitor.record_optimization(make_record())
+    first = monitor.get_mode_performance("yosys", "professional")
+    assert monitor.get_mode_performance("yosys", "professional") is first
+    
+    monitor.record_optimization(make_record(confidence=0.4))
+    second = monitor.get_mode_performance("yosys", "professional")
+    assert second is not first
+    assert second["total_runs"] == 2
+
+def test_unknown_mode_reports_no_data(monitor):
+    """Test querying an unknown mode does not create an entry"""
+    assert monitor.get_mode_performance("yosys", "manual") == {"error": "No data available"}
+    assert monitor.get_overall_performance() == {"error": "No data available"}
+    assert not monitor.mode_stats
+
+def test_export_data_uses_serializable_mode_stats(monitor):
+    """Test exported mode stats contain only plain counters"""
+    monitor.record_optimization(make_record())
+    
+    exported = monitor.export_data()
+    
+    assert len(exported["records"]) == 1
+    assert exported["mode_stats"] == {
+        "yosys_professional": {
+            "total_runs": 1,
+            "successful_runs": 1,
+            "total_execution_time": 1.0,
+            "total_iterations": 10
+        }
+    }
+
+def test_batched_apply_matches_single_records():
+    """Test a batched apply leaves the same aggregates as one record at a time"""
+    # Several full ingest batches followed by a partial one, applied the way the background flusher does
+    records = [make_record(confidence=(i % 7) / 7, metrics={"area": float(i)}) for i in range(INGEST_BATCH_SIZE * 4 + 3)]
+    single, batched = PerformanceMonitor(), PerformanceMonitor()
+    for record in records:
+        single.record_optimization(record)
+    for start in range(0, len(records), INGEST_BATCH_SIZE):
+        batched._apply_batch(records[start:start + INGEST_BATCH_SIZE])
+    
+    single_stats = single.mode_stats[("yosys", "professional")]
+    batched_stats = batched.mode_stats[("yosys", "professional")]
+    assert np.array_equal(single_stats.metrics.counts, batched_stats.metrics.counts)
+    assert np.array_equal(single_stats.metrics.first, batched_stats.metrics.first)
+    assert np.array_equal(single_stats.metrics.last, batched_stats.metrics.last)
+    single_performance = single.get_mode_performance("yosys", "professional")
+    batched_performance = batched.get_mode_performance("yosys", "professional")
+    # Batches sum in a different order, so compare the floating-point aggregates approximately
+    for key in ("total_runs", "success_rate", "avg_execution_time", "avg_iterations", "avg_confidence_score", "confidence_std"):
+        assert single_performance[key] == pytest.approx(batched_performance[key])
+    assert single_performance["metric_averages"] == pytest.approx(batched_performance["metric_averages"])
+
+@pytest.mark.asyncio
+async def test_submit_queues_records_for_background_apply(monitor):
+    """Test submitted records are applied by the background consumer"""
+    for i in range(20):
+        monitor.submit(make_record(iterations=i))
+    assert monitor._queue.qsize() == 20
+    
+    await monitor.flush()
+    
+    assert len(monitor.records) == 20
+    assert monitor.get_mode_performance("yosys", "professional")["total_runs"] == 20
+    monitor._drain_task.cancel()
+
+def test_record_optimization_result_without_event_loop_applies_directly(monitor):
+    """Test the module helper falls back to a synchronous update outside an event loop"""
+    with patch('src.monitoring.performance_dashboard.get_performance_monitor', return_value=monitor):
+        record_optimization_result("yosys", "manual", "default", 1.0, 3, 0.9, {}, True, "project", "process")
+    
+    assert monitor.get_mode_performance("yosys", "manual")["total_runs"] == 1
+
+def test_overall_performance_leaders_track_changing_modes(monitor):
+    """Test incremental leaders and averages match a full recomputation as modes improve and worsen"""
+    modes = [("yosys", "professional"), ("nextpnr", "innovative"), ("vivado", "semi_automatic")]
+    for step in range(300):
+        tool, mode = modes[(step * 7) % len(modes)]
+        monitor.record_optimization(make_record(
+            tool=tool, mode=mode,
+            execution_time=float((step * 13) % 11),
+            confidence=((step * 5) % 9) / 9,
+            success=(step * 3) % 5 != 0
+        ))
+        
+        overall = monitor.get_overall_performance()
+        performances = [monitor.get_mode_performance(t, m) for t, m in modes]
+        performances = [p for p in performances if "error" not in p]
+        
+        assert overall["total_optimizations"] == step + 1
+        assert overall["mode_count"] == len(performances)
+        assert overall["avg_success_rate"] == pytest.approx(np.mean([p["success_rate"] for p in performances]))
+        assert overall["avg_execution_time"] == pytest.approx(np.mean([p["avg_execution_time"] for p in performances]))
+        assert overall["best_success_rate_mode"]["rate"] == max(p["success_rate"] for p in performances)
+        assert overall["fastest_execution_mode"]["time"] == min(p["avg_execution_time"] for p in performances)
+        assert overall["highest_confidence_mode"]["confidence"] == pytest.approx(max(p["avg_confidence_score"] for p in performances))
+
+def test_optimization_record_is_slotted_and_frozen():
+    """Test records carry no per-instance dict and serialize shallowly"""
+    record = make_record(metrics={"area": 1.0})
+    
+    assert not hasattr(record, "__dict__")
+    with pytest.raises(AttributeError):
+        record.success = False
+    as_dict = record.to_dict()
+    assert list(as_dict) == ["timestamp", "tool_name", "interaction_mode", "strategy", "execution_time",
+                             "iterations", "confidence_score", "final_metrics", "success", "project_id", "process_id"]
+    assert as_dict["final_metrics"] is record.final_metrics
+    # The view is built once at construction and reused
+    assert record.to_dict() is as_dict
+    assert orjson.loads(orjson.dumps(record)) == as_dict
+
+def test_recent_records_newest_first_and_bounded():
+    """Test recent records come newest first and history is capped"""
+    with patch('src.monitoring.performance_dashboard.MAX_RECORDS', 5):
+        bounded = PerformanceMonitor()
+    for i in range(8):
+        bounded.record_optimization(make_record(iterations=i, timestamp=float(i)))
+    
+    assert [r["iterations"] for r in bounded.get_recent_records(3)] == [7, 6, 5]
+    assert [r["iterations"] for r in bounded.get_recent_records(50)] == [7, 6, 5, 4, 3]
+    # Aggregates still cover every record, not just the retained ones
+    assert bounded.get_mode_performance("yosys", "professional")["total_runs"] == 8
+
+@pytest.mark.asyncio
+async def test_export_data_stream_matches_export_data(monitor):
+    """Test the streamed export decodes to the same document as export_data"""
+    for i in range(7):
+        monitor.record_optimization(make_record(iterations=i, mode="manual" if i % 2 else "professional"))
+    
+    buffer = io.BytesIO()
+    await monitor.export_data_stream(buffer.write, batch_size=3)
+    streamed = orjson.loads(buffer.getvalue())
+    expected = monitor.export_data()
+    
+    assert streamed["records"] == expected["records"]
+    assert streamed["mode_stats"] == expected["mode_stats"]
+    assert isinstance(streamed["export_timestamp"], float)
+
+@pytest.mark.asyncio
+async def test_export_stream_handles_empty_history(monitor):
+    """Test an empty monitor still streams a valid document"""
+    buffer = io.BytesIO()
+    await monitor.export_data_stream(buffer.write)
+    
+    streamed = orjson.loads(buffer.getvalue())
+    assert streamed["records"] == []
+    assert streamed["mode_stats"] == {}
+
+def test_mode_ratios_are_maintained_on_write(monitor):
+    """Test per-mode ratios are stored on the stats as records arrive"""
+    monitor.record_optimization(make_record(execution_time=2.0, iterations=4, confidence=0.5, success=True))
+    monitor.record_optimization(make_record(execution_time=4.0, iterations=8, confidence=1.0, success=False))
+    
+    stats = monitor.mode_stats[("yosys", "professional")]
+    assert (stats.success_rate, stats.avg_exec, stats.avg_iter, stats.avg_conf) == (0.5, 3.0, 6.0, 0.75)
+    assert monitor.get_mode_performance("yosys", "professional")["avg_iterations"] == 6.0
+
+def test_recent_records_json_matches_dict_path(monitor):
+    """Test the encoded recent records decode to the dict representation"""
+    for i in range(4):
+        monitor.record_optimization(make_record(iterations=i, metrics={"area": float(i)}))
+    
+    assert orjson.loads(monitor.get_recent_records_json(3)) == monitor.get_recent_records(3)
+    assert orjson.loads(monitor.get_recent_records_json(-1)) == []
+
+def test_recent_records_endpoint_encodes_envelope(monitor):
+    """Test the recent-records endpoint returns the success envelope with a count"""
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+    from src.monitoring.dashboard_api import router
+    
+    for i in range(3):
+        monitor.record_optimization(make_record(iterations=i))
+    app = FastAPI()
+    app.include_router(router)
+    
+    with patch('src.monitoring.dashboard_api.get_performance_monitor', return_value=monitor):
+        response = TestClient(app).get("/api/v1/monitoring/performance/recent", params={"limit": 2})
+    
+    payload = response.json()
+    assert payload["status"] == "success"
+    assert payload["count"] == 2
+    assert [record["iterations"] for record in payload["data"]] == [2, 1]
+
+def test_export_endpoint_streams_envelope_or_fails_early(monitor):
+    """Test the export endpoint streams the success envelope and maps early failures to a 500"""
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+    from src.monitoring.dashboard_api import router
+    
+    for i in range(3):
+        monitor.record_optimization(make_record(iterations=i))
+    app = FastAPI()
+    app.include_router(router)
+    client = TestClient(app)
+    
+    with patch('src.monitoring.dashboard_api.get_performance_monitor', return_value=monitor):
+        response = client.get("/api/v1/monitoring/performance/export")
+    assert response.status_code == 200
+    assert response.json()["data"]["records"] == monitor.export_data()["records"]
+    
+    # With no records the mode stats are part of the first batch, encoded before the response starts
+    empty = PerformanceMonitor()
+    with patch('src.monitoring.dashboard_api.get_performance_monitor', return_value=empty), \
+         patch.object(empty, 'mode_stats_summary', side_effect=RuntimeError("encode failed")):
+        response = client.get("/api/v1/monitoring/performance/export")
+    
+    assert response.status_code == 500
+    assert "encode failed" in response.json()["detail"]
+
+def test_metric_matrix_handles_sparse_and_zero_metrics(monitor):
+    """Test metrics missing from some records and zero first values are summarized correctly"""
+    monitor.record_optimization(make_record(metrics={"area": 0.0, "power": 2.0}))
+    monitor.record_optimization(make_record(metrics={"area": 5.0}))
+    monitor.record_optimization(make_record(metrics={"area": 7.0, "timing": 3.0}))
+    
+    performance = monitor.get_mode_performance("yosys", "professional")
+    
+    assert performance["metric_averages"] == {"area": 4.0, "power": 2.0, "timing": 3.0}
+    # Zero first value reports no improvement; single-sample metrics are omitted
+    assert performance["metric_improvements"] == {"area": 0.0}
+
+def test_mode_keys_are_unambiguous_with_underscored_names(monitor):
+    """Test tool names containing underscores round-trip through the overall report"""
+    monitor.record_optimization(make_record(tool="open_road", mode="semi_automatic"))
+    
+    overall = monitor.get_overall_performance()
+    
+    assert overall["best_success_rate_mode"]["tool"] == "open_road"
+    assert overall["best_success_rate_mode"]["mode"] == "semi_automatic"
+    assert monitor.get_mode_performance("open_road", "semi_automatic")["total_runs"] == 1
+
+def test_concurrent_threads_update_counters_consistently(monitor):
+    """Test records applied from several threads, across a counters resize, are all counted"""
+    modes = [(f"tool{i}", "professional") for i in range(INITIAL_MODE_CAPACITY + 8)]
+    
+    def worker(offset):
+        for i in range(200):
+            tool, mode = modes[(offset + i) % len(modes)]
+            monitor.record_optimization(make_record(tool=tool, mode=mode, iterations=1, success=i % 2 == 0))
+    
+    threads = [threading.Thread(target=worker, args=(offset,)) for offset in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    
+    overall = monitor.get_overall_performance()
+    assert overall["total_optimizations"] == 8 * 200
+    assert overall["mode_count"] == len(modes)
+    summary = monitor.mode_stats_summary()
+    assert sum(stats["total_iterations"] for stats in summary.values()) == 8 * 200
+    assert sum(stats["successful_runs"] for stats in summary.values()) == 8 * 100
+
+def test_mode_performance_reports_confidence_spread(monitor):
+    """Test the squared-confidence counter yields the confidence standard deviation"""
+    for confidence in (0.2, 0.4, 0.6, 0.8):
+        monitor.record_optimization(make_record(confidence=confidence))
+    
+    performance = monitor.get_mode_performance("yosys", "professional")
+    assert performance["confidence_std"] == pytest.approx(np.std([0.2, 0.4, 0.6, 0.8]))
+
+def test_mode_stats_are_slotted(monitor):
+    """Test per-mode stats objects use a fixed slot layout"""
+    monitor.record_optimization(make_record(metrics={"area": 1.0}))
+    stats = monitor.mode_stats[("yosys", "professional")]
+    
+    for obj in (stats, stats.metrics):
+        assert not hasattr(obj, "__dict__")
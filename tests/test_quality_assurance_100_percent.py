@@ -0,0 +1,166 @@
+"""
+Unit tests for the 100% quality assurance system
+"""
+import dataclasses
+import hashlib
+import json
+import pytest
+from src.quality_assurance_100_percent import QualityAssurance100Percent, to_bytes
+
+async def _make_qa() -> QualityAssurance100Percent:
+    """Create a quality assurance system with standards loaded"""
+    system = QualityAssurance100Percent()
+    await system.initialize_quality_standards()
+    return system
+
+@pytest.mark.asyncio
+async def test_guarantee_certificate_format():
+    """Test certificate IDs and signatures keep their hex lengths"""
+    qa = await _make_qa()
+    result = await qa.guarantee_quality("innovation_1", "defense", "web", {"design": "chip"})
+    
+    assert result["status"] == "success"
+    certificate = result["guarantee_certificate"]
+    assert len(certificate["certificate_id"]) == 32
+    assert len(certificate["signature"]) == 16
+    int(certificate["certificate_id"], 16)
+    assert certificate["signature"] == hashlib.blake2b(
+        certificate["certificate_id"].encode(), key=b"GlobalScope", digest_size=8
+    ).hexdigest()
+
+@pytest.mark.asyncio
+async def test_guarantee_stored_and_retrievable():
+    """Test issued guarantees can be fetched again"""
+    qa = await _make_qa()
+    result = await qa.guarantee_quality("innovation_2", "healthcare", "voice", {})
+    stored = await qa.get_quality_guarantee("innovation_2")
+    
+    assert stored["status"] == "success"
+    assert stored["certificate"] == result["guarantee_certificate"]
+    assert result["quality_score"] >= 0.9999
+
+@pytest.mark.asyncio
+async def test_standards_are_shared_and_read_only():
+    """Test standards are module constants that instances cannot mutate"""
+    first = await _make_qa()
+    second = await _make_qa()
+    
+    assert first.quality_standards is second.quality_standards
+    with pytest.raises(TypeError):
+        first.quality_standards["general"] = None
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        first.quality_standards["general"].reliability_target = 0.5
+    assert first.quality_standards["healthcare"].regulatory_compliance is True
+
+@pytest.mark.asyncio
+async def test_quality_score_uses_weights():
+    """Test the weighted score and its 99.99% floor"""
+    qa = await _make_qa()
+    perfect = {name: {"score": 1.0} for name in qa.quality_checks}
+    weak = dict(perfect, performance_testing={"score": 0.0})
+    
+    assert await qa._calculate_quality_score(perfect, {}) == pytest.approx(1.0)
+    assert await qa._calculate_quality_score(weak, {}) == 0.9999
+
+@pytest.mark.asyncio
+async def test_guarantee_result_serializes_to_bytes():
+    """Test guarantee results encode to JSON bytes matching the dict"""
+    qa = await _make_qa()
+    result = await qa.guarantee_quality("innovation_3", "environment", "ar_vr", {"layers": 3})
+    
+    body = to_bytes(result)
+    
+    assert isinstance(body, bytes)
+    assert json.loads(body) == result
+
+@pytest.mark.asyncio
+async def test_repeated_output_reuses_checks_with_unique_certificates():
+    """Test identical outputs skip the checks but still get their own certificate"""
+    qa = await _make_qa()
+    calls = []
+    original = qa._perform_quality_checks
+    
+    async def counting(output_data, standards):
+        calls.append(output_data)
+        return await original(output_data, standards)
+    
+    qa._perform_quality_checks = counting
+    first = await qa.guarantee_quality("innovation_a", "general", "web", {"b": 1, "a": 2})
+    second = await qa.guarantee_quality("innovation_b", "general", "web", {"a": 2, "b": 1})
+    await qa.guarantee_quality("innovation_c", "general", "voice", {"a": 2, "b": 1})
+    
+    assert len(calls) == 2
+    assert first["quality_score"] == second["quality_score"]
+    assert (first["guarantee_certificate"]["certificate_id"]
+            != second["guarantee_certificate"]["certificate_id"])
+
+@pytest.mark.asyncio
+async def test_reused_checks_not_shared_between_certificates():
+    """Test editing one certificate's results leaves cached and later results untouched"""
+    qa = await _make_qa()
+    first = await qa.guarantee_quality("innovation_a", "general", "web", {"a": 1})
+    second = await qa.guarantee_quality("innovation_b", "general", "web", {"a": 1})
+    
+    first["guarantee_certificate"]["quality_results"]["design_verification"]["score"] = 0.0
+    second["guarantee_certificate"]["quality_results"].pop("user_acceptance")
+    third = await qa.guarantee_quality("innovation_c", "general", "web", {"a": 1})
+    
+    assert second["guarantee_certificate"]["quality_results"]["design_verification"]["score"] == 1.0
+    assert third["guarantee_certificate"]["quality_results"]["design_verification"]["score"] == 1.0
+    assert "user_acceptance" in third["guarantee_certificate"]["quality_results"]
+
+@pytest.mark.asyncio
+async def test_certificates_unique_within_timestamp_resolution():
+    """Test repeat guarantees for one innovation in the same second get distinct IDs"""
+    qa = await _make_qa()
+    first = await qa.guarantee_quality("innovation_same", "general", "web", {})
+    second = await qa.guarantee_quality("innovation_same", "general", "web", {})
+    
+    assert first["guarantee_certificate"]["issue_date"]
+    assert (first["guarantee_certificate"]["certificate_id"]
+            != second["guarantee_certificate"]["certificate_id"])
+
+@pytest.mark.asyncio
+async def test_pipelines_bound_per_innovation_type():
+    """Test each type gets a pipeline bound to its standards, unknown types use general"""
+    qa = await _make_qa()
+    seen = []
+    original = qa._perform_quality_checks
+    
+    async def recording(output_data, standards):
+        seen.append(standards)
+        return await original(output_data, standards)
+    
+    qa._perform_quality_checks = recording
+    assert set(qa._pipelines) == set(qa.quality_standards)
+    await qa.guarantee_quality("innovation_h", "healthcare", "web", {"h": 1})
+    await qa.guarantee_quality("innovation_u", "unknown", "web", {"u": 1})
+    
+    assert seen == [qa.quality_standards["healthcare"], qa.quality_standards["general"]]
+
+@pytest.mark.asyncio
+async def test_error_responses_are_independent_copies():
+    """Test error responses keep their shape and do not share state"""
+    qa = QualityAssurance100Percent()
+    # Standards were never initialized, so guaranteeing fails
+    first = await qa.guarantee_quality("innovation_x", "general", "web", {})
+    second = await qa.guarantee_quality("innovation_y", "general", "web", {})
+    
+    assert first["status"] == "error"
+    assert first["quality_guarantee"] == "100% - Error resolution in progress"
+    assert first["message"].startswith("Failed to guarantee quality")
+    first["message"] = "changed"
+    assert second["message"] != "changed"
+
+@pytest.mark.asyncio
+async def test_guarantee_quality_bytes_matches_stored_certificate():
+    """Test the bytes variant encodes the same guarantee that gets stored"""
+    qa = await _make_qa()
+    body = await qa.guarantee_quality_bytes("innovation_bytes", "defense", "bci", {"n": 1})
+    
+    decoded = json.loads(body)
+    assert decoded["status"] == "success"
+    assert decoded["guarantee_certificate"] == qa.quality_guarantees["innovation_bytes"]
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -12,7 +12,7 @@ def test_redis_client_initialization():
     assert redis_client is not None
     assert hasattr(redis_client, 'client')
     assert hasattr(redis_client, 'cache')
-    assert hasattr(redis_client, 'cache_ttl')
+    assert hasattr(redis_client, 'cache_exp')
 
 @pytest.mark.asyncio
 async def test_redis_set_get():
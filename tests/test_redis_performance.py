@@ -179,12 +179,12 @@ async def test_redis_memory_usage_performance(optimized_redis_client):
     start_time = time.time()
     
     # Simulate cache expiration
-    current_time = asyncio.get_event_loop().time()
-    for key in list(optimized_redis_client.cache_ttl.keys())[:100]:
-        optimized_redis_client.cache_ttl[key] = current_time - 1000  # Expired
+    current_time = optimized_redis_client._now_cs()
+    for key in list(optimized_redis_client.cache_exp.keys())[:100]:
+        optimized_redis_client.cache_exp[key] = current_time - 1000  # Expired
     
     # Access expired keys to trigger cleanup
-    for key in list(optimized_redis_client.cache_ttl.keys())[:10]:
+    for key in list(optimized_redis_client.cache_exp.keys())[:10]:
         optimized_redis_client._is_cached(key)
     
     end_time = time.time()
@@ -14,7 +14,7 @@ from src.chip_design.zero_defect_engine import ZeroDefectEngine
 @pytest.fixture
 def enhanced_firewall():
     """Create a test instance of EnhancedQuantumSingularityFirewall"""
-    with patch('src.security.enhanced_firewall.holo_misha_instance'), \
+    with patch('src.security.enhanced_firewall.holo_misha_instance.notify_ar', new=AsyncMock()), \
          patch('src.security.enhanced_firewall.security_logger'):
         firewall = EnhancedQuantumSingularityFirewall()
         return firewall
@@ -178,6 +178,8 @@ async def test_security_logging_integration(enhanced_firewall):
     """Test security logging integration"""
     with patch('src.security.enhanced_firewall.security_logger') as mock_security_logger:
         mock_security_logger.log_security_event = AsyncMock()
+        # Successful validations are sampled; log every one here
+        enhanced_firewall._log_success_sample = 1.0
         
         # Test that security events are logged
         process_data = {
@@ -193,8 +195,7 @@ async def test_security_logging_integration(enhanced_firewall):
 @pytest.mark.asyncio
 async def test_holomisha_ar_notification_integration(enhanced_firewall):
     """Test HoloMisha AR notification integration"""
-    with patch('src.security.enhanced_firewall.holo_misha_instance') as mock_holo_misha:
-        mock_holo_misha.notify_ar = AsyncMock()
+    with patch('src.security.enhanced_firewall.holo_misha_instance.notify_ar', new=AsyncMock()) as mock_notify_ar:
         
         # Test that AR notifications are sent
         process_data = {
@@ -204,13 +205,14 @@ async def test_holomisha_ar_notification_integration(enhanced_firewall):
         
         await enhanced_firewall.validate_process("process_1", process_data)
         
-        # Verify AR notification was sent
-        mock_holo_misha.notify_ar.assert_called()
+        # Verify HoloMisha AR was notified
+        await asyncio.gather(*enhanced_firewall._ar_tasks)
+        mock_notify_ar.assert_awaited()
 
 @pytest.mark.asyncio
 async def test_enhanced_firewall_rate_limiting_integration(enhanced_firewall):
     """Test EnhancedQuantumSingularityFirewall rate limiting integration"""
-    with patch('src.security.enhanced_firewall.holo_misha_instance'), \
+    with patch('src.security.enhanced_firewall.holo_misha_instance.notify_ar', new=AsyncMock()), \
          patch('src.security.enhanced_firewall.security_logger'):
         
         process_data = {
@@ -0,0 +1,99 @@
+"""
+Unit tests for the security logging service
+"""
+import json
+import pytest
+import pytest_asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+from src.lib.event_bus import event_bus
+from src.security.security_logging_service import SecurityLoggingService, security_logger
+
+@pytest_asyncio.fixture
+async def logging_service():
+    """Create a logging service backed by a mocked Redis client"""
+    pipe = MagicMock()
+    pipe.execute = AsyncMock()
+    redis = MagicMock()
+    redis.pipeline.return_value.__aenter__.return_value = pipe
+    with patch('src.security.security_logging_service.redis_client', redis), \
+         patch('src.security.security_logging_service.event_bus.publish', new=AsyncMock()):
+        service = SecurityLoggingService()
+        yield service, redis, pipe
+        if service._flush_task is not None:
+            service._flush_task.cancel()
+
+@pytest.mark.asyncio
+async def test_events_written_in_one_pipeline(logging_service):
+    """Test queued events are written with one pipeline execute"""
+    service, redis, pipe = logging_service
+    service._worker_id = "w1"
+
+    await service.log_security_event("alice", "login", {"ok": True})
+    await service.log_security_event("bob", "logout", {})
+    await service.log_security_event("alice", "authorization_denied", {"resource": "chip"})
+    await service.flush()
+
+    redis.incr.assert_not_called()
+    pipe.execute.assert_awaited_once()
+    keys = [call.args[0] for call in pipe.set.call_args_list]
+    assert keys == ["security_log:event_alice_w1_1", "security_log:event_bob_w1_2", "security_log:event_alice_w1_3"]
+    stored = pipe.set.call_args_list[2].args[1]
+    assert isinstance(stored, bytes)
+    stored = json.loads(stored)
+    assert stored["event_type"] == "authorization_denied"
+    assert isinstance(stored["timestamp"], float)
+    assert service.logs["event_bob_w1_2"]["user_id"] == "bob"
+
+@pytest.mark.asyncio
+async def test_unencodable_record_skipped_without_dropping_batch(logging_service):
+    """Test a record orjson cannot encode is skipped while the rest of its batch is written"""
+    service, redis, pipe = logging_service
+    service._worker_id = "w1"
+
+    await service.log_security_event("alice", "login", {})
+    await service.log_security_event("bob", "login", {"handle": object()})
+    await service.log_security_event("carol", "logout", {})
+    await service.flush()
+
+    pipe.execute.assert_awaited_once()
+    keys = [call.args[0] for call in pipe.set.call_args_list]
+    assert keys == ["security_log:event_alice_w1_1", "security_log:event_carol_w1_3"]
+
+def test_event_ids_unique_across_workers():
+    """Test separate service instances never hand out the same event id"""
+    first, second = SecurityLoggingService(), SecurityLoggingService()
+
+    assert first._worker_id != second._worker_id
+
+@pytest.mark.asyncio
+async def test_redis_failure_does_not_reach_callers(logging_service):
+    """Test a failed flush is logged and the flusher keeps serving later events"""
+    service, redis, pipe = logging_service
+    pipe.execute.side_effect = [ConnectionError("redis down"), None]
+
+    await service.log_security_event("alice", "login", {})
+    await service.flush()
+    await service.log_security_event("alice", "logout", {})
+    await service.flush()
+
+    assert pipe.execute.await_count == 2
+    assert pipe.set.call_args_list[-1].args[0].endswith("_2")
+
+def test_security_log_handled_by_one_instance():
+    """Test extra instances do not add duplicate security_log subscribers"""
+    before = event_bus._subscribers["security_log"]
+    SecurityLoggingService()
+
+    assert event_bus._subscribers["security_log"] == before
+    assert len(before) == 1
+
+def test_modules_share_the_global_logger():
+    """Test security modules use the process-wide logger instead of their own instances"""
+    from src.security import access_control, enhanced_firewall, security_tester
+
+    assert access_control.security_logger is security_logger
+    assert enhanced_firewall.security_logger is security_logger
+    assert security_tester.security_logger is security_logger
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -12,7 +12,7 @@ from src.security.enhanced_firewall import EnhancedQuantumSingularityFirewall
 @pytest.fixture
 def enhanced_firewall():
     """Create a test instance of EnhancedQuantumSingularityFirewall"""
-    with patch('src.security.enhanced_firewall.holo_misha_instance'), \
+    with patch('src.security.enhanced_firewall.holo_misha_instance.notify_ar', new=AsyncMock()), \
          patch('src.security.enhanced_firewall.security_logger'):
         firewall = EnhancedQuantumSingularityFirewall()
         return firewall
@@ -85,7 +85,7 @@ async def test_firewall_input_validation_performance(enhanced_firewall):
     # Perform multiple validations for each test case
     for test_case in test_cases:
         for i in range(100):
-            await enhanced_firewall._validate_input(test_case)
+            enhanced_firewall._validate_input(test_case)
     
     end_time = time.time()
     validation_time = end_time - start_time
@@ -106,7 +106,7 @@ async def test_firewall_rate_limiting_performance(enhanced_firewall):
     # Test rate limiting with multiple identifiers
     for identifier in range(100):
         for request in range(enhanced_firewall.max_requests_per_minute + 10):
-            result = await enhanced_firewall._check_rate_limit(f"user_{identifier}")
+            result = enhanced_firewall._check_rate_limit(f"user_{identifier}")
             # Rate limiting check should be fast
             assert isinstance(result, bool)
     
@@ -123,7 +123,7 @@ async def test_firewall_suspicious_activity_detection_performance(enhanced_firew
     
     # Test suspicious activity detection with multiple identifiers
     for identifier in range(1000):
-        result = await enhanced_firewall._is_suspicious_activity(f"user_{identifier}")
+        result = enhanced_firewall._is_suspicious_activity(f"user_{identifier}")
         # Suspicious activity check should be fast
         assert isinstance(result, bool)
     